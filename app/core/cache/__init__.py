@@ -0,0 +1,115 @@
+# app/core/cache/__init__.py
+"""
+Cache compartido e invalidación entre workers, seleccionados con CACHE_BACKEND:
+
+- "memory": cache por proceso, invalidación solo local (un worker).
+- "redis":  cache en Redis + pub/sub (CACHE_REDIS_URL). Requiere el paquete `redis`.
+- "file":   cache y log de invalidación en CACHE_FILE_DIR (mismo host, p. ej. /dev/shm).
+"""
+import os
+from typing import Optional
+
+from app.core.cache.backends import (
+    CacheBackend,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from app.core.cache.invalidation import (
+    FileInvalidationBus,
+    InvalidationBus,
+    RedisInvalidationBus,
+    dispatch,
+    subscribe,
+    unsubscribe,
+)
+from app.core.settings import get_settings
+
+_backend: Optional[CacheBackend] = None
+_bus: Optional[InvalidationBus] = None
+_redis = None
+
+
+def get_redis_client():
+    """Cliente redis.asyncio compartido (CACHE_REDIS_URL). Requiere el paquete `redis`."""
+    global _redis
+    if _redis is None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("Redis requiere el paquete 'redis' (poetry install -E redis)")
+        _redis = redis_asyncio.from_url(get_settings().CACHE_REDIS_URL)
+    return _redis
+
+
+def _build() -> None:
+    global _backend, _bus
+    settings = get_settings()
+    kind = settings.CACHE_BACKEND.lower()
+    if kind == "memory":
+        _backend, _bus = MemoryCacheBackend(), InvalidationBus()
+    elif kind == "redis":
+        client = get_redis_client()
+        _backend, _bus = RedisCacheBackend(client), RedisInvalidationBus(client)
+    elif kind == "file":
+        _backend = FileCacheBackend(os.path.join(settings.CACHE_FILE_DIR, "data"))
+        _bus = FileInvalidationBus(
+            os.path.join(settings.CACHE_FILE_DIR, "invalidation.log"),
+            poll_interval=settings.CACHE_INVALIDATION_POLL_SECONDS,
+        )
+    else:
+        raise ValueError(f"CACHE_BACKEND no soportado: {settings.CACHE_BACKEND}")
+
+
+def get_cache_backend() -> CacheBackend:
+    if _backend is None:
+        _build()
+    return _backend
+
+
+def get_invalidation_bus() -> InvalidationBus:
+    if _bus is None:
+        _build()
+    return _bus
+
+
+def configure_cache_backend(backend: CacheBackend, bus: InvalidationBus) -> None:
+    """Reemplaza backend y bus (tests o stand-ins como fakeredis)."""
+    global _backend, _bus
+    _backend, _bus = backend, bus
+
+
+async def start_cache() -> None:
+    """Arranca la escucha de invalidaciones de otros workers (lifespan)."""
+    await get_invalidation_bus().start()
+
+
+async def stop_cache() -> None:
+    global _backend, _bus, _redis
+    if _bus is not None:
+        await _bus.stop()
+    if _backend is not None:
+        await _backend.close()
+    if _redis is not None:
+        await _redis.aclose()
+    _backend, _bus, _redis = None, None, None
+
+
+__all__ = [
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "FileCacheBackend",
+    "InvalidationBus",
+    "RedisInvalidationBus",
+    "FileInvalidationBus",
+    "subscribe",
+    "unsubscribe",
+    "dispatch",
+    "get_redis_client",
+    "get_cache_backend",
+    "get_invalidation_bus",
+    "configure_cache_backend",
+    "start_cache",
+    "stop_cache",
+]
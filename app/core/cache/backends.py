@@ -0,0 +1,184 @@
+# app/core/cache/backends.py
+"""
+Backends de cache (clave/valor con TTL y namespaces).
+
+- memory: aiocache SimpleMemoryCache, por proceso (cada worker tiene su propio cache).
+- redis:  compartido entre workers/hosts. Acepta cualquier cliente compatible con
+          `redis.asyncio.Redis` (en tests, fakeredis.aioredis.FakeRedis).
+- file:   compartido entre workers del mismo host; un archivo por clave en un
+          directorio (p. ej. /dev/shm). Pensado para tests y despliegues de un solo host.
+"""
+import asyncio
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from aiocache import caches
+
+
+class CacheBackend(ABC):
+    # True si el almacenamiento es visible para todos los workers
+    shared: bool = False
+
+    @abstractmethod
+    async def get(self, key: str, namespace: str = "") -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, namespace: str = "") -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str, namespace: str = "") -> None:
+        ...
+
+    @abstractmethod
+    async def clear(self, namespace: str) -> None:
+        """Elimina todas las claves del namespace."""
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Cache en memoria del proceso (alias `default` de aiocache)."""
+
+    shared = False
+
+    def __init__(self, alias: str = "default"):
+        self._cache = caches.get(alias)
+
+    async def get(self, key: str, namespace: str = "") -> Optional[Any]:
+        return await self._cache.get(key, namespace=namespace)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, namespace: str = "") -> None:
+        await self._cache.set(key, value, ttl=ttl, namespace=namespace)
+
+    async def delete(self, key: str, namespace: str = "") -> None:
+        await self._cache.delete(key, namespace=namespace)
+
+    async def clear(self, namespace: str) -> None:
+        await self._cache.clear(namespace=namespace)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache compartido en Redis. Los valores se serializan con pickle."""
+
+    shared = True
+
+    def __init__(self, client, prefix: str = "brasper:cache:"):
+        self._client = client
+        self._prefix = prefix
+
+    def _key(self, key: str, namespace: str) -> str:
+        return f"{self._prefix}{namespace}{key}"
+
+    async def get(self, key: str, namespace: str = "") -> Optional[Any]:
+        raw = await self._client.get(self._key(key, namespace))
+        if raw is None:
+            return None
+        return pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, namespace: str = "") -> None:
+        await self._client.set(self._key(key, namespace), pickle.dumps(value), ex=ttl or None)
+
+    async def delete(self, key: str, namespace: str = "") -> None:
+        await self._client.delete(self._key(key, namespace))
+
+    async def clear(self, namespace: str) -> None:
+        pattern = f"{self._prefix}{namespace}*"
+        batch = []
+        async for k in self._client.scan_iter(match=pattern, count=500):
+            batch.append(k)
+            if len(batch) >= 500:
+                await self._client.delete(*batch)
+                batch = []
+        if batch:
+            await self._client.delete(*batch)
+
+
+class FileCacheBackend(CacheBackend):
+    """Cache compartido en disco: <directory>/<sha(namespace)>/<sha(key)>.
+
+    Escrituras atómicas (archivo temporal + os.replace), de modo que un lector nunca
+    ve un valor a medias. `clear` renombra el directorio del namespace antes de borrarlo.
+    """
+
+    shared = True
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _ns_dir(self, namespace: str) -> str:
+        return os.path.join(self.directory, self._digest(namespace))
+
+    def _path(self, key: str, namespace: str) -> str:
+        return os.path.join(self._ns_dir(namespace), self._digest(key))
+
+    def _read(self, path: str) -> Optional[Any]:
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if expires_at is not None and time.time() > expires_at:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        return value
+
+    def _write(self, path: str, value: Any, ttl: Optional[int]) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        expires_at = time.time() + ttl if ttl else None
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires_at, value), f)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _clear(self, namespace: str) -> None:
+        ns_dir = self._ns_dir(namespace)
+        trash = f"{ns_dir}.{uuid.uuid4().hex}.del"
+        try:
+            os.rename(ns_dir, trash)
+        except FileNotFoundError:
+            return
+        shutil.rmtree(trash, ignore_errors=True)
+
+    async def get(self, key: str, namespace: str = "") -> Optional[Any]:
+        return await asyncio.to_thread(self._read, self._path(key, namespace))
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, namespace: str = "") -> None:
+        await asyncio.to_thread(self._write, self._path(key, namespace), value, ttl)
+
+    async def delete(self, key: str, namespace: str = "") -> None:
+        await asyncio.to_thread(self._remove, self._path(key, namespace))
+
+    async def clear(self, namespace: str) -> None:
+        await asyncio.to_thread(self._clear, namespace)
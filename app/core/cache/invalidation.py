@@ -0,0 +1,239 @@
+# app/core/cache/invalidation.py
+"""
+Canal de invalidación entre procesos.
+
+Los módulos registran handlers por canal (`subscribe`) y publican con
+`InvalidationBus.publish(channel, payload)`. El mensaje se entrega de inmediato en el
+proceso que publica y, según el bus, al resto de workers:
+
+- local: solo el proceso actual (un único worker).
+- redis: pub/sub de Redis.
+- file:  log de mensajes (JSON por línea) en un archivo compartido, leído por polling.
+
+payload None significa "invalidar todo lo del canal" (p. ej. tras perder mensajes).
+"""
+import asyncio
+import fcntl
+import inspect
+import json
+import logging
+import os
+import uuid
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Optional[str]], Union[None, Awaitable[None]]]
+
+_handlers: Dict[str, List[Handler]] = defaultdict(list)
+
+
+def subscribe(channel: str, handler: Handler) -> None:
+    """Registra un handler para los mensajes de un canal (en este proceso)."""
+    if handler not in _handlers[channel]:
+        _handlers[channel].append(handler)
+
+
+def unsubscribe(channel: str, handler: Handler) -> None:
+    if handler in _handlers.get(channel, []):
+        _handlers[channel].remove(handler)
+
+
+async def dispatch(channel: str, payload: Optional[str]) -> None:
+    """Entrega un mensaje a los handlers locales. Un handler que falla no bloquea al resto."""
+    for handler in list(_handlers.get(channel, ())):
+        try:
+            result = handler(payload)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error en handler de invalidación '{channel}': {str(e)}")
+
+
+async def dispatch_all() -> None:
+    """Invalida todos los canales (usado cuando un bus pudo perder mensajes)."""
+    for channel in list(_handlers):
+        await dispatch(channel, None)
+
+
+class InvalidationBus:
+    """Bus local (un solo proceso). Base de los buses entre procesos."""
+
+    def __init__(self):
+        # Identificador del proceso para ignorar los mensajes propios al recibirlos
+        self.origin = uuid.uuid4().hex
+
+    async def publish(self, channel: str, payload: Optional[str] = None) -> None:
+        await dispatch(channel, payload)
+        try:
+            await self._broadcast(channel, payload)
+        except Exception as e:
+            logger.error(f"Error publicando invalidación '{channel}': {str(e)}")
+
+    async def _broadcast(self, channel: str, payload: Optional[str]) -> None:
+        pass
+
+    def _encode(self, channel: str, payload: Optional[str]) -> str:
+        return json.dumps({"o": self.origin, "c": channel, "p": payload}, separators=(",", ":"))
+
+    async def _receive(self, raw: Union[str, bytes]) -> None:
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            return
+        if message.get("o") == self.origin:
+            return
+        await dispatch(message.get("c"), message.get("p"))
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """Difunde invalidaciones por pub/sub de Redis."""
+
+    def __init__(self, client, channel: str = "brasper:invalidation"):
+        super().__init__()
+        self._client = client
+        self._channel = channel
+        self._task: Optional[asyncio.Task] = None
+
+    async def _broadcast(self, channel: str, payload: Optional[str]) -> None:
+        await self._client.publish(self._channel, self._encode(channel, payload))
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        reconnecting = False
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                if reconnecting:
+                    # Mientras no hubo suscripción pudimos perder mensajes
+                    await dispatch_all()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._receive(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Conexión de invalidación Redis perdida: {str(e)}")
+                reconnecting = True
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class FileInvalidationBus(InvalidationBus):
+    """Difunde invalidaciones mediante un log compartido en disco (mismo host).
+
+    Cada worker lee las líneas nuevas cada `poll_interval` segundos. Cuando el log
+    supera `max_bytes` se reemplaza por uno vacío; los lectores lo detectan por el
+    cambio de inode e invalidan todo, ya que pudieron perder mensajes.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.5, max_bytes: int = 1_048_576):
+        super().__init__()
+        self.path = path
+        self.poll_interval = poll_interval
+        self.max_bytes = max_bytes
+        self._lock_path = f"{path}.lock"
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._task: Optional[asyncio.Task] = None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def _append(self, line: str) -> None:
+        with open(self._lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                try:
+                    if os.path.getsize(self.path) > self.max_bytes:
+                        tmp_path = f"{self.path}.{self.origin}.new"
+                        open(tmp_path, "w").close()
+                        os.replace(tmp_path, self.path)
+                except FileNotFoundError:
+                    pass
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_new(self) -> List[Optional[str]]:
+        """Líneas nuevas desde la última lectura; None en la lista = log reemplazado."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        lines: List[Optional[str]] = []
+        if self._inode is not None and stat.st_ino != self._inode:
+            lines.append(None)
+            self._offset = 0
+        self._inode = stat.st_ino
+        if stat.st_size <= self._offset:
+            return lines
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        # Solo líneas completas; una escritura en curso se lee en la siguiente vuelta
+        complete, sep, _ = chunk.rpartition(b"\n")
+        if sep:
+            self._offset += len(complete) + 1
+            lines.extend(line.decode("utf-8") for line in complete.split(b"\n"))
+        return lines
+
+    async def _broadcast(self, channel: str, payload: Optional[str]) -> None:
+        await asyncio.to_thread(self._append, self._encode(channel, payload))
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        # Empezar desde el final: lo anterior al arranque no aplica a este proceso
+        try:
+            stat = os.stat(self.path)
+            self._inode, self._offset = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            self._inode, self._offset = None, 0
+        self._task = asyncio.create_task(self._poll())
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                for line in await asyncio.to_thread(self._read_new):
+                    if line is None:
+                        await dispatch_all()
+                    elif line:
+                        await self._receive(line)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error leyendo log de invalidación: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
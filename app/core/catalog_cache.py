@@ -0,0 +1,125 @@
+# app/core/catalog_cache.py
+"""
+Cache de respuestas de catálogos (tasas, comisiones, monedas, bancos).
+
+Read-through sobre el backend de cache configurado (app.core.cache): la respuesta se
+guarda ya serializada junto con su ETag, de modo que una lectura repetida no toca la BD
+ni vuelve a serializar. Los casos de uso de escritura invalidan el namespace tras el
+commit y la invalidación se difunde al resto de workers por el canal "catalog".
+Con `If-None-Match` se responde 304 sin cuerpo.
+"""
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import get_cache_backend, get_invalidation_bus, subscribe
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+CATALOG_CHANNEL = "catalog"
+
+
+class CatalogNamespace:
+    """Namespaces del cache. Terminan en ':' para que ninguno sea prefijo de otro."""
+    tax_rates = "catalog:tax_rate:"
+    tax_rate_trials = "catalog:tax_rate_trial:"
+    commissions = "catalog:commission:"
+    currencies = "catalog:currencies:"
+    banks = "catalog:banks:"
+
+
+# (cuerpo JSON serializado, ETag)
+CachedBody = Tuple[bytes, str]
+
+# Generación por namespace: evita guardar un resultado leído antes de una invalidación
+_generations: Dict[str, int] = defaultdict(int)
+
+
+def _make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return any(c == etag or c == f"W/{etag}" for c in candidates)
+
+
+async def get_or_load(
+    namespace: str,
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+) -> CachedBody:
+    """Devuelve (cuerpo, etag) desde cache o ejecuta `loader` y lo guarda."""
+    cache = get_cache_backend()
+    try:
+        cached = await cache.get(key, namespace=namespace)
+    except Exception as e:
+        logger.warning(f"Error leyendo cache {namespace}{key}: {str(e)}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    generation = _generations[namespace]
+    data = await loader()
+    body = json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    entry = (body, _make_etag(body))
+
+    if generation == _generations[namespace]:
+        try:
+            await cache.set(key, entry, ttl=get_settings().CATALOG_CACHE_TTL_SECONDS, namespace=namespace)
+        except Exception as e:
+            logger.warning(f"Error escribiendo cache {namespace}{key}: {str(e)}")
+    return entry
+
+
+async def _on_catalog_invalidated(namespace: Optional[str]) -> None:
+    namespaces = [namespace] if namespace else list(_generations)
+    cache = get_cache_backend()
+    for ns in namespaces:
+        _generations[ns] += 1
+        if not cache.shared:
+            try:
+                await cache.clear(ns)
+            except Exception as e:
+                logger.warning(f"Error invalidando cache {ns}: {str(e)}")
+
+
+subscribe(CATALOG_CHANNEL, _on_catalog_invalidated)
+
+
+async def invalidate_catalog(*namespaces: str) -> None:
+    """Descarta las respuestas cacheadas de los namespaces en todos los workers
+    (llamar tras el commit)."""
+    cache = get_cache_backend()
+    for namespace in namespaces:
+        await get_invalidation_bus().publish(CATALOG_CHANNEL, namespace)
+        if cache.shared:
+            try:
+                await cache.clear(namespace)
+            except Exception as e:
+                logger.warning(f"Error invalidando cache {namespace}: {str(e)}")
+
+
+async def catalog_response(
+    request: Request,
+    namespace: str,
+    loader: Callable[[], Awaitable[Any]],
+    key: str = "list",
+) -> Response:
+    """Respuesta JSON cacheada con ETag; 304 si el cliente ya tiene la versión actual."""
+    body, etag = await get_or_load(namespace, key, loader)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
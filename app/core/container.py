@@ -4,6 +4,7 @@ from app.core.containers import (
     get_security_utils,
     get_auth_repository,
     get_user_repository,
+    require_admin,
     get_user_by_id_uc,
     get_user_by_email_uc,
     get_user_by_auth_id_uc,
@@ -15,6 +16,7 @@ from app.core.containers import (
     delete_user_uc,
     get_login_uc,
     get_auth_service,
+    get_password_hash_report_uc,
     get_unit_of_work,
     get_tax_rate_repository,
     get_commission_repository,
@@ -34,6 +36,7 @@ __all__ = [
     "get_security_utils",
     "get_auth_repository",
     "get_user_repository",
+    "require_admin",
     "get_user_by_id_uc",
     "get_user_by_email_uc",
     "get_user_by_auth_id_uc",
@@ -45,6 +48,7 @@ __all__ = [
     "delete_user_uc",
     "get_login_uc",
     "get_auth_service",
+    "get_password_hash_report_uc",
     "get_unit_of_work",
     "get_tax_rate_repository",
     "get_commission_repository",
@@ -1,10 +1,16 @@
 # app/core/containers
 # Inyección de dependencias por módulo: common, auth, users, coin.
 from app.core.containers.common import get_security_utils
-from app.core.containers.auth import get_auth_repository, get_login_uc, get_auth_service
+from app.core.containers.auth import (
+    get_auth_repository,
+    get_login_uc,
+    get_auth_service,
+    get_password_hash_report_uc,
+)
 from app.core.containers.unit_of_work import get_unit_of_work
 from app.core.containers.users import (
     get_user_repository,
+    require_admin,
     get_user_by_id_uc,
     get_user_by_email_uc,
     get_user_by_auth_id_uc,
@@ -35,8 +41,10 @@ __all__ = [
     "get_auth_repository",
     "get_login_uc",
     "get_auth_service",
+    "get_password_hash_report_uc",
     "get_unit_of_work",
     "get_user_repository",
+    "require_admin",
     "get_user_by_id_uc",
     "get_user_by_email_uc",
     "get_user_by_auth_id_uc",
@@ -7,7 +7,7 @@ from app.db.base import get_db
 from app.modules.auth.interfaces.auth_repository import AuthRepositoryInterface
 from app.modules.auth.infrastructure.repository import SQLAlchemyAuthRepository
 from app.modules.auth.application.auth_service import AuthService
-from app.modules.auth.application.use_cases import LoginUseCase
+from app.modules.auth.application.use_cases import LoginUseCase, PasswordHashReportUseCase
 from app.core.containers.common import get_security_utils
 from app.core.containers.unit_of_work import get_unit_of_work
 from app.modules.users.infrastructure.unit_of_work import AsyncUserAuthUnitOfWork
@@ -34,3 +34,11 @@ def get_auth_service(
 ) -> AuthService:
     """Servicio de auth para change_password, reset (usa Unit of Work)."""
     return AuthService(uow, security_utils)
+
+
+def get_password_hash_report_uc(
+    auth_repo: AuthRepositoryInterface = Depends(get_auth_repository),
+    security_utils=Depends(get_security_utils),
+) -> PasswordHashReportUseCase:
+    """Reporte de hashes de contraseña por esquema (solo admin, ver require_admin)."""
+    return PasswordHashReportUseCase(auth_repo, security_utils)
@@ -3,7 +3,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db
 from app.modules.coin.interfaces.tax_rate_repository import TaxRateRepositoryInterface
 from app.modules.coin.interfaces.commission_repository import CommissionRepositoryInterface
 from app.modules.coin.infrastructure.repository import (
@@ -38,11 +38,11 @@ def get_commission_repository(
 
 # --- TaxRate use cases ---
 
-def get_tax_rate_by_id_uc(db: AsyncSession = Depends(get_db)) -> GetTaxRateByIdUseCase:
+def get_tax_rate_by_id_uc(db: AsyncSession = Depends(get_read_db)) -> GetTaxRateByIdUseCase:
     return GetTaxRateByIdUseCase(get_tax_rate_repository(db))
 
 
-def list_tax_rates_uc(db: AsyncSession = Depends(get_db)) -> ListTaxRatesUseCase:
+def list_tax_rates_uc(db: AsyncSession = Depends(get_read_db)) -> ListTaxRatesUseCase:
     return ListTaxRatesUseCase(get_tax_rate_repository(db))
 
 
@@ -60,11 +60,11 @@ def delete_tax_rate_uc(db: AsyncSession = Depends(get_db)) -> DeleteTaxRateUseCa
 
 # --- Commission use cases ---
 
-def get_commission_by_id_uc(db: AsyncSession = Depends(get_db)) -> GetCommissionByIdUseCase:
+def get_commission_by_id_uc(db: AsyncSession = Depends(get_read_db)) -> GetCommissionByIdUseCase:
     return GetCommissionByIdUseCase(get_commission_repository(db))
 
 
-def list_commissions_uc(db: AsyncSession = Depends(get_db)) -> ListCommissionsUseCase:
+def list_commissions_uc(db: AsyncSession = Depends(get_read_db)) -> ListCommissionsUseCase:
     return ListCommissionsUseCase(get_commission_repository(db))
 
 
@@ -1,9 +1,13 @@
 # app/core/containers/users.py
 """Inyección de dependencias del módulo users: repositorio y casos de uso."""
-from fastapi import Depends
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db
+from app.modules.auth.infrastructure.dependencies import require_auth
+from app.modules.users.domain.enums import UserRole
 from app.modules.users.interfaces.user_repository import UserRepositoryInterface
 from app.modules.users.infrastructure.repository import SQLAlchemyUserRepository
 from app.modules.users.infrastructure.unit_of_work import AsyncUserAuthUnitOfWork
@@ -30,29 +34,40 @@ def get_user_repository(
     return SQLAlchemyUserRepository(db)
 
 
-# --- Casos de uso solo lectura (usan repo) ---
+async def require_admin(
+    current_user: dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Usuario autenticado con rol admin (403 si no lo es)."""
+    user = await get_user_repository(db).get(UUID(current_user["user_id"]))
+    if not user or user.role != UserRole.admin.value:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Requiere rol admin")
+    return current_user
+
+
+# --- Casos de uso solo lectura (usan repo sobre réplica, ver get_read_db) ---
 
-def get_user_by_id_uc(db: AsyncSession = Depends(get_db)) -> GetUserByIdUseCase:
+def get_user_by_id_uc(db: AsyncSession = Depends(get_read_db)) -> GetUserByIdUseCase:
     return GetUserByIdUseCase(get_user_repository(db))
 
 
-def get_user_by_email_uc(db: AsyncSession = Depends(get_db)) -> GetUserByEmailUseCase:
+def get_user_by_email_uc(db: AsyncSession = Depends(get_read_db)) -> GetUserByEmailUseCase:
     return GetUserByEmailUseCase(get_user_repository(db))
 
 
-def get_user_by_auth_id_uc(db: AsyncSession = Depends(get_db)) -> GetUserByAuthIdUseCase:
+def get_user_by_auth_id_uc(db: AsyncSession = Depends(get_read_db)) -> GetUserByAuthIdUseCase:
     return GetUserByAuthIdUseCase(get_user_repository(db))
 
 
-def list_user_name_uc(db: AsyncSession = Depends(get_db)) -> ListUserNameUseCase:
+def list_user_name_uc(db: AsyncSession = Depends(get_read_db)) -> ListUserNameUseCase:
     return ListUserNameUseCase(get_user_repository(db))
 
 
-def list_users_uc(db: AsyncSession = Depends(get_db)) -> ListUserUseCase:
+def list_users_uc(db: AsyncSession = Depends(get_read_db)) -> ListUserUseCase:
     return ListUserUseCase(get_user_repository(db))
 
 
-def list_users_with_details_uc(db: AsyncSession = Depends(get_db)) -> ListUsersWithDetailsUseCase:
+def list_users_with_details_uc(db: AsyncSession = Depends(get_read_db)) -> ListUsersWithDetailsUseCase:
     return ListUsersWithDetailsUseCase(get_user_repository(db))
 
 
@@ -0,0 +1,134 @@
+# app/core/hashing_pool.py
+"""
+Pool acotado para hashing/verificación de contraseñas (Argon2, bcrypt, PBKDF2).
+
+Argon2 con memory_cost=64MB tarda decenas de ms por llamada; ejecutado en el event loop
+bloquea todas las requests del worker. Aquí corre en un ThreadPoolExecutor dedicado
+(argon2-cffi, bcrypt y hashlib liberan el GIL durante el cálculo). `max_workers` limita
+CPU y memoria (~64MB por hash en curso) y `max_pending` limita la cola: si está llena se
+rechaza de inmediato con PasswordHashingBusyError (→ 503) en lugar de encolar sin límite.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, TypeVar
+
+from app.core.metrics import REGISTRY, MetricFamily
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(RuntimeError):
+    """La cola del pool de hashing está llena."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Servicio de autenticación ocupado, reintente en unos segundos")
+        self.retry_after = retry_after
+
+
+class PasswordHashingPool:
+    def __init__(self, max_workers: int = 2, max_pending: int = 32):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pwd-hash")
+        self._pending = 0  # en cola + en ejecución
+        # Métricas
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_pending_seen = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Ejecuta fn(*args) en el pool. Lanza PasswordHashingBusyError si la cola está llena."""
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"Pool de hashing lleno ({self._pending} pendientes), request rechazada")
+            raise PasswordHashingBusyError()
+
+        self._pending += 1
+        self.submitted += 1
+        self.max_pending_seen = max(self.max_pending_seen, self._pending)
+        enqueued_at = time.perf_counter()
+
+        timings = [enqueued_at, enqueued_at]
+
+        def timed():
+            timings[0] = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                timings[1] = time.perf_counter()
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self._pending -= 1
+            # Acumular en el hilo del event loop (sin carreras con los workers)
+            self.total_wait_seconds += timings[0] - enqueued_at
+            self.total_run_seconds += timings[1] - timings[0]
+
+    def stats(self) -> dict:
+        finished = self.completed + self.failed
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "max_pending_seen": self.max_pending_seen,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_seconds / finished * 1000, 2) if finished else 0.0,
+            "avg_run_ms": round(self.total_run_seconds / finished * 1000, 2) if finished else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+_pool: Optional[PasswordHashingPool] = None
+
+
+def get_password_hashing_pool() -> PasswordHashingPool:
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = PasswordHashingPool(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+        )
+    return _pool
+
+
+def shutdown_password_hashing_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def _collect() -> Iterable[MetricFamily]:
+    if _pool is None:
+        return
+    stats = _pool.stats()
+    yield MetricFamily("password_hash_pending", "gauge", "Hashes de contraseña en cola o en ejecución").add(stats["pending"])
+    yield MetricFamily("password_hash_completed_total", "counter", "Hashes/verificaciones completadas").add(stats["completed"])
+    yield MetricFamily("password_hash_failed_total", "counter", "Hashes/verificaciones con error").add(stats["failed"])
+    yield MetricFamily("password_hash_rejected_total", "counter", "Rechazados por cola llena (503)").add(stats["rejected"])
+    yield MetricFamily("password_hash_wait_seconds_total", "counter", "Tiempo total en cola").add(_pool.total_wait_seconds)
+    yield MetricFamily("password_hash_run_seconds_total", "counter", "Tiempo total de cálculo").add(_pool.total_run_seconds)
+
+
+REGISTRY.register_collector(_collect)
@@ -0,0 +1,63 @@
+# app/core/pagination/cursor.py
+"""
+Paginación por cursor (keyset) sobre (created_at, id).
+
+El cursor es opaco para el cliente: base64url de la última fila devuelta. La página
+siguiente se obtiene con `(created_at, id) < (cursor.created_at, cursor.id)`, que usa
+el índice (created_at DESC, id DESC) y no depende de la profundidad de la página.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CursorParams(BaseModel):
+    cursor: Optional[str] = None
+    limit: int = 20
+    include_total: bool = False  # el COUNT(*) es opcional: en tablas grandes domina la latencia
+
+    def validate_limit(self, max_limit: int = 100):
+        if self.limit > max_limit:
+            self.limit = max_limit
+        if self.limit < 1:
+            self.limit = 1
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    limit: int
+    has_next: bool
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+    def map_items(self, fn: Callable[[Any], Any]) -> "CursorPage":
+        """Misma página con los items transformados (ej. entidad -> DTO)."""
+        return CursorPage(
+            items=[fn(x) for x in self.items],
+            limit=self.limit,
+            has_next=self.has_next,
+            next_cursor=self.next_cursor,
+            total=self.total,
+        )
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Codifica la posición (created_at, id) como cursor opaco."""
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decodifica un cursor. Lanza ValueError si no es válido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except Exception:
+        raise ValueError("Cursor de paginación inválido")
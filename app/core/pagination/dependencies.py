@@ -0,0 +1,32 @@
+# app/core/pagination/dependencies.py
+from typing import Annotated, Optional
+
+from fastapi import Depends, Query
+
+from app.core.pagination.cursor import CursorParams
+
+
+def get_cursor_params(
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto como next_cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Tamaño de página"),
+    include_total: bool = Query(False, description="Incluir total (ejecuta COUNT)"),
+) -> Optional[CursorParams]:
+    """Parámetros de paginación por cursor; None si el cliente no pidió paginar."""
+    if cursor is None and limit is None:
+        return None
+    return CursorParams(cursor=cursor, limit=limit or 20, include_total=include_total)
+
+
+CursorParamsDep = Annotated[Optional[CursorParams], Depends(get_cursor_params)]
+
+
+def get_required_cursor_params(
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto como next_cursor"),
+    limit: int = Query(20, ge=1, le=100, description="Tamaño de página (máximo 100)"),
+    include_total: bool = Query(False, description="Incluir total (ejecuta COUNT)"),
+) -> CursorParams:
+    """Parámetros de paginación por cursor para endpoints que siempre paginan."""
+    return CursorParams(cursor=cursor, limit=limit, include_total=include_total)
+
+
+RequiredCursorParamsDep = Annotated[CursorParams, Depends(get_required_cursor_params)]
@@ -20,7 +20,7 @@ class PageParams(BaseModel):
 
 
 class PaginatedResult(BaseModel, Generic[T]):
-    total: int
+    total: Optional[int] = None  # None cuando se pidió sin COUNT
     items: List[T]
     skip: int
     limit: int
@@ -0,0 +1,226 @@
+# app/core/password_hashers.py
+"""
+Registro de esquemas de hash de contraseñas (argon2, bcrypt, PBKDF2).
+
+Se construye una sola vez por proceso: las librerías se importan al crear el registro
+y el PasswordHasher de argon2 se reutiliza. `verify` despacha por el prefijo del hash.
+
+Formatos:
+- argon2:  $argon2id$v=19$m=65536,t=3,p=4$<salt>$<hash>
+- bcrypt:  $2a$ / $2b$ / $2y$...
+- PBKDF2:  pbkdf2_sha256$<iteraciones>$<salt_hex>$<hash_hex>  (iteraciones en el hash)
+- PBKDF2 legado: <salt_hex>$<hash_hex> (sin iteraciones; se prueban las de
+  PASSWORD_PBKDF2_LEGACY_ITERATIONS)
+"""
+import hashlib
+import hmac
+import logging
+import secrets
+from typing import List, Optional, Sequence, Tuple
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordScheme:
+    name: str = ""
+    prefixes: Tuple[str, ...] = ()
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith(self.prefixes)
+
+    def hash(self, password: str) -> str:
+        raise NotImplementedError(f"El esquema {self.name} no genera hashes nuevos")
+
+    def verify(self, password: str, hashed: str) -> bool:
+        raise NotImplementedError
+
+    @property
+    def current_params(self) -> Optional[str]:
+        """Parámetros con los que este esquema genera hashes nuevos (para reportes)."""
+        return None
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True si el hash (de este esquema) usa parámetros distintos a los actuales."""
+        return False
+
+
+class Argon2Scheme(PasswordScheme):
+    name = "argon2"
+    prefixes = ("$argon2",)
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4):
+        from argon2 import PasswordHasher
+        from argon2.exceptions import InvalidHashError, VerificationError
+
+        self._params = f"m={memory_cost},t={time_cost},p={parallelism}"
+        self._hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            hash_len=32,
+            salt_len=16,
+        )
+        self._errors = (VerificationError, InvalidHashError)
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        # Los parámetros (m, t, p) se leen del propio hash
+        try:
+            return self._hasher.verify(hashed, password)
+        except self._errors:
+            return False
+
+    @property
+    def current_params(self) -> Optional[str]:
+        return self._params
+
+    def needs_rehash(self, hashed: str) -> bool:
+        try:
+            return self._hasher.check_needs_rehash(hashed)
+        except self._errors:
+            return True
+
+
+class BcryptScheme(PasswordScheme):
+    name = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self):
+        import bcrypt
+        self._bcrypt = bcrypt
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            return self._bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        except ValueError:
+            return False
+
+
+class Pbkdf2Scheme(PasswordScheme):
+    name = "pbkdf2_sha256"
+    prefixes = ("pbkdf2_sha256$",)
+
+    def __init__(self, iterations: int = 200000, legacy_iterations: Sequence[int] = ()):
+        self.iterations = iterations
+        self.legacy_iterations = list(legacy_iterations)
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith(self.prefixes) or self._parse_legacy(hashed) is not None
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, iterations: int) -> bytes:
+        return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+    @staticmethod
+    def _parse_legacy(hashed: str) -> Optional[Tuple[bytes, bytes]]:
+        parts = hashed.split("$")
+        if len(parts) != 2:
+            return None
+        try:
+            return bytes.fromhex(parts[0]), bytes.fromhex(parts[1])
+        except ValueError:
+            return None
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(32)
+        digest = self._derive(password, salt, self.iterations)
+        return f"{self.name}${self.iterations}${salt.hex()}${digest.hex()}"
+
+    def verify(self, password: str, hashed: str) -> bool:
+        if hashed.startswith(self.prefixes):
+            try:
+                _, iterations, salt, expected = hashed.split("$")
+                iterations, salt, expected = int(iterations), bytes.fromhex(salt), bytes.fromhex(expected)
+            except ValueError:
+                return False
+            return hmac.compare_digest(self._derive(password, salt, iterations), expected)
+
+        legacy = self._parse_legacy(hashed)
+        if legacy is None:
+            return False
+        salt, expected = legacy
+        for iterations in self.legacy_iterations:
+            if hmac.compare_digest(self._derive(password, salt, iterations), expected):
+                return True
+        return False
+
+    @property
+    def current_params(self) -> Optional[str]:
+        return str(self.iterations)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        if not hashed.startswith(self.prefixes):
+            return True  # formato legado sin iteraciones
+        try:
+            return int(hashed.split("$")[1]) != self.iterations
+        except (IndexError, ValueError):
+            return True
+
+
+class PasswordHasherRegistry:
+    """Esquemas disponibles; `default` genera los hashes nuevos."""
+
+    def __init__(self, schemes: List[PasswordScheme], default: PasswordScheme):
+        self.schemes = schemes
+        self.default = default
+
+    def identify(self, hashed: str) -> Optional[PasswordScheme]:
+        if not hashed:
+            return None
+        for scheme in self.schemes:
+            if scheme.identify(hashed):
+                return scheme
+        return None
+
+    def hash(self, password: str) -> str:
+        return self.default.hash(password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        scheme = self.identify(hashed)
+        if scheme is None:
+            logger.error("Formato de hash de contraseña no soportado")
+            return False
+        return scheme.verify(password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True si el hash no es del esquema por defecto o no usa sus parámetros actuales."""
+        scheme = self.identify(hashed)
+        if scheme is not self.default:
+            return True
+        return scheme.needs_rehash(hashed)
+
+
+def build_password_hasher_registry() -> PasswordHasherRegistry:
+    settings = get_settings()
+    pbkdf2 = Pbkdf2Scheme(
+        iterations=settings.PASSWORD_PBKDF2_ITERATIONS,
+        legacy_iterations=settings.PASSWORD_PBKDF2_LEGACY_ITERATIONS,
+    )
+    schemes: List[PasswordScheme] = []
+    default: PasswordScheme = pbkdf2
+    try:
+        argon2 = Argon2Scheme()
+        schemes.append(argon2)
+        default = argon2
+    except ImportError:
+        logger.warning("Argon2 not available, using PBKDF2 for new password hashes")
+    try:
+        schemes.append(BcryptScheme())
+    except ImportError:
+        logger.warning("bcrypt not installed, bcrypt hashes cannot be verified")
+    schemes.append(pbkdf2)
+    return PasswordHasherRegistry(schemes, default)
+
+
+_registry: Optional[PasswordHasherRegistry] = None
+
+
+def get_password_hasher_registry() -> PasswordHasherRegistry:
+    global _registry
+    if _registry is None:
+        _registry = build_password_hasher_registry()
+    return _registry
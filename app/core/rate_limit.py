@@ -0,0 +1,226 @@
+# app/core/rate_limit.py
+"""
+Rate limiting de login (token bucket por IP y por username) + guard de concurrencia.
+
+Cada intento consume un token del bucket de la IP y otro del username; los buckets se
+recargan a `per_minute` tokens/minuto hasta `burst`. Si alguno está vacío se rechaza
+con RateLimitExceededError (→ 429 + Retry-After) ANTES de verificar la contraseña,
+que es la parte costosa (Argon2, 64MB). El guard limita además las verificaciones
+simultáneas de un mismo username en el proceso.
+
+Store de buckets seleccionable con RATE_LIMIT_BACKEND:
+- memory: por proceso (cada worker aplica su propio límite).
+- redis:  compartido; script Lua atómico (funciona también con fakeredis).
+"""
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
+
+from app.core.metrics import REGISTRY, MetricFamily
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceededError(Exception):
+    def __init__(self, retry_after: float, scope: str):
+        super().__init__("Demasiados intentos, reintente más tarde")
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.scope = scope
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    burst: int  # capacidad máxima
+    per_minute: float  # tokens recargados por minuto
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+
+class TokenBucketStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, policy: BucketPolicy, cost: float = 1.0) -> Tuple[bool, float]:
+        """Consume `cost` tokens. Devuelve (permitido, segundos hasta tener tokens)."""
+
+
+class MemoryTokenBucketStore(TokenBucketStore):
+    """Buckets en memoria del proceso, acotados (LRU) para no crecer con IPs/usernames."""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, policy: BucketPolicy, cost: float = 1.0) -> Tuple[bool, float]:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (float(policy.burst), now))
+        tokens = min(float(policy.burst), tokens + (now - updated) * policy.rate)
+        if tokens >= cost:
+            allowed, retry_after = True, 0.0
+            tokens -= cost
+        else:
+            allowed, retry_after = False, (cost - tokens) / policy.rate
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, retry_after
+
+
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local data = redis.call('HMGET', KEYS[1], 't', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 't', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(retry)}
+"""
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Buckets compartidos entre workers; la recarga y el consumo son atómicos (Lua)."""
+
+    def __init__(self, client, prefix: str = "brasper:ratelimit:"):
+        self._client = client
+        self._prefix = prefix
+        self._script = client.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, policy: BucketPolicy, cost: float = 1.0) -> Tuple[bool, float]:
+        allowed, retry_after = await self._script(
+            keys=[f"{self._prefix}{key}"],
+            args=[policy.burst, policy.rate, time.time(), cost],
+        )
+        return int(allowed) == 1, float(retry_after)
+
+
+class LoginRateLimiter:
+    def __init__(
+        self,
+        store: TokenBucketStore,
+        ip_policy: BucketPolicy,
+        username_policy: BucketPolicy,
+        max_concurrent_per_username: int = 2,
+    ):
+        self.store = store
+        self.ip_policy = ip_policy
+        self.username_policy = username_policy
+        self.max_concurrent_per_username = max_concurrent_per_username
+        self._in_flight: Dict[str, int] = {}
+        # Métricas
+        self.allowed = 0
+        self.rejected: Dict[str, int] = {"ip": 0, "username": 0, "concurrency": 0}
+
+    @staticmethod
+    def _normalize(username: Optional[str]) -> str:
+        return (username or "").strip().lower()
+
+    def _reject(self, scope: str, retry_after: float) -> None:
+        self.rejected[scope] += 1
+        logger.warning(f"Login rate limit ({scope}) excedido")
+        raise RateLimitExceededError(retry_after, scope)
+
+    async def check(self, ip: str, username: Optional[str]) -> None:
+        """Consume un intento de IP y de username; lanza RateLimitExceededError si no hay."""
+        allowed, retry_after = await self.store.take(f"login:ip:{ip}", self.ip_policy)
+        if not allowed:
+            self._reject("ip", retry_after)
+        user_key = self._normalize(username)
+        if user_key:
+            allowed, retry_after = await self.store.take(f"login:user:{user_key}", self.username_policy)
+            if not allowed:
+                self._reject("username", retry_after)
+        self.allowed += 1
+
+    @asynccontextmanager
+    async def guard(self, ip: str, username: Optional[str]) -> AsyncIterator[None]:
+        """Rate limit + límite de verificaciones simultáneas por username (en el proceso)."""
+        await self.check(ip, username)
+        user_key = self._normalize(username)
+        if self._in_flight.get(user_key, 0) >= self.max_concurrent_per_username:
+            self._reject("concurrency", 1)
+        self._in_flight[user_key] = self._in_flight.get(user_key, 0) + 1
+        try:
+            yield
+        finally:
+            remaining = self._in_flight[user_key] - 1
+            if remaining:
+                self._in_flight[user_key] = remaining
+            else:
+                del self._in_flight[user_key]
+
+    def stats(self) -> dict:
+        return {
+            "allowed": self.allowed,
+            "rejected": dict(self.rejected),
+            "in_flight_usernames": len(self._in_flight),
+        }
+
+
+_login_limiter: Optional[LoginRateLimiter] = None
+
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    global _login_limiter
+    if _login_limiter is None:
+        settings = get_settings()
+        if settings.RATE_LIMIT_BACKEND.lower() == "redis":
+            from app.core.cache import get_redis_client
+            store: TokenBucketStore = RedisTokenBucketStore(get_redis_client())
+        else:
+            store = MemoryTokenBucketStore()
+        _login_limiter = LoginRateLimiter(
+            store,
+            ip_policy=BucketPolicy(settings.LOGIN_RATE_LIMIT_IP_BURST, settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE),
+            username_policy=BucketPolicy(
+                settings.LOGIN_RATE_LIMIT_USERNAME_BURST, settings.LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE
+            ),
+            max_concurrent_per_username=settings.LOGIN_MAX_CONCURRENT_PER_USERNAME,
+        )
+    return _login_limiter
+
+
+@asynccontextmanager
+async def _no_limit() -> AsyncIterator[None]:
+    yield
+
+
+def login_guard(ip: str, username: Optional[str]):
+    """Guard de login configurado (no-op si LOGIN_RATE_LIMIT_ENABLED=False)."""
+    if not get_settings().LOGIN_RATE_LIMIT_ENABLED:
+        return _no_limit()
+    return get_login_rate_limiter().guard(ip, username)
+
+
+def _collect() -> Iterable[MetricFamily]:
+    if _login_limiter is None:
+        return
+    yield MetricFamily("login_rate_limit_allowed_total", "counter", "Intentos de login admitidos").add(
+        _login_limiter.allowed
+    )
+    rejected = MetricFamily(
+        "login_rate_limit_rejected_total", "counter", "Intentos de login rechazados (429)", ("scope",)
+    )
+    for scope, count in _login_limiter.rejected.items():
+        rejected.add(count, scope)
+    yield rejected
+
+
+REGISTRY.register_collector(_collect)
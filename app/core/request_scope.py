@@ -0,0 +1,5 @@
+# app/core/request_scope.py
+"""Claves propias en el scope ASGI, compartidas entre capas (middlewares, db)."""
+
+# Resultado de la autenticación del request (AuthResult de app.middlewares.auth)
+AUTH_SCOPE_KEY = "brasper.auth"
@@ -1,11 +1,13 @@
 # app/core/security.py
 import secrets
-import hashlib
 from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import UUID
 import logging
 
+from app.core.hashing_pool import get_password_hashing_pool
+from app.core.password_hashers import get_password_hasher_registry
+
 logger = logging.getLogger(__name__)
 
 # Bytes de aleatoriedad para tokens opacos (48 bytes → ~64 caracteres base64url)
@@ -18,33 +20,15 @@ class SecurityUtils:
     def __init__(self, settings):
         self.settings = settings
         self.redis_client = None
+        # Esquemas de hash construidos una vez por proceso
+        self.password_hashers = get_password_hasher_registry()
 
     def hash_password_advanced(self, password: str) -> str:
         """
         Hash de contraseña usando Argon2 (más seguro que PBKDF2).
-        Si Argon2 no está disponible, usa PBKDF2 con más iteraciones.
+        Si Argon2 no está disponible, usa PBKDF2 (pbkdf2_sha256$iter$salt$hash).
         """
-        try:
-            from argon2 import PasswordHasher
-            ph = PasswordHasher(
-                time_cost=3,      # Número de iteraciones
-                memory_cost=65536,  # 64 MB de memoria
-                parallelism=4,    # 4 hilos paralelos
-                hash_len=32,      # Longitud del hash
-                salt_len=16       # Longitud del salt
-            )
-            return ph.hash(password)
-        except ImportError:
-            # Fallback a PBKDF2 con más iteraciones
-            logger.warning("Argon2 not available, using PBKDF2 with increased iterations")
-            salt = secrets.token_hex(32)
-            pwd_hash = hashlib.pbkdf2_hmac(
-                'sha256',
-                password.encode(),
-                bytes.fromhex(salt),
-                200000  # Más iteraciones para mayor seguridad
-            )
-            return f"{salt}${pwd_hash.hex()}"
+        return self.password_hashers.hash(password)
     
     def set_redis_client(self, redis_client):
         """Inyectar cliente Redis (deprecated, no se usa)"""
@@ -123,63 +107,23 @@ class SecurityUtils:
         Verifica contraseña contra hash. Soporta Argon2, bcrypt y PBKDF2.
         """
         try:
-            # Detectar Argon2 (formato: $argon2id$v=19$m=...)
-            if hashed.startswith('$argon2'):
-                try:
-                    from argon2 import PasswordHasher
-                    ph = PasswordHasher()
-                    ph.verify(hashed, password)
-                    return True
-                except ImportError:
-                    logger.error("Argon2 not installed but Argon2 hash detected")
-                    return False
-                except Exception:
-                    return False
-            
-            # Detectar si es bcrypt (empieza con $2a$, $2b$, $2y$)
-            if hashed.startswith(('$2a$', '$2b$', '$2y$')):
-                try:
-                    import bcrypt
-                    return bcrypt.checkpw(
-                        password.encode('utf-8'),
-                        hashed.encode('utf-8')
-                    )
-                except ImportError:
-                    logger.error("bcrypt not installed but bcrypt hash detected")
-                    return False
-            
-            # Formato PBKDF2 custom: "salt$hash"
-            parts = hashed.split('$')
-            
-            if len(parts) == 2:
-                # Formato simple: salt$hash
-                salt, pwd_hash = parts
-                # Intentar con diferentes números de iteraciones
-                for iterations in [200000, 100000, 50000]:
-                    test_hash = hashlib.pbkdf2_hmac(
-                        'sha256',
-                        password.encode(),
-                        bytes.fromhex(salt),
-                        iterations
-                    )
-                    if test_hash.hex() == pwd_hash:
-                        return True
-                return False
-            
-            elif len(parts) >= 3:
-                # Posible formato werkzeug: pbkdf2:sha256:iterations$salt$hash
-                # O formato con prefijo: algorithm$iterations$salt$hash
-                logger.warning(f"Unsupported hash format with {len(parts)} parts")
-                return False
-            
-            else:
-                logger.error(f"Invalid hash format: expected 'salt$hash', got {len(parts)} parts")
-                return False
-                
+            return self.password_hashers.verify(password, hashed)
         except Exception as e:
             logger.error(f"Error verifying password: {str(e)}")
             return False
-    
+
+    def password_needs_rehash(self, hashed: str) -> bool:
+        """True si el hash debe regenerarse con el esquema/parámetros actuales."""
+        return self.password_hashers.needs_rehash(hashed)
+
+    async def hash_password_async(self, password: str) -> str:
+        """hash_password en el pool acotado (no bloquea el event loop)."""
+        return await get_password_hashing_pool().run(self.hash_password, password)
+
+    async def verify_password_async(self, password: str, hashed: str) -> bool:
+        """verify_password en el pool acotado (no bloquea el event loop)."""
+        return await get_password_hashing_pool().run(self.verify_password, password, hashed)
+
     def is_password_strong(self, password: str) -> bool:
         """Valida que contraseña cumpla requisitos mínimos"""
         return (
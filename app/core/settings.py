@@ -12,6 +12,22 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_HOST: str
     POSTGRES_PORT: int
+    # Réplicas de lectura ("host" o "host:puerto"; misma base y credenciales que el primario)
+    POSTGRES_REPLICA_HOSTS: List[str] = []
+    # Tras una escritura, las lecturas del mismo usuario van al primario durante N segundos
+    DB_READ_STICKY_SECONDS: float = 5
+
+    # Pool de conexiones: perfil base (api | worker | migration) + overrides opcionales
+    DB_POOL_PROFILE: str = "api"
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None  # segundos esperando conexión antes de error
+    DB_POOL_RECYCLE: Optional[int] = None  # segundos de vida máxima de una conexión
+    DB_POOL_PRE_PING: Optional[bool] = None  # ping en cada checkout (un round trip más)
+    DB_POOL_LIVENESS_INTERVAL_SECONDS: float = 30  # ping periódico en segundo plano; 0 lo desactiva
+    DB_ECHO: Optional[bool] = None  # log de SQL; por defecto sigue a DEBUG
+    DB_COMPILED_CACHE_SIZE: int = 1200  # SQL compilado por engine (query_cache_size de SQLAlchemy)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500  # prepared statements de asyncpg por conexión
 
     # FastAPI / app
     DEBUG: bool
@@ -25,16 +41,63 @@ class Settings(BaseSettings):
     # Token Encryption
     TOKEN_EXPIRATION_MINUTES: int = 1440  # 24 horas por defecto
     TOKEN_REFRESH_EXPIRATION_MINUTES: int = 2880  # 48 horas por defecto
+    # Cache en memoria de sesiones validadas (token -> usuario)
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000  # 0 desactiva el cache
+    TOKEN_CACHE_TTL_SECONDS: int = 60  # máximo retraso de una revocación entre workers
+    # TokenAuthMiddleware (ASGI); sin él, get_current_user valida el token por dependencia
+    AUTH_MIDDLEWARE_ENABLED: bool = True
     SECRET_KEY: str  # Clave secreta para encriptación AES-256 (mínimo 32 caracteres recomendado)
 
+    # Pool de hashing de contraseñas (Argon2 usa ~64MB por hash en curso)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # en cola + en ejecución; más allá se responde 503
+    # PBKDF2 (fallback sin argon2): las iteraciones se guardan en el hash
+    PASSWORD_PBKDF2_ITERATIONS: int = 200000
+    # Hashes legados "salt$hash" no guardan iteraciones: se prueban estas (vaciar al migrarlos)
+    PASSWORD_PBKDF2_LEGACY_ITERATIONS: List[int] = [200000, 100000, 50000]
+
+    # Depuración SQL por request (headers X-DB-* y aviso de N+1 en logs); no usar en producción
+    SQL_QUERY_DEBUG: bool = False
+    SQL_NPLUS1_THRESHOLD: int = 5  # misma forma de sentencia >= N veces en una request
+
+    # Rate limit de login (token bucket por IP y por username): memory | redis
+    RATE_LIMIT_BACKEND: str = "memory"
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 20
+    LOGIN_RATE_LIMIT_USERNAME_BURST: int = 5
+    LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE: float = 5
+    LOGIN_MAX_CONCURRENT_PER_USERNAME: int = 2
+
     TIMEZONE: str = "America/Lima"
 
+    # Cotización: antigüedad máxima del snapshot en memoria de tasas/comisiones
+    QUOTE_SNAPSHOT_TTL_SECONDS: int = 300
+    # Cache de respuestas de catálogos (tasas, comisiones, monedas, bancos)
+    CATALOG_CACHE_TTL_SECONDS: int = 600
+
+    # Backend de cache compartido entre workers: memory | redis | file
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_FILE_DIR: str = "/dev/shm/brasper-cache"  # solo CACHE_BACKEND=file (mismo host)
+    CACHE_INVALIDATION_POLL_SECONDS: float = 0.5
+
     @property
     def database_url(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def replica_database_urls(self) -> List[str]:
+        urls = []
+        for entry in self.POSTGRES_REPLICA_HOSTS:
+            host, _, port = entry.partition(":")
+            urls.append(
+                f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{host}:{port or self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+            )
+        return urls
+
     def configure_cache(self):
-        """Configura cache (sin Redis, usando memoria)"""
+        """Configura el cache aiocache en memoria (usado por CACHE_BACKEND=memory)"""
         caches.set_config({
             'default': {
                 'cache': 'aiocache.SimpleMemoryCache',
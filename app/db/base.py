@@ -1,44 +1,119 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from itertools import cycle
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.settings import get_settings
+from app.db.instrumentation import instrument_engine
+from app.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolLivenessChecker,
+    register_pool_collector,
+    resolve_pool_profile,
+)
+from app.db.routing import (
+    REQUEST_SCOPE_INFO,
+    ReadYourWritesTracker,
+    WriteTrackingSession,
+    request_sticky_keys,
+)
 
 settings = get_settings()
 
 Base = declarative_base()
 
-url = settings.database_url
-if not url.startswith("postgresql+asyncpg://"):
-    url = url.replace("postgresql://", "postgresql+asyncpg://")
-
-engine = create_async_engine(
-    url,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=60,
-    connect_args={
-        "server_settings": {
-            "application_name": "com_brasper_api",
-            "statement_timeout": "300000"
-        },
-        "command_timeout": 60,
-        "timeout": 30,
-    }
-)
+pool_profile = resolve_pool_profile(settings)
+
+
+def _async_url(url: str) -> str:
+    if not url.startswith("postgresql+asyncpg://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://")
+    # Prepared statements reutilizados por conexión (mismo SQL = mismo statement)
+    return f"{url}?prepared_statement_cache_size={settings.DB_PREPARED_STATEMENT_CACHE_SIZE}"
+
+
+def _create_engine(url: str, pool_name: str) -> AsyncEngine:
+    """Engine async con el perfil de pool, instrumentado y publicado en /metrics."""
+    new_engine = create_async_engine(
+        _async_url(url),
+        echo=settings.DEBUG if settings.DB_ECHO is None else settings.DB_ECHO,
+        future=True,
+        query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_pre_ping=pool_profile.pre_ping,
+        pool_recycle=pool_profile.pool_recycle,
+        pool_size=pool_profile.pool_size,
+        max_overflow=pool_profile.max_overflow,
+        pool_timeout=pool_profile.pool_timeout,
+        connect_args={
+            "server_settings": {
+                "application_name": "com_brasper_api",
+                "statement_timeout": str(pool_profile.statement_timeout_ms)
+            },
+            "command_timeout": 60,
+            "timeout": 30,
+        }
+    )
+    instrument_engine(new_engine.sync_engine)
+    register_pool_collector(new_engine.sync_engine, pool_name)
+    return new_engine
+
+
+engine = _create_engine(settings.database_url, settings.DB_POOL_PROFILE.lower())
+replica_engines = [
+    _create_engine(replica_url, f"{settings.DB_POOL_PROFILE.lower()}_replica{index}")
+    for index, replica_url in enumerate(settings.replica_database_urls, start=1)
+]
+_next_replica = cycle(replica_engines)
+
+pool_liveness_checkers = [
+    PoolLivenessChecker(e, settings.DB_POOL_LIVENESS_INTERVAL_SECONDS) for e in [engine, *replica_engines]
+]
+
+read_your_writes = ReadYourWritesTracker(settings.DB_READ_STICKY_SECONDS)
+WriteTrackingSession.tracker = read_your_writes
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
+    class_=AsyncSession,
+    sync_session_class=WriteTrackingSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+# Sesiones de solo lectura: el engine (réplica) se elige al abrir cada sesión
+ReadSessionLocal = sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False,
     autocommit=False,
 )
 
-async def get_db():
+
+def read_session(sticky_keys=()) -> AsyncSession:
+    """Sesión de réplica (round-robin); primario si no hay réplicas o el autor está sticky."""
+    if not replica_engines or read_your_writes.any_sticky(sticky_keys):
+        return AsyncSessionLocal()
+    return ReadSessionLocal(bind=next(_next_replica))
+
+
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
+        # El autor (read-your-writes) se lee del scope al commit, no acá
+        session.info[REQUEST_SCOPE_INFO] = request.scope
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def get_read_db(request: Request):
+    """Sesión para casos de uso de solo lectura (List*/Get*)."""
+    async with read_session(request_sticky_keys(request.scope)) as session:
         try:
             yield session
         except Exception:
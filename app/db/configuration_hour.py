@@ -20,3 +20,10 @@ def create_timestamp_columns():
             nullable=False,
         ),
     )
+
+
+def local_now():
+    """Expresión SQL de "ahora" con la misma convención que created_at/updated_at
+    (necesaria para comparar con esas columnas)."""
+    tz = get_settings().TIMEZONE
+    return text(f"(now() AT TIME ZONE '{tz}')")
@@ -0,0 +1,119 @@
+# app/db/instrumentation.py
+"""
+Conteo y tiempo de queries SQL por request.
+
+El middleware de métricas abre un QueryStats por request (ContextVar); los eventos
+before/after_cursor_execute del engine lo actualizan. El objeto es mutable y la
+ContextVar solo se asigna al inicio de la request: el greenlet que usa SQLAlchemy
+async comparte el contexto de la tarea, así que las mutaciones son visibles al final.
+"""
+import re
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, CACHING_DISABLED, NO_CACHE_KEY
+
+from app.core.metrics import REGISTRY
+
+DB_QUERIES = REGISTRY.counter("db_queries_total", "Queries SQL ejecutadas")
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_duration_seconds",
+    "Duración de queries SQL",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+# Cache de SQL compilado de SQLAlchemy (query_cache_size): hit = sin recompilar
+DB_COMPILED_CACHE = REGISTRY.counter(
+    "db_compiled_cache_total", "Sentencias ejecutadas según el cache de SQL compilado", ("result",)
+)
+_CACHE_RESULTS = {
+    CACHE_HIT: "hit",
+    CACHE_MISS: "miss",
+    CACHING_DISABLED: "disabled",
+    NO_CACHE_KEY: "no_key",
+}
+
+
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\b\d+\b")
+# IN ($1, $2, ...) / IN (%(id_1)s, ...) expandidos: la forma no depende del tamaño de la lista
+_IN_LIST = re.compile(r"\bIN \(\s*(?:(?:\$\d+|%\(\w+\)s|\?)(?:::[\w\[\]]+)?\s*,?\s*)+\)", re.IGNORECASE)
+
+
+def statement_shape(statement: str) -> str:
+    """Forma normalizada de una sentencia (sin literales ni largo de listas IN)."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _IN_LIST.sub("IN (...)", shape)
+    return _NUMBER.sub("?", shape)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    # Solo en modo debug (SQL_QUERY_DEBUG): forma -> veces ejecutada
+    shapes: Optional[Dict[str, int]] = None
+
+    def track_shapes(self) -> None:
+        if self.shapes is None:
+            self.shapes = {}
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        """Formas ejecutadas >= threshold veces (probable N+1), de más a menos."""
+        if not self.shapes:
+            return []
+        repeated = [(shape, n) for shape, n in self.shapes.items() if n >= threshold]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> Token:
+    """Empieza a contar queries en el contexto actual; devuelve el token para `reset`."""
+    return _query_stats.set(QueryStats())
+
+
+def reset_query_stats(token: Token) -> None:
+    _query_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _query_stats.get()
+
+
+# El inicio se guarda en el ExecutionContext de la sentencia (no en la conexión): si la
+# sentencia falla, after_cursor_execute no se ejecuta y el valor se descarta con el contexto
+_STARTED_AT = "_brasper_query_started_at"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        setattr(context, _STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, _STARTED_AT, None)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    DB_QUERIES.inc()
+    DB_QUERY_SECONDS.observe(elapsed)
+    cache_result = _CACHE_RESULTS.get(getattr(context, "cache_hit", None))
+    if cache_result is not None:
+        DB_COMPILED_CACHE.inc(result=cache_result)
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_seconds += elapsed
+        if stats.shapes is not None:
+            shape = statement_shape(statement)
+            stats.shapes[shape] = stats.shapes.get(shape, 0) + 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Registra los listeners en un engine síncrono (para AsyncEngine: engine.sync_engine)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,47 @@
+"""auth_login_token_unique_index
+
+Revision ID: 022
+Revises: 021
+Create Date: 2025-02-04
+
+Índice único parcial sobre "user".auth_login(token) WHERE token IS NOT NULL para
+que la validación de sesión sea un único lookup indexado, e índice sobre
+"user".user(auth_id) para el JOIN auth_login -> user.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "022"
+down_revision: Union[str, None] = "021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+schema = "user"
+
+
+def upgrade() -> None:
+    # Revocar tokens duplicados (si los hubiera) para poder crear el índice único
+    op.execute(sa.text("""
+        UPDATE "user".auth_login a
+        SET token = NULL
+        FROM "user".auth_login b
+        WHERE a.token IS NOT NULL
+          AND a.token = b.token
+          AND a.id <> b.id
+          AND (a.updated_at, a.id) < (b.updated_at, b.id)
+    """))
+    op.execute(sa.text("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_user_auth_login_token
+        ON "user".auth_login (token)
+        WHERE token IS NOT NULL
+    """))
+    op.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_user_user_auth_id ON "user".user (auth_id)
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text('DROP INDEX IF EXISTS "user".ix_user_user_auth_id'))
+    op.execute(sa.text('DROP INDEX IF EXISTS "user".ux_user_auth_login_token'))
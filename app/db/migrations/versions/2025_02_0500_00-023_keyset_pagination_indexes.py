@@ -0,0 +1,37 @@
+"""keyset_pagination_indexes
+
+Revision ID: 023
+Revises: 022
+Create Date: 2025-02-05
+
+Índices (created_at DESC, id DESC) para la paginación por cursor de los listados
+de transacciones, cuentas bancarias y usuarios.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "023"
+down_revision: Union[str, None] = "022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (esquema, tabla, nombre de índice)
+keyset_indexes = [
+    ("transaction", "transactions", "ix_transaction_transactions_created_at_id"),
+    ("transaction", "bank_accounts", "ix_transaction_bank_accounts_created_at_id"),
+    ("user", "user", "ix_user_user_created_at_id"),
+]
+
+
+def upgrade() -> None:
+    for schema, table, index_name in keyset_indexes:
+        op.execute(sa.text(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON "{schema}"."{table}" (created_at DESC, id DESC)'
+        ))
+
+
+def downgrade() -> None:
+    for schema, _table, index_name in reversed(keyset_indexes):
+        op.execute(sa.text(f'DROP INDEX IF EXISTS "{schema}".{index_name}'))
@@ -0,0 +1,40 @@
+"""transactions_filter_indexes
+
+Revision ID: 024
+Revises: 023
+Create Date: 2025-02-05
+
+Índices compuestos para el listado filtrado de transacciones: cada filtro de
+igualdad (user_id, status, tax_rate_id) seguido del orden keyset (created_at DESC, id DESC).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "024"
+down_revision: Union[str, None] = "023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+schema = "transaction"
+
+# (columna de filtro, nombre de índice)
+filter_indexes = [
+    ("user_id", "ix_transaction_transactions_user_id_created_at_id"),
+    ("status", "ix_transaction_transactions_status_created_at_id"),
+    ("tax_rate_id", "ix_transaction_transactions_tax_rate_id_created_at_id"),
+]
+
+
+def upgrade() -> None:
+    for column, index_name in filter_indexes:
+        op.execute(sa.text(
+            f'CREATE INDEX IF NOT EXISTS {index_name} '
+            f'ON "{schema}".transactions ({column}, created_at DESC, id DESC)'
+        ))
+
+
+def downgrade() -> None:
+    for _column, index_name in reversed(filter_indexes):
+        op.execute(sa.text(f'DROP INDEX IF EXISTS "{schema}".{index_name}'))
@@ -0,0 +1,75 @@
+"""tax_rate_history
+
+Revision ID: 025
+Revises: 024
+Create Date: 2025-02-06
+
+Historial append-only de tasas: cada fila es el valor de una tax_rate vigente en
+[valid_from, valid_to) (valid_to NULL = vigente). Índices:
+- (tax_rate_id, valid_from DESC): tasa usada por una transacción (tax_rate_id + fecha).
+- (coin_a, coin_b, valid_from DESC): tasa de un par en un instante.
+- BRIN (valid_from): reportes por rango de fechas (tabla append-only, orden físico ≈ temporal).
+- Único parcial (tax_rate_id) WHERE valid_to IS NULL: un solo tramo abierto por tasa.
+
+Los defaults de fecha usan local_now() (misma convención que created_at/updated_at y
+que el repositorio), así que valid_from/valid_to son comparables con esas columnas.
+
+Backfill: un tramo por tasa existente desde su created_at (el valor anterior a la
+última edición no se conserva); las eliminadas quedan cerradas en su updated_at.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.configuration_hour import local_now
+
+revision: str = "025"
+down_revision: Union[str, None] = "024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+schema = "coin"
+
+indexes = [
+    ("ix_coin_tax_rate_history_tax_rate_id_valid_from", "(tax_rate_id, valid_from DESC)"),
+    ("ix_coin_tax_rate_history_pair_valid_from", "(coin_a, coin_b, valid_from DESC)"),
+    ("ix_coin_tax_rate_history_valid_from_brin", "USING brin (valid_from)"),
+]
+
+
+def upgrade() -> None:
+    now = local_now().text
+    op.execute(sa.text(f"""
+        CREATE TABLE IF NOT EXISTS coin.tax_rate_history (
+            id UUID NOT NULL PRIMARY KEY DEFAULT gen_random_uuid(),
+            deleted BOOLEAN NOT NULL DEFAULT false,
+            enable BOOLEAN NOT NULL DEFAULT true,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT {now},
+            created_by VARCHAR(250),
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT {now},
+            tax_rate_id UUID NOT NULL REFERENCES coin.tax_rate(id),
+            coin_a coin.currency NOT NULL,
+            coin_b coin.currency NOT NULL,
+            tax NUMERIC(20, 8) NOT NULL,
+            valid_from TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT {now},
+            valid_to TIMESTAMP WITH TIME ZONE
+        )
+    """))
+    for index_name, definition in indexes:
+        op.execute(sa.text(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON "{schema}".tax_rate_history {definition}'
+        ))
+    op.execute(sa.text(
+        f'CREATE UNIQUE INDEX IF NOT EXISTS ux_coin_tax_rate_history_open '
+        f'ON "{schema}".tax_rate_history (tax_rate_id) WHERE valid_to IS NULL'
+    ))
+    op.execute(sa.text("""
+        INSERT INTO coin.tax_rate_history (tax_rate_id, coin_a, coin_b, tax, valid_from, valid_to)
+        SELECT id, coin_a, coin_b, tax, created_at, CASE WHEN deleted THEN updated_at END
+        FROM coin.tax_rate
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text(f'DROP TABLE IF EXISTS "{schema}".tax_rate_history'))
@@ -0,0 +1,56 @@
+"""daily_volume
+
+Revision ID: 026
+Revises: 025
+Create Date: 2025-02-07
+
+Rollup diario de transacciones: (día de created_at, coin_a, coin_b vía tax_rate, status)
+con conteo y sumas de origin_amount/destination_amount. Los dashboards leen de aquí en
+vez de sumar transaction.transactions. Se llena con las transacciones existentes.
+
+El repositorio toma el par del tramo de tax_rate_history vigente al crear la
+transacción; al migrar, 025 deja un solo tramo por tasa (su par actual), así que el
+backfill puede leer el par de tax_rate directamente.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "026"
+down_revision: Union[str, None] = "025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+schema = "transaction"
+
+
+def upgrade() -> None:
+    op.execute(sa.text("""
+        CREATE TABLE IF NOT EXISTS "transaction".daily_volume (
+            day DATE NOT NULL,
+            coin_a coin.currency NOT NULL,
+            coin_b coin.currency NOT NULL,
+            status "transaction".transaction_status NOT NULL,
+            tx_count BIGINT NOT NULL DEFAULT 0,
+            origin_amount NUMERIC(24, 8) NOT NULL DEFAULT 0,
+            destination_amount NUMERIC(24, 8) NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (day, coin_a, coin_b, status)
+        )
+    """))
+    op.execute(sa.text("""
+        INSERT INTO "transaction".daily_volume
+            (day, coin_a, coin_b, status, tx_count, origin_amount, destination_amount)
+        SELECT date(t.created_at), r.coin_a, r.coin_b, t.status,
+               count(*), sum(t.origin_amount), sum(t.destination_amount)
+        FROM "transaction".transactions t
+        JOIN coin.tax_rate r ON r.id = t.tax_rate_id
+        WHERE t.deleted = false
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT DO NOTHING
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text(f'DROP TABLE IF EXISTS "{schema}".daily_volume'))
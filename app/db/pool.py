@@ -0,0 +1,143 @@
+# app/db/pool.py
+"""
+Pool de conexiones instrumentado: mide la espera para obtener una conexión y expone
+el estado del pool (en uso, overflow, libres) en /metrics.
+
+Parámetros por perfil (DB_POOL_PROFILE) con overrides por setting, y chequeo periódico
+de conexiones en segundo plano en lugar de pool_pre_ping. Un pool que se queda corto
+se ve en db_pool_wait_seconds (cola larga) y db_pool_timeouts_total.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import REGISTRY, MetricFamily
+
+POOL_WAIT_SECONDS = REGISTRY.histogram(
+    "db_pool_wait_seconds",
+    "Tiempo hasta obtener una conexión del pool (incluye abrirla si hace falta)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+POOL_TIMEOUTS = REGISTRY.counter("db_pool_timeouts_total", "Esperas del pool que superaron pool_timeout")
+POOL_LIVENESS_CHECKS = REGISTRY.counter(
+    "db_pool_liveness_checks_total", "Chequeos periódicos de conexiones del pool", ("result",)
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
+def register_pool_collector(engine, name: str = "default") -> None:
+    """Publica el estado del pool del engine en cada scrape de /metrics."""
+
+    def collect() -> Iterable[MetricFamily]:
+        pool = engine.pool
+        labels = ("pool",)
+        yield MetricFamily("db_pool_size", "gauge", "Tamaño configurado del pool", labels).add(pool.size(), name)
+        yield MetricFamily("db_pool_checked_out", "gauge", "Conexiones en uso", labels).add(pool.checkedout(), name)
+        yield MetricFamily("db_pool_checked_in", "gauge", "Conexiones libres en el pool", labels).add(pool.checkedin(), name)
+        # overflow() es negativo mientras no se llena pool_size
+        yield MetricFamily("db_pool_overflow", "gauge", "Conexiones por encima de pool_size", labels).add(
+            max(pool.overflow(), 0), name
+        )
+
+    collect.__name__ = f"db_pool_{name}"
+    REGISTRY.register_collector(collect)
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pre_ping: bool = False
+    statement_timeout_ms: int = 300000  # 0 = sin límite
+
+
+# api: requests cortas y concurrentes; worker: jobs/CLI con pocas conexiones largas;
+# migration: una conexión, sin statement_timeout (DDL, backfills, rebuilds).
+POOL_PROFILES: Dict[str, PoolProfile] = {
+    "api": PoolProfile(pool_size=10, max_overflow=20, pool_timeout=60, pool_recycle=3600),
+    "worker": PoolProfile(pool_size=2, max_overflow=2, pool_timeout=120, pool_recycle=3600),
+    "migration": PoolProfile(pool_size=1, max_overflow=0, pool_timeout=300, pool_recycle=3600, statement_timeout_ms=0),
+}
+
+
+def resolve_pool_profile(settings) -> PoolProfile:
+    """Perfil DB_POOL_PROFILE con los overrides DB_* que no sean None."""
+    name = settings.DB_POOL_PROFILE.lower()
+    if name not in POOL_PROFILES:
+        raise ValueError(f"DB_POOL_PROFILE desconocido: {name} (opciones: {', '.join(POOL_PROFILES)})")
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    return replace(POOL_PROFILES[name], **{k: v for k, v in overrides.items() if v is not None})
+
+
+class PoolLivenessChecker:
+    """Ping periódico en segundo plano en lugar de pool_pre_ping.
+
+    Si el ping falla por desconexión, SQLAlchemy invalida el pool completo: las demás
+    conexiones abiertas antes del fallo se descartan en su próximo checkout, así que
+    un reinicio/failover de Postgres se detecta sin un round trip extra por checkout.
+    Con el pool sin conexiones libres no hace nada (no compite con las requests).
+    """
+
+    def __init__(self, engine, interval: float):
+        self.engine = engine
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self) -> bool:
+        if self.engine.pool.checkedin() == 0:
+            POOL_LIVENESS_CHECKS.inc(result="skipped")
+            return True
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            POOL_LIVENESS_CHECKS.inc(result="failed")
+            logger.warning(f"Chequeo de conexiones del pool falló: {str(e)}")
+            return False
+        POOL_LIVENESS_CHECKS.inc(result="ok")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,104 @@
+# app/db/routing.py
+"""
+Ruteo de lecturas a réplicas con read-your-writes.
+
+- Las sesiones de escritura (get_db) detectan si el request escribió (INSERT/UPDATE/
+  DELETE, flush o SQL textual) y, al hacer commit, marcan a su autor como "sticky"
+  durante DB_READ_STICKY_SECONDS.
+- get_read_db entrega una sesión de réplica (round-robin), salvo que el autor del
+  request esté sticky o no haya réplicas: entonces usa el primario.
+
+El autor se identifica por la IP del cliente y, si la autenticación del request
+(middleware o dependencia) ya corrió, también por su user_id: una escritura marca ambas
+claves y una lectura es sticky si lo está cualquiera. La capa de BD no autentica: solo
+lee el resultado que dejó la autenticación en el scope. La marca vive en memoria del
+proceso: con varios workers, el sticky solo aplica en el worker que atendió la escritura.
+"""
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.request_scope import AUTH_SCOPE_KEY
+
+# Claves en session.info: scope ASGI del request (el autor se resuelve al commit, cuando
+# la autenticación de la ruta ya corrió) y si escribió en la transacción en curso
+REQUEST_SCOPE_INFO = "request_scope"
+WROTE_INFO = "wrote"
+
+
+class ReadYourWritesTracker:
+    """Autores con escrituras recientes (LRU acotado, como los buckets de rate limit)."""
+
+    def __init__(self, window_seconds: float, max_keys: int = 100000):
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._deadlines: "OrderedDict[str, float]" = OrderedDict()
+
+    def mark(self, key: str) -> None:
+        if self.window_seconds <= 0:
+            return
+        self._deadlines.pop(key, None)
+        self._deadlines[key] = time.monotonic() + self.window_seconds
+        while len(self._deadlines) > self.max_keys:
+            self._deadlines.popitem(last=False)
+
+    def any_sticky(self, keys: Iterable[str]) -> bool:
+        return any(self.is_sticky(key) for key in keys)
+
+    def is_sticky(self, key: Optional[str]) -> bool:
+        if key is None:
+            return False
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return False
+        if deadline < time.monotonic():
+            del self._deadlines[key]
+            return False
+        return True
+
+
+def request_sticky_keys(scope) -> List[str]:
+    """Claves del autor del request: usuario (si ya se autenticó) e IP del cliente."""
+    keys = []
+    user = getattr(scope.get(AUTH_SCOPE_KEY), "user", None)
+    if user and user.get("user_id"):
+        keys.append(f"user:{user['user_id']}")
+    client = scope.get("client")
+    if client:
+        keys.append(f"ip:{client[0]}")
+    return keys
+
+
+class WriteTrackingSession(Session):
+    """Session que registra escrituras para el sticky de read-your-writes."""
+
+    tracker: Optional[ReadYourWritesTracker] = None
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _track_execute(state) -> None:
+    # text() y DML cuentan como escritura (conservador: SET/LOCK también)
+    if not state.is_select:
+        state.session.info[WROTE_INFO] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    session.info[WROTE_INFO] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_commit")
+def _mark_sticky(session) -> None:
+    if session.info.pop(WROTE_INFO, False):
+        scope = session.info.get(REQUEST_SCOPE_INFO)
+        if scope is not None and session.tracker is not None:
+            for key in request_sticky_keys(scope):
+                session.tracker.mark(key)
+
+
+@event.listens_for(WriteTrackingSession, "after_rollback")
+def _discard_write(session) -> None:
+    session.info.pop(WROTE_INFO, None)
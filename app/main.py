@@ -5,9 +5,16 @@ import app.models_registry
 
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi.responses import JSONResponse, Response
+
+from app.core.hashing_pool import PasswordHashingBusyError, shutdown_password_hashing_pool
+from app.core.metrics import CONTENT_TYPE_LATEST, REGISTRY
+from app.core.rate_limit import RateLimitExceededError
+from app.middlewares.auth import TokenAuthMiddleware
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.sql_debug import SQLDebugMiddleware
 from app.core.settings import get_settings
 
 # Auth, User, Coin, Transactions, Integraciones
@@ -36,12 +43,33 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 70)
     logger.info("Iniciando aplicación Com Brasper API...")
     logger.info("=" * 70)
+
+    # Escuchar invalidaciones de cache de otros workers
+    from app.core.cache import start_cache, stop_cache
+    await start_cache()
+
+    # Chequeo periódico de conexiones del pool (reemplaza pool_pre_ping)
+    from app.db.base import pool_liveness_checkers
+    for checker in pool_liveness_checkers:
+        checker.start()
+
+    # Precargar snapshot de cotización (si falla, se carga en la primera cotización)
+    from app.modules.coin.adapters.dependencies import get_quote_service
+    try:
+        await get_quote_service().refresh()
+        logger.info("✓ Snapshot de cotización cargado")
+    except Exception as e:
+        logger.warning(f"No se pudo precargar el snapshot de cotización: {str(e)}")
     
     logger.info("✓ Aplicación iniciada correctamente")
     logger.info("=" * 70)
     
     yield
     
+    for checker in pool_liveness_checkers:
+        await checker.stop()
+    await stop_cache()
+    shutdown_password_hashing_pool()
     logger.info("=" * 70)
     logger.info("Cerrando aplicación...")
     logger.info("=" * 70)
@@ -75,6 +103,10 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# Auth (dentro de CORS: los 401 llevan headers CORS)
+if settings.AUTH_MIDDLEWARE_ENABLED:
+    app.add_middleware(TokenAuthMiddleware)
+
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
@@ -82,10 +114,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Retry-After", "X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Repeated-Queries"],
 )
 
-# Middleware de auth desactivado por el momento (sin tokens)
-# app.add_middleware(TokenAuthMiddleware)
+# Depuración SQL (dentro de métricas: comparte su contador de queries)
+if settings.SQL_QUERY_DEBUG:
+    app.add_middleware(SQLDebugMiddleware, nplus1_threshold=settings.SQL_NPLUS1_THRESHOLD)
+
+# Métricas (el último en agregarse es el más externo: mide también CORS)
+app.add_middleware(MetricsMiddleware)
+
+# Errores transversales
+@app.exception_handler(PasswordHashingBusyError)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError):
+    """Pool de hashing saturado: 503 para que el cliente reintente."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceededError):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 
 # Incluir routers
 app.include_router(auth_router)
@@ -97,3 +154,9 @@ app.include_router(integraciones_router)
 @app.get("/")
 async def root():
     return {"message": "Com Brasper API", "version": "1.0.0"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Métricas en formato Prometheus."""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
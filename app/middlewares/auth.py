@@ -1,16 +1,47 @@
+# app/middlewares/auth.py
+"""
+Autenticación con tokens opacos (validación vía cache de sesiones / BD).
+
+- TokenAuthMiddleware: middleware ASGI puro (sin BaseHTTPMiddleware: no crea tareas
+  extra ni envuelve el cuerpo, así que no rompe el streaming).
+- authenticate_request: dependencia FastAPI equivalente, para usar sin el middleware o
+  por ruta; si el middleware ya resolvió el token en este request, lo reutiliza.
+
+Ninguno rechaza requests sin token (eso lo hacen require_auth / get_current_user en
+cada ruta); un token inválido o expirado en una ruta no pública responde 401.
+
+Las rutas públicas aceptan requests con token inválido (no responden 401), pero un
+token válido sí autentica el request. Se compilan una vez en un trie por segmentos: el
+costo por request es O(segmentos del path), no O(rutas públicas), y "/" solo coincide
+con la raíz.
+"""
 import logging
-from typing import Optional
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
+
+from app.core.request_scope import AUTH_SCOPE_KEY
 
 logger = logging.getLogger(__name__)
 
 current_user_var = ContextVar("current_user", default=None)
 current_token_var = ContextVar("current_token", default=None)
 
+# "/x*" = prefijo por segmentos ("/auth" y "/auth/login", no "/authx"); sin "*" = exacta
+DEFAULT_PUBLIC_PATHS = (
+    "/",
+    "/auth*",
+    "/docs*",
+    "/redoc*",
+    "/openapi.json",
+    "/health*",
+)
+
+
 
 def get_current_user() -> Optional[dict]:
     return current_user_var.get()
@@ -20,114 +51,187 @@ def get_current_token() -> Optional[str]:
     return current_token_var.get()
 
 
-class TokenAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware para autenticación con tokens opacos (validación vía BD)."""
-
-    def __init__(self, app):
-        super().__init__(app)
-
-    async def dispatch(self, request: Request, call_next):
-        current_user_var.set(None)
-        current_token_var.set(None)
-
-        if self._is_public_path(request.url.path):
-            return await call_next(request)
-
-        token = self._extract_token(request)
-        if not token:
-            logger.debug(f"No token provided for path: {request.url.path}")
-            return await call_next(request)
-
-        # Validar token opaco solo por BD (lookup por token + expiración)
-        user_data = await self._verify_token_in_database(token)
-
-        if not user_data:
-            logger.warning(f"Invalid or expired token for path: {request.url.path}")
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid or expired token"},
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        current_user_var.set(user_data)
-        current_token_var.set(token)
-        logger.debug(f"Token validated for user: {user_data.get('username')}")
-        return await call_next(request)
-    
-    def _extract_token(self, request: Request) -> Optional[str]:
-        """Extrae el token del header Authorization"""
-        authorization = request.headers.get("Authorization")
-        if not authorization:
+class PublicPathMatcher:
+    """Trie de segmentos de path compilado desde patrones ("/a/b" exacto, "/a*" prefijo)."""
+
+    _PREFIX = "*"  # marca de nodo: todo lo que cuelga de aquí es público
+    _EXACT = ""  # marca de nodo: el path que termina aquí es público
+
+    def __init__(self, patterns: Iterable[str]):
+        self._root: Dict[str, dict] = {}
+        for pattern in patterns:
+            prefix = pattern.endswith("*")
+            node = self._root
+            for segment in self._segments(pattern.rstrip("*")):
+                node = node.setdefault(segment, {})
+            node[self._PREFIX if prefix else self._EXACT] = {}
+
+    @staticmethod
+    def _segments(path: str):
+        return [segment for segment in path.split("/") if segment]
+
+    def matches(self, path: str) -> bool:
+        node = self._root
+        for segment in self._segments(path):
+            if self._PREFIX in node:
+                return True
+            node = node.get(segment)
+            if node is None:
+                return False
+        return self._PREFIX in node or self._EXACT in node
+
+
+@dataclass(frozen=True)
+class AuthResult:
+    token: Optional[str] = None
+    user: Optional[dict] = None
+    invalid: bool = False  # había token y no es válido
+
+
+def _request_path(scope) -> str:
+    """Path sin ROOT_PATH (cuando la app está montada bajo un prefijo)."""
+    path = scope.get("path", "")
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):] or "/"
+    return path
+
+
+def extract_bearer_token(headers: Iterable[Tuple[bytes, bytes]]) -> Optional[str]:
+    """Token del header Authorization: Bearer <token> (headers crudos del scope ASGI)."""
+    for name, value in headers:
+        if name == b"authorization":
+            authorization = value.decode("latin-1")
+            if authorization.startswith("Bearer "):
+                return authorization[7:] or None
             return None
-        
-        if authorization.startswith("Bearer "):
-            return authorization[7:]
-        
+    return None
+
+
+async def verify_token(token: str) -> Optional[dict]:
+    """Valida token opaco: primero en cache de sesiones; si no está, lookup en auth_login
+    por token, comprueba expiración y devuelve datos de usuario."""
+    try:
+        from app.modules.auth.infrastructure.session_cache import (
+            get_token_session_cache,
+            token_expiry,
+        )
+
+        session_cache = get_token_session_cache()
+        cached = session_cache.get(token)
+        if cached is not None:
+            return cached
+
+        from app.db.base import AsyncSessionLocal
+        from app.modules.auth.infrastructure.repository import SQLAlchemyAuthRepository
+        from app.core.settings import get_settings
+
+        settings = get_settings()
+        expiry_minutes = getattr(settings, "TOKEN_EXPIRATION_MINUTES", 1440)
+
+        async with AsyncSessionLocal() as session:
+            try:
+                # Un solo lookup indexado: token -> (auth_id, user_id, username, updated_at)
+                session_info = await SQLAlchemyAuthRepository(session).resolve_session(token)
+
+                if not session_info:
+                    logger.debug("Token not found in database")
+                    return None
+
+                # Expiración: el token se guardó en updated_at; válido hasta updated_at + TOKEN_EXPIRATION_MINUTES
+                expiry = token_expiry(session_info.updated_at, expiry_minutes)
+                if expiry is not None and datetime.now(timezone.utc) > expiry:
+                    logger.debug("Token expired")
+                    return None
+
+                user_data = {
+                    "user_id": str(session_info.user_id),
+                    "username": session_info.username,
+                    "created_at": session_info.updated_at.isoformat(),
+                }
+                session_cache.set(token, session_info.auth_id, user_data, expiry)
+                return user_data
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error in database token verification: {str(e)}")
+                return None
+    except Exception as e:
+        logger.error(f"Error verifying token in database: {str(e)}")
         return None
-    
-    async def _verify_token_in_database(self, token: str) -> Optional[dict]:
-        """Valida token opaco: lookup en auth_login por token, comprueba expiración y devuelve datos de usuario."""
+
+
+_default_matcher = PublicPathMatcher(DEFAULT_PUBLIC_PATHS)
+
+
+async def resolve_auth(scope, matcher: PublicPathMatcher = _default_matcher) -> AuthResult:
+    """Autentica el request una sola vez y guarda el resultado en el scope. En rutas
+    públicas el token también se resuelve (opcional); solo fuera de ellas uno inválido
+    marca el resultado como `invalid` (401)."""
+    result = scope.get(AUTH_SCOPE_KEY)
+    if result is not None:
+        return result
+    token = extract_bearer_token(scope.get("headers", []))
+    if not token:
+        result = AuthResult()
+    else:
+        user_data = await verify_token(token)
+        path = _request_path(scope)
+        if user_data:
+            logger.debug(f"Token validated for user: {user_data.get('username')}")
+            result = AuthResult(token=token, user=user_data)
+        elif matcher.matches(path):
+            # Ruta pública: el token es opcional, uno inválido no la bloquea
+            result = AuthResult()
+        else:
+            logger.warning(f"Invalid or expired token for path: {path}")
+            result = AuthResult(invalid=True)
+    scope[AUTH_SCOPE_KEY] = result
+    return result
+
+
+def _unauthorized_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=401,
+        content={"detail": "Invalid or expired token"},
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+class TokenAuthMiddleware:
+    """Middleware ASGI para autenticación con tokens opacos."""
+
+    def __init__(self, app, public_paths: Iterable[str] = DEFAULT_PUBLIC_PATHS):
+        self.app = app
+        self.matcher = PublicPathMatcher(public_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        result = await resolve_auth(scope, self.matcher)
+        if result.invalid:
+            await _unauthorized_response()(scope, receive, send)
+            return
+
+        user_token = current_user_var.set(result.user)
+        token_token = current_token_var.set(result.token)
         try:
-            from app.db.base import AsyncSessionLocal
-            from sqlalchemy.future import select
-            from app.modules.auth.domain.models import AuthModel
-            from app.modules.users.domain.models import User as UserModel
-            from app.core.settings import get_settings
-
-            settings = get_settings()
-            expiry_minutes = getattr(settings, "TOKEN_EXPIRATION_MINUTES", 1440)
-
-            async with AsyncSessionLocal() as session:
-                try:
-                    stmt = select(AuthModel).where(AuthModel.token == token)
-                    result = await session.execute(stmt)
-                    auth_model = result.scalars().first()
-
-                    if not auth_model:
-                        logger.debug("Token not found in database")
-                        return None
-
-                    # Expiración: el token se guardó en updated_at; válido hasta updated_at + TOKEN_EXPIRATION_MINUTES
-                    token_created = auth_model.updated_at or auth_model.created_at
-                    if token_created:
-                        expiry = token_created + timedelta(minutes=expiry_minutes)
-                        if datetime.utcnow() > expiry:
-                            logger.debug("Token expired")
-                            return None
-
-                    user_stmt = select(UserModel).where(
-                        UserModel.auth_id == auth_model.id,
-                        UserModel.deleted.is_(False)
-                    )
-                    user_result = await session.execute(user_stmt)
-                    user_model = user_result.scalar_one_or_none()
-
-                    if not user_model:
-                        logger.debug("User not found for auth_id")
-                        return None
-
-                    return {
-                        "user_id": str(user_model.id),
-                        "username": auth_model.username,
-                        "created_at": (auth_model.updated_at or datetime.utcnow()).isoformat(),
-                    }
-                except Exception as e:
-                    await session.rollback()
-                    logger.error(f"Error in database token verification: {str(e)}")
-                    return None
-        except Exception as e:
-            logger.error(f"Error verifying token in database: {str(e)}")
-            return None
-    
-    def _is_public_path(self, path: str) -> bool:
-        """Define rutas públicas que no requieren autenticación"""
-        public_paths = [
-            "/auth/",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/health",
-            "/",
-        ]
-        
-        return any(path.startswith(p) for p in public_paths)
+            await self.app(scope, receive, send)
+        finally:
+            current_user_var.reset(user_token)
+            current_token_var.reset(token_token)
+
+
+async def authenticate_request(request: Request) -> AuthResult:
+    """Dependencia equivalente al middleware (sin costo extra si el middleware ya corrió)."""
+    result = await resolve_auth(request.scope)
+    if result.invalid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    current_user_var.set(result.user)
+    current_token_var.set(result.token)
+    return result
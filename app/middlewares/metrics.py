@@ -0,0 +1,70 @@
+# app/middlewares/metrics.py
+"""
+Middleware ASGI de métricas HTTP (sin BaseHTTPMiddleware: no envuelve la respuesta
+ni rompe el streaming).
+
+Por request: conteo por método/ruta/status, latencia por plantilla de ruta
+("/transactions/{transaction_id}", no la URL real), requests en curso y número de
+queries SQL ejecutadas.
+"""
+import time
+
+from app.core.metrics import REGISTRY
+from app.db.instrumentation import reset_query_stats, start_query_stats, current_query_stats
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "Requests HTTP atendidas", ("method", "route", "status")
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds", "Latencia de requests HTTP por ruta", ("method", "route")
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge("http_requests_in_flight", "Requests HTTP en curso")
+HTTP_DB_QUERIES = REGISTRY.histogram(
+    "http_request_db_queries",
+    "Queries SQL por request",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope) -> str:
+    """Plantilla de la ruta resuelta por el router (FastAPI deja la ruta en scope["route"])."""
+    route = scope.get("route")
+    path = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return path or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+        token = start_query_stats()
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            method, route = scope["method"], route_template(scope)
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            stats = current_query_stats()
+            if stats is not None:
+                HTTP_DB_QUERIES.observe(stats.count, method=method, route=route)
+            reset_query_stats(token)
@@ -0,0 +1,68 @@
+# app/middlewares/sql_debug.py
+"""
+Middleware ASGI de depuración SQL (solo con SQL_QUERY_DEBUG=True).
+
+Cuenta sentencias y tiempo de BD por request, agrupa las sentencias por forma y marca
+como probable N+1 las que se repiten >= SQL_NPLUS1_THRESHOLD veces. Lo informa en
+headers de la respuesta y en el log:
+
+    X-DB-Query-Count: 14
+    X-DB-Time-Ms: 23.4
+    X-DB-Repeated-Queries: 1   (formas repetidas; detalle en el log)
+
+Los headers reflejan las queries ejecutadas hasta que empieza la respuesta; el log se
+escribe al terminar (incluye las de un StreamingResponse).
+"""
+import logging
+
+from app.db.instrumentation import current_query_stats, reset_query_stats, start_query_stats
+from app.middlewares.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+SHAPE_LOG_MAX_CHARS = 300
+
+
+class SQLDebugMiddleware:
+    def __init__(self, app, nplus1_threshold: int = 5):
+        self.app = app
+        self.nplus1_threshold = nplus1_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reutiliza el QueryStats del middleware de métricas si existe
+        token = None
+        stats = current_query_stats()
+        if stats is None:
+            token = start_query_stats()
+            stats = current_query_stats()
+        stats.track_shapes()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                repeated = stats.repeated_shapes(self.nplus1_threshold)
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.total_seconds * 1000:.1f}".encode()))
+                headers.append((b"x-db-repeated-queries", str(len(repeated)).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._report(scope, stats)
+            if token is not None:
+                reset_query_stats(token)
+
+    def _report(self, scope, stats) -> None:
+        route = f"{scope['method']} {route_template(scope)}"
+        repeated = stats.repeated_shapes(self.nplus1_threshold)
+        logger.debug(f"{route}: {stats.count} queries, {stats.total_seconds * 1000:.1f} ms")
+        for shape, times in repeated:
+            logger.warning(
+                f"Posible N+1 en {route}: {times}x {shape[:SHAPE_LOG_MAX_CHARS]}"
+            )
@@ -4,7 +4,10 @@ from typing import Optional
 
 from pydantic import BaseModel
 
-from app.modules.auth.application.use_cases import LoginUseCase, VerifyCredentialsUseCase
+from app.modules.auth.application.use_cases import (
+    LoginUseCase,
+    VerifyCredentialsUseCase,
+)
 from app.modules.auth.application.schemas.auth_schema import (
     AuthCreateCmd,
     PasswordResetRequest,
@@ -13,6 +16,8 @@ from app.modules.auth.application.schemas.auth_schema import (
 from app.modules.auth.infrastructure.dependencies import get_security_utils, get_auth_repository
 from app.modules.auth.interfaces.auth_repository import AuthRepositoryInterface
 from app.core.container import get_login_uc, get_auth_service
+from app.core.hashing_pool import PasswordHashingBusyError
+from app.core.rate_limit import RateLimitExceededError, login_guard
 
 import logging
 
@@ -42,9 +47,10 @@ async def login(
     login_data: AuthCreateCmd = Depends(get_login_data),
     use_case: LoginUseCase = Depends(get_login_uc),
 ):
+    client_ip = request.client.host if request.client else "unknown"
     try:
-        client_ip = request.client.host if request.client else "unknown"
-        result = await use_case.execute(login_data, client_ip)
+        async with login_guard(client_ip, login_data.username):
+            result = await use_case.execute(login_data, client_ip)
         content_type = request.headers.get("content-type", "")
         if content_type.startswith("application/x-www-form-urlencoded"):
             from fastapi.responses import JSONResponse
@@ -62,18 +68,23 @@ async def login(
 
 @router.post("/verify-credentials", response_model=dict)
 async def verify_credentials(
+    request: Request,
     payload: CreateAuthRequest,
     auth_repo: AuthRepositoryInterface = Depends(get_auth_repository),
 ):
     security_utils = get_security_utils()
     use_case = VerifyCredentialsUseCase(auth_repo, security_utils)
+    client_ip = request.client.host if request.client else "unknown"
     try:
-        await use_case.execute(
-            AuthCreateCmd(username=payload.username, password=payload.password)
-        )
+        async with login_guard(client_ip, payload.username):
+            await use_case.execute(
+                AuthCreateCmd(username=payload.username, password=payload.password)
+            )
         return {"valid": True}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except (PasswordHashingBusyError, RateLimitExceededError):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -128,6 +139,8 @@ async def confirm_password_reset(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except PasswordHashingBusyError:
+        raise
     except Exception as e:
         logger.error(f"Password reset error: {str(e)}")
         raise HTTPException(
@@ -37,13 +37,13 @@ class AuthService:
         if not credentials:
             raise ValueError("Credentials not found")
 
-        if not self.security_utils.verify_password(current_password, credentials.password):
+        if not await self.security_utils.verify_password_async(current_password, credentials.password):
             raise ValueError("Current password is incorrect")
 
         if not self.security_utils.is_password_strong(new_password):
             raise ValueError("New password does not meet security requirements")
 
-        hashed_password = self.security_utils.hash_password(new_password)
+        hashed_password = await self.security_utils.hash_password_async(new_password)
         await self._uow.auth_repository.update_password(credentials.id, hashed_password)
         await self._uow.commit()
         logger.info(f"Password changed for user: {user_id}")
@@ -76,7 +76,7 @@ class AuthService:
         if not self.security_utils.is_password_strong(new_password):
             raise ValueError("New password does not meet security requirements")
 
-        hashed_password = self.security_utils.hash_password(new_password)
+        hashed_password = await self.security_utils.hash_password_async(new_password)
         await self._uow.auth_repository.update_password(credentials.id, hashed_password)
         await self._uow.auth_repository.update_recovery_code(credentials.id, None)
         await self._uow.commit()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, ConfigDict
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 
 
 class AuthCreateCmd(BaseModel):
@@ -37,3 +37,17 @@ class PasswordResetConfirmRequest(BaseModel):
     username: str
     recovery_code: str
     new_password: str
+
+
+class PasswordHashSchemeCountDTO(BaseModel):
+    scheme: str
+    params: Optional[str] = None
+    count: int
+    current: bool  # esquema y parámetros actuales (no requiere rehash)
+
+
+class PasswordHashReportDTO(BaseModel):
+    total: int
+    current: int
+    legacy: int  # se migran solos en el próximo login exitoso
+    by_scheme: List[PasswordHashSchemeCountDTO]
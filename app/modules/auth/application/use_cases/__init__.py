@@ -4,6 +4,7 @@ from app.modules.auth.application.use_cases.auth_use_cases import (
     VerifyCredentialsUseCase,
     CreateAuthUseCase,
     CreateAuthService,
+    PasswordHashReportUseCase,
 )
 
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "VerifyCredentialsUseCase",
     "CreateAuthUseCase",
     "CreateAuthService",
+    "PasswordHashReportUseCase",
 ]
@@ -9,6 +9,8 @@ from app.core.unit_of_work import UnitOfWorkBase
 from app.modules.auth.application.schemas.auth_schema import (
     AuthCreateCmd,
     AuthReadDTO,
+    PasswordHashReportDTO,
+    PasswordHashSchemeCountDTO,
     TokenInfoDTO,
     UserInfoDTO,
 )
@@ -39,7 +41,7 @@ class LoginUseCase:
             logger.warning(f"Login failed: user {data.username} not found")
             raise ValueError("Invalid username or password")
 
-        is_valid = self.security_utils.verify_password(data.password, credentials.password)
+        is_valid = await self.security_utils.verify_password_async(data.password, credentials.password)
         logger.debug(f"Password verification result for {data.username}: {is_valid}")
 
         if not is_valid:
@@ -51,6 +53,8 @@ class LoginUseCase:
             logger.error(f"User not found for auth_id: {credentials.id}")
             raise ValueError("User account not found")
 
+        await self._upgrade_password_hash(credentials, data.password)
+
         access_token = self.security_utils.generate_opaque_token(
             user_id=user.id,
             username=credentials.username,
@@ -64,6 +68,18 @@ class LoginUseCase:
             user=UserInfoDTO.model_validate(user),
         )
 
+    async def _upgrade_password_hash(self, credentials: Credentials, password: str) -> None:
+        """Migra hashes legados (bcrypt/PBKDF2) o con parámetros viejos al esquema actual.
+        Se guarda en la misma transacción del login; si falla, el login sigue."""
+        if not self.security_utils.password_needs_rehash(credentials.password):
+            return
+        try:
+            new_hash = await self.security_utils.hash_password_async(password)
+            await self._uow.auth_repository.update_password(credentials.id, new_hash)
+            logger.info(f"Password hash upgraded for user: {credentials.username}")
+        except Exception as e:
+            logger.warning(f"Password rehash skipped for {credentials.username}: {str(e)}")
+
 
 class VerifyCredentialsUseCase:
     def __init__(
@@ -78,7 +94,7 @@ class VerifyCredentialsUseCase:
         credentials = await self.auth_repo.get_by_username(data.username)
         if not credentials:
             raise ValueError("Invalid username or password")
-        if not self.security_utils.verify_password(data.password, credentials.password):
+        if not await self.security_utils.verify_password_async(data.password, credentials.password):
             raise ValueError("Invalid username or password")
         return True
 
@@ -104,7 +120,7 @@ class CreateAuthUseCase:
         if not self.security_utils.is_password_strong(cmd.password):
             raise ValueError("Password does not meet security requirements")
 
-        hashed_password = self.security_utils.hash_password(cmd.password)
+        hashed_password = await self.security_utils.hash_password_async(cmd.password)
         credentials = Credentials(
             username=cmd.username,
             password=hashed_password,
@@ -122,5 +138,32 @@ class CreateAuthUseCase:
         return AuthReadDTO(id=auth_id)
 
 
+class PasswordHashReportUseCase:
+    """Reporte de hashes de contraseña por esquema: cuántos siguen en formatos legados."""
+
+    def __init__(
+        self,
+        auth_repo: AuthRepositoryInterface = Depends(get_auth_repository),
+        security_utils: SecurityUtils = Depends(get_security_utils),
+    ):
+        self.auth_repo = auth_repo
+        self.security_utils = security_utils
+
+    async def execute(self) -> PasswordHashReportDTO:
+        default = self.security_utils.password_hashers.default
+        rows = []
+        for scheme, params, count in await self.auth_repo.count_password_hashes():
+            rows.append(PasswordHashSchemeCountDTO(
+                scheme=scheme,
+                params=params,
+                count=count,
+                current=scheme == default.name and params == default.current_params,
+            ))
+        rows.sort(key=lambda r: (r.current, -r.count))
+        total = sum(r.count for r in rows)
+        current = sum(r.count for r in rows if r.current)
+        return PasswordHashReportDTO(total=total, current=current, legacy=total - current, by_scheme=rows)
+
+
 # Alias para compatibilidad con container y user_service
 CreateAuthService = CreateAuthUseCase
@@ -1,8 +1,10 @@
 # app/modules/auth/domain
 from app.modules.auth.domain.models import AuthModel
 from app.modules.auth.domain.credentials import Credentials
+from app.modules.auth.domain.session import SessionInfo
 
 __all__ = [
     "AuthModel",
     "Credentials",
+    "SessionInfo",
 ]
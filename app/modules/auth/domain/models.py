@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 import uuid
 
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import String, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,7 +12,16 @@ from app.shared.model_base import ORMBaseModel
 
 class AuthModel(ORMBaseModel):
     __tablename__ = "auth_login"
-    __table_args__ = {"schema": "user"}
+    __table_args__ = (
+        # Lookup de sesión por token: único y solo sobre tokens activos
+        Index(
+            "ux_user_auth_login_token",
+            "token",
+            unique=True,
+            postgresql_where=text("token IS NOT NULL"),
+        ),
+        {"schema": "user"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
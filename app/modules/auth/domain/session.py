@@ -0,0 +1,12 @@
+# app/modules/auth/domain/session.py
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class SessionInfo(BaseModel):
+    """Datos mínimos de una sesión activa (resueltos a partir del token opaco)."""
+    auth_id: UUID
+    user_id: UUID
+    username: str
+    updated_at: datetime
@@ -10,6 +10,7 @@ from app.core.security import SecurityUtils
 from app.core.settings import get_settings
 from app.core.oauth2_scheme import oauth2_scheme
 from app.db.base import get_db
+from app.middlewares.auth import AuthResult, authenticate_request
 from app.modules.auth.infrastructure.repository import SQLAlchemyAuthRepository
 from app.modules.auth.interfaces.auth_repository import AuthRepositoryInterface
 
@@ -24,10 +25,9 @@ async def get_auth_repository(
     return SQLAlchemyAuthRepository(db)
 
 
-def get_current_user() -> dict:
-    """Obtiene el usuario actual desde el middleware."""
-    from app.middlewares.auth import get_current_user as get_user
-    user = get_user()
+def get_current_user(auth: AuthResult = Depends(authenticate_request)) -> dict:
+    """Usuario del request (resuelto por TokenAuthMiddleware o, sin él, por la dependencia)."""
+    user = auth.user
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -37,10 +37,9 @@ def get_current_user() -> dict:
     return user  # type: ignore[return-value]
 
 
-def get_current_token() -> str:
-    """Obtiene el token actual desde el middleware."""
-    from app.middlewares.auth import get_current_token as get_token
-    token = get_token()
+def get_current_token(auth: AuthResult = Depends(authenticate_request)) -> str:
+    """Token del request (resuelto por TokenAuthMiddleware o, sin él, por la dependencia)."""
+    token = auth.token
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
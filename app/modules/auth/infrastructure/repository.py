@@ -1,25 +1,47 @@
 # com_build_api/app/auth/infrastructure/repository.py
-from typing import Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import bindparam, case, func, update
 import logging
 
 from app.modules.auth.interfaces.auth_repository import AuthRepositoryInterface
 from app.modules.auth.domain.credentials import Credentials
 from app.modules.auth.domain.models import AuthModel
+from app.modules.auth.domain.session import SessionInfo
+from app.modules.auth.infrastructure.session_cache import revoke_sessions_around_commit
+from app.modules.users.domain.models import User
+from app.shared.statement_cache import statement_cache
 
 logger = logging.getLogger(__name__)
 
+# Lookups de login y validación de token: se construyen una vez (ver statement_cache)
+_statements = statement_cache("auth")
+
+
+def _auth_by(column_name: str):
+    column = getattr(AuthModel, column_name)
+    return _statements.get_or_build(
+        ("auth_by", column_name), lambda: select(AuthModel).where(column == bindparam("value"))
+    )
+
+
+def _session_by_token():
+    return (
+        select(AuthModel.id, AuthModel.username, AuthModel.updated_at, User.id.label("user_id"))
+        .join(User, User.auth_id == AuthModel.id)
+        .where(AuthModel.token == bindparam("token"), User.deleted.is_(False))
+        .limit(1)
+    )
+
 class SQLAlchemyAuthRepository(AuthRepositoryInterface):
     def __init__(self, session: AsyncSession):
         self.session = session
     
     async def get_by_id(self, auth_id: UUID) -> Optional[Credentials]:
         try:
-            query = select(AuthModel).where(AuthModel.id == auth_id)
-            result = await self.session.execute(query)
+            result = await self.session.execute(_auth_by("id"), {"value": auth_id})
             auth_model = result.scalars().first()
             
             if not auth_model:
@@ -42,8 +64,7 @@ class SQLAlchemyAuthRepository(AuthRepositoryInterface):
         try:
             safe_username = username.lower()
             
-            query = select(AuthModel).where(AuthModel.username == safe_username)
-            result = await self.session.execute(query)
+            result = await self.session.execute(_auth_by("username"), {"value": safe_username})
             auth_model = result.scalars().first()
             
             if not auth_model:
@@ -86,6 +107,9 @@ class SQLAlchemyAuthRepository(AuthRepositoryInterface):
     
     async def update_token(self, auth_id: UUID, token: Optional[str] = None) -> bool:
         """Actualiza o revoca el token. Commit lo gestiona el Unit of Work."""
+        # El token anterior deja de ser válido: sacarlo del cache de sesiones (otra vez
+        # tras el commit del Unit of Work)
+        await revoke_sessions_around_commit(self.session, auth_id)
         stmt = (
             update(AuthModel)
             .where(AuthModel.id == auth_id)
@@ -97,8 +121,7 @@ class SQLAlchemyAuthRepository(AuthRepositoryInterface):
     async def get_by_token(self, token: str) -> Optional[Credentials]:
         """Obtiene credenciales por token"""
         try:
-            query = select(AuthModel).where(AuthModel.token == token)
-            result = await self.session.execute(query)
+            result = await self.session.execute(_auth_by("token"), {"value": token})
             auth_model = result.scalars().first()
             
             if not auth_model:
@@ -117,6 +140,27 @@ class SQLAlchemyAuthRepository(AuthRepositoryInterface):
             logger.error(f"Error in get_by_token: {str(e)}")
             raise
     
+    async def resolve_session(self, token: str) -> Optional[SessionInfo]:
+        """Resuelve la sesión de un token en una sola consulta (auth_login JOIN user),
+        trayendo solo las columnas necesarias para validar el request."""
+        try:
+            query = _statements.get_or_build("session_by_token", _session_by_token)
+            result = await self.session.execute(query, {"token": token})
+            row = result.first()
+
+            if not row:
+                return None
+
+            return SessionInfo(
+                auth_id=row.id,
+                user_id=row.user_id,
+                username=row.username,
+                updated_at=row.updated_at,
+            )
+        except Exception as e:
+            logger.error(f"Error in resolve_session: {str(e)}")
+            raise
+    
     async def update_password(self, auth_id: UUID, hashed_password: str) -> bool:
         """Actualiza contraseña. Commit lo gestiona el Unit of Work."""
         stmt = (
@@ -140,6 +184,34 @@ class SQLAlchemyAuthRepository(AuthRepositoryInterface):
     async def delete(self, auth_id: UUID) -> bool:
         """Elimina credenciales. Commit lo gestiona el Unit of Work."""
         from sqlalchemy import delete
+        await revoke_sessions_around_commit(self.session, auth_id)
         stmt = delete(AuthModel).where(AuthModel.id == auth_id)
         result = await self.session.execute(stmt)
         return result.rowcount > 0
+
+    async def count_password_hashes(self) -> List[Tuple[str, Optional[str], int]]:
+        """Agrupa los hashes por esquema y parámetros en la BD (sin traer los hashes)."""
+        password = AuthModel.password
+        is_argon2 = password.startswith("$argon2", autoescape=True)
+        is_bcrypt = password.op("~")(r"^\$2[aby]\$")
+        is_pbkdf2 = password.startswith("pbkdf2_sha256$", autoescape=True)
+        scheme = case(
+            (is_argon2, "argon2"),
+            (is_bcrypt, "bcrypt"),
+            (is_pbkdf2, "pbkdf2_sha256"),
+            else_="pbkdf2_legacy",
+        ).label("scheme")
+        params = case(
+            (is_argon2, func.substring(password, r"m=\d+,t=\d+,p=\d+")),
+            (is_bcrypt, func.split_part(password, "$", 3)),
+            (is_pbkdf2, func.split_part(password, "$", 2)),
+            else_=None,
+        ).label("params")
+        # Subconsulta: agrupar por columnas y no por expresiones con parámetros ligados
+        hashes = select(scheme, params).where(password.isnot(None)).subquery()
+        stmt = (
+            select(hashes.c.scheme, hashes.c.params, func.count().label("total"))
+            .group_by(hashes.c.scheme, hashes.c.params)
+        )
+        result = await self.session.execute(stmt)
+        return [(row.scheme, row.params, row.total) for row in result]
@@ -0,0 +1,187 @@
+# app/modules/auth/infrastructure/session_cache.py
+"""
+Cache en memoria de sesiones (token opaco -> datos de usuario).
+
+Evita abrir sesión de BD y ejecutar las consultas de validación en cada request
+autenticado. Las entradas se indexan por el hash SHA-256 del token (el token en
+claro nunca se guarda como clave), tienen TTL corto y el cache está acotado (LRU).
+La expiración real del token (updated_at + TOKEN_EXPIRATION_MINUTES) se evalúa en memoria.
+
+El cache es por proceso: la revocación se aplica de inmediato en el proceso que
+rota/revoca el token y se difunde a los demás workers por el canal de invalidación
+(app.core.cache); TOKEN_CACHE_TTL_SECONDS acota el retraso si un mensaje se pierde.
+Las escrituras de token se revocan antes y después del commit (ver
+revoke_sessions_around_commit).
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from app.core.cache import get_invalidation_bus, subscribe
+from app.core.metrics import REGISTRY, MetricFamily
+from app.core.settings import get_settings
+
+SESSION_CHANNEL = "auth:session"
+
+
+def hash_token(token: str) -> str:
+    """Hash estable del token para usarlo como clave de cache."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_expiry(issued_at: Optional[datetime], expiry_minutes: int) -> Optional[datetime]:
+    """Fecha de expiración (UTC, aware) a partir del momento de emisión del token."""
+    if issued_at is None:
+        return None
+    if issued_at.tzinfo is None:
+        issued_at = issued_at.replace(tzinfo=timezone.utc)
+    return issued_at + timedelta(minutes=expiry_minutes)
+
+
+@dataclass
+class CachedSession:
+    auth_id: UUID
+    user_data: dict
+    expires_at: Optional[datetime]  # expiración del token (UTC)
+    cached_until: float  # fin del TTL de la entrada (time.monotonic)
+
+
+class TokenSessionCache:
+    """Cache TTL/LRU acotado de sesiones validadas, con índice auth_id -> tokens."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: int = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, CachedSession]" = OrderedDict()
+        self._by_auth: Dict[UUID, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[dict]:
+        """Datos de usuario si el token está en cache, vigente y no expirado."""
+        key = hash_token(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if time.monotonic() > entry.cached_until or (
+            entry.expires_at is not None and datetime.now(timezone.utc) > entry.expires_at
+        ):
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.user_data
+
+    def set(self, token: str, auth_id: UUID, user_data: dict, expires_at: Optional[datetime]) -> None:
+        if self.max_entries <= 0:
+            return
+        key = hash_token(token)
+        self._remove(key)
+        self._entries[key] = CachedSession(
+            auth_id=auth_id,
+            user_data=user_data,
+            expires_at=expires_at,
+            cached_until=time.monotonic() + self.ttl_seconds,
+        )
+        self._by_auth.setdefault(auth_id, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def invalidate_token(self, token: str) -> None:
+        self._remove(hash_token(token))
+
+    def invalidate_auth(self, auth_id: UUID) -> None:
+        """Descarta todas las sesiones en cache de unas credenciales (rotación/revocación)."""
+        for key in list(self._by_auth.get(auth_id, ())):
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_auth.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_auth.get(entry.auth_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_auth[entry.auth_id]
+
+
+_token_session_cache: Optional[TokenSessionCache] = None
+
+
+def get_token_session_cache() -> TokenSessionCache:
+    global _token_session_cache
+    if _token_session_cache is None:
+        settings = get_settings()
+        _token_session_cache = TokenSessionCache(
+            max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS,
+        )
+        subscribe(SESSION_CHANNEL, _on_session_invalidated)
+    return _token_session_cache
+
+
+def _on_session_invalidated(auth_id: Optional[str]) -> None:
+    cache = get_token_session_cache()
+    if auth_id is None:
+        cache.clear()
+    else:
+        cache.invalidate_auth(UUID(auth_id))
+
+
+async def revoke_cached_sessions(auth_id: UUID) -> None:
+    """Descarta las sesiones en cache de unas credenciales en todos los workers."""
+    get_token_session_cache()
+    await get_invalidation_bus().publish(SESSION_CHANNEL, str(auth_id))
+
+
+# Clave en session.info: auth_ids a revocar otra vez cuando la transacción haga commit
+REVOKE_AFTER_COMMIT_INFO = "revoke_sessions_after_commit"
+
+
+async def revoke_sessions_around_commit(session, auth_id: UUID) -> None:
+    """Revoca ya y deja la revocación pendiente para después del commit (la hace
+    revoke_pending_sessions): entre ambas, un verify_token concurrente puede leer la
+    fila vieja aún confirmada y volver a cachear el token anterior."""
+    await revoke_cached_sessions(auth_id)
+    session.info.setdefault(REVOKE_AFTER_COMMIT_INFO, set()).add(auth_id)
+
+
+async def revoke_pending_sessions(session) -> None:
+    """Llamar tras el commit de `session`."""
+    for auth_id in session.info.pop(REVOKE_AFTER_COMMIT_INFO, ()):
+        await revoke_cached_sessions(auth_id)
+
+
+def discard_pending_revocations(session) -> None:
+    """Llamar tras el rollback (la fila no cambió; la revocación previa es inocua)."""
+    session.info.pop(REVOKE_AFTER_COMMIT_INFO, None)
+
+
+def _collect() -> Iterable[MetricFamily]:
+    if _token_session_cache is None:
+        return
+    stats = _token_session_cache.stats()
+    yield MetricFamily("token_session_cache_entries", "gauge", "Sesiones en cache").add(stats["entries"])
+    yield MetricFamily("token_session_cache_hits_total", "counter", "Aciertos del cache de sesiones").add(stats["hits"])
+    yield MetricFamily("token_session_cache_misses_total", "counter", "Fallos del cache de sesiones").add(stats["misses"])
+
+
+REGISTRY.register_collector(_collect)
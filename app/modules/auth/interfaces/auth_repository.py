@@ -1,9 +1,10 @@
 # com_build_api/app/auth/interfaces/auth_repository.py
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.modules.auth.domain.credentials import Credentials
+from app.modules.auth.domain.session import SessionInfo
 
 class AuthRepositoryInterface(ABC):
     @abstractmethod
@@ -26,6 +27,10 @@ class AuthRepositoryInterface(ABC):
     async def get_by_token(self, token: str) -> Optional[Credentials]:
         pass
     
+    @abstractmethod
+    async def resolve_session(self, token: str) -> Optional[SessionInfo]:
+        pass
+    
     @abstractmethod
     async def update_password(self, auth_id: UUID, hashed_password: str) -> bool:
         pass
@@ -37,3 +42,8 @@ class AuthRepositoryInterface(ABC):
     @abstractmethod
     async def delete(self, auth_id: UUID) -> bool:
         pass
+
+    @abstractmethod
+    async def count_password_hashes(self) -> List[Tuple[str, Optional[str], int]]:
+        """(esquema, parámetros, cantidad) de los hashes de contraseña guardados."""
+        pass
@@ -5,8 +5,11 @@ from app.modules.coin.adapters.dependencies.coin_dependencies import (
     get_commission_repository,
     GetTaxRateByIdUseCaseDep,
     ListTaxRatesUseCaseDep,
+    GetTaxRateAtUseCaseDep,
     CreateTaxRateUseCaseDep,
     UpdateTaxRateUseCaseDep,
+    BulkCreateTaxRatesUseCaseDep,
+    BulkUpdateTaxRatesUseCaseDep,
     DeleteTaxRateUseCaseDep,
     GetTaxRateTrialByIdUseCaseDep,
     ListTaxRateTrialsUseCaseDep,
@@ -17,7 +20,12 @@ from app.modules.coin.adapters.dependencies.coin_dependencies import (
     ListCommissionsUseCaseDep,
     CreateCommissionUseCaseDep,
     UpdateCommissionUseCaseDep,
+    BulkCreateCommissionsUseCaseDep,
+    BulkUpdateCommissionsUseCaseDep,
     DeleteCommissionUseCaseDep,
+    get_quote_service,
+    GetQuoteUseCaseDep,
+    BatchQuoteUseCaseDep,
 )
 
 __all__ = [
@@ -25,8 +33,11 @@ __all__ = [
     "get_commission_repository",
     "GetTaxRateByIdUseCaseDep",
     "ListTaxRatesUseCaseDep",
+    "GetTaxRateAtUseCaseDep",
     "CreateTaxRateUseCaseDep",
     "UpdateTaxRateUseCaseDep",
+    "BulkCreateTaxRatesUseCaseDep",
+    "BulkUpdateTaxRatesUseCaseDep",
     "DeleteTaxRateUseCaseDep",
     "get_tax_rate_trial_repository",
     "GetTaxRateTrialByIdUseCaseDep",
@@ -38,5 +49,10 @@ __all__ = [
     "ListCommissionsUseCaseDep",
     "CreateCommissionUseCaseDep",
     "UpdateCommissionUseCaseDep",
+    "BulkCreateCommissionsUseCaseDep",
+    "BulkUpdateCommissionsUseCaseDep",
     "DeleteCommissionUseCaseDep",
+    "get_quote_service",
+    "GetQuoteUseCaseDep",
+    "BatchQuoteUseCaseDep",
 ]
@@ -1,11 +1,17 @@
 # app/modules/coin/adapters/dependencies/coin_dependencies.py
 """Inyección de dependencias del módulo coin para las rutas (adapters)."""
-from typing import Annotated
+import time
+from typing import Annotated, Optional
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.core.cache import subscribe
+from app.core.catalog_cache import CATALOG_CHANNEL, CatalogNamespace
+from app.core.settings import get_settings
+from app.db.base import get_db, get_read_db
+from app.modules.coin.application.quote_service import QuoteService
+from app.modules.coin.infrastructure.pricing_loader import load_pricing_rows
 from app.modules.coin.interfaces.tax_rate_repository import TaxRateRepositoryInterface
 from app.modules.coin.interfaces.tax_rate_trial_repository import TaxRateTrialRepositoryInterface
 from app.modules.coin.interfaces.commission_repository import CommissionRepositoryInterface
@@ -17,8 +23,11 @@ from app.modules.coin.infrastructure.repository import (
 from app.modules.coin.application.use_cases import (
     GetTaxRateByIdUseCase,
     ListTaxRatesUseCase,
+    GetTaxRateAtUseCase,
     CreateTaxRateUseCase,
     UpdateTaxRateUseCase,
+    BulkCreateTaxRatesUseCase,
+    BulkUpdateTaxRatesUseCase,
     DeleteTaxRateUseCase,
     GetTaxRateTrialByIdUseCase,
     ListTaxRateTrialsUseCase,
@@ -29,10 +38,37 @@ from app.modules.coin.application.use_cases import (
     ListCommissionsUseCase,
     CreateCommissionUseCase,
     UpdateCommissionUseCase,
+    BulkCreateCommissionsUseCase,
+    BulkUpdateCommissionsUseCase,
     DeleteCommissionUseCase,
+    GetQuoteUseCase,
+    BatchQuoteUseCase,
 )
 
 
+# --- Servicio de cotización (singleton por proceso) ---
+
+_quote_service: Optional[QuoteService] = None
+
+
+def get_quote_service() -> QuoteService:
+    global _quote_service
+    if _quote_service is None:
+        _quote_service = QuoteService(
+            loader=load_pricing_rows,
+            ttl_seconds=get_settings().QUOTE_SNAPSHOT_TTL_SECONDS,
+        )
+        subscribe(CATALOG_CHANNEL, _on_pricing_invalidated)
+    return _quote_service
+
+
+async def _on_pricing_invalidated(namespace: Optional[str]) -> None:
+    """Escrituras de tasas/comisiones en cualquier worker (incluido este) recargan el
+    snapshot local: único camino de recarga tras escribir."""
+    if namespace in (None, CatalogNamespace.tax_rates, CatalogNamespace.commissions):
+        await get_quote_service().refresh_invalidated(time.monotonic())
+
+
 # --- Repositorios ---
 
 def get_tax_rate_repository(
@@ -41,26 +77,44 @@ def get_tax_rate_repository(
     return SQLAlchemyTaxRateRepository(db)
 
 
+def get_tax_rate_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> TaxRateRepositoryInterface:
+    return SQLAlchemyTaxRateRepository(db)
+
+
 def get_commission_repository(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> CommissionRepositoryInterface:
     return SQLAlchemyCommissionRepository(db)
 
 
+def get_commission_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> CommissionRepositoryInterface:
+    return SQLAlchemyCommissionRepository(db)
+
+
 # --- TaxRate: factories de casos de uso ---
 
 def get_tax_rate_by_id_uc(
-    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_repository)],
+    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_read_repository)],
 ) -> GetTaxRateByIdUseCase:
     return GetTaxRateByIdUseCase(repo)
 
 
 def list_tax_rates_uc(
-    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_repository)],
+    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_read_repository)],
 ) -> ListTaxRatesUseCase:
     return ListTaxRatesUseCase(repo)
 
 
+def get_tax_rate_at_uc(
+    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_read_repository)],
+) -> GetTaxRateAtUseCase:
+    return GetTaxRateAtUseCase(repo)
+
+
 def create_tax_rate_uc(
     repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_repository)],
 ) -> CreateTaxRateUseCase:
@@ -73,6 +127,18 @@ def update_tax_rate_uc(
     return UpdateTaxRateUseCase(repo)
 
 
+def bulk_create_tax_rates_uc(
+    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_repository)],
+) -> BulkCreateTaxRatesUseCase:
+    return BulkCreateTaxRatesUseCase(repo)
+
+
+def bulk_update_tax_rates_uc(
+    repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_repository)],
+) -> BulkUpdateTaxRatesUseCase:
+    return BulkUpdateTaxRatesUseCase(repo)
+
+
 def delete_tax_rate_uc(
     repo: Annotated[TaxRateRepositoryInterface, Depends(get_tax_rate_repository)],
 ) -> DeleteTaxRateUseCase:
@@ -87,14 +153,20 @@ def get_tax_rate_trial_repository(
     return SQLAlchemyTaxRateTrialRepository(db)
 
 
+def get_tax_rate_trial_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> TaxRateTrialRepositoryInterface:
+    return SQLAlchemyTaxRateTrialRepository(db)
+
+
 def get_tax_rate_trial_by_id_uc(
-    repo: Annotated[TaxRateTrialRepositoryInterface, Depends(get_tax_rate_trial_repository)],
+    repo: Annotated[TaxRateTrialRepositoryInterface, Depends(get_tax_rate_trial_read_repository)],
 ) -> GetTaxRateTrialByIdUseCase:
     return GetTaxRateTrialByIdUseCase(repo)
 
 
 def list_tax_rate_trials_uc(
-    repo: Annotated[TaxRateTrialRepositoryInterface, Depends(get_tax_rate_trial_repository)],
+    repo: Annotated[TaxRateTrialRepositoryInterface, Depends(get_tax_rate_trial_read_repository)],
 ) -> ListTaxRateTrialsUseCase:
     return ListTaxRateTrialsUseCase(repo)
 
@@ -120,13 +192,13 @@ def delete_tax_rate_trial_uc(
 # --- Commission: factories de casos de uso ---
 
 def get_commission_by_id_uc(
-    repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_repository)],
+    repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_read_repository)],
 ) -> GetCommissionByIdUseCase:
     return GetCommissionByIdUseCase(repo)
 
 
 def list_commissions_uc(
-    repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_repository)],
+    repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_read_repository)],
 ) -> ListCommissionsUseCase:
     return ListCommissionsUseCase(repo)
 
@@ -143,18 +215,47 @@ def update_commission_uc(
     return UpdateCommissionUseCase(repo)
 
 
+def bulk_create_commissions_uc(
+    repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_repository)],
+) -> BulkCreateCommissionsUseCase:
+    return BulkCreateCommissionsUseCase(repo)
+
+
+def bulk_update_commissions_uc(
+    repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_repository)],
+) -> BulkUpdateCommissionsUseCase:
+    return BulkUpdateCommissionsUseCase(repo)
+
+
 def delete_commission_uc(
     repo: Annotated[CommissionRepositoryInterface, Depends(get_commission_repository)],
 ) -> DeleteCommissionUseCase:
     return DeleteCommissionUseCase(repo)
 
 
+# --- Cotización ---
+
+def get_quote_uc(
+    quote_service: Annotated[QuoteService, Depends(get_quote_service)],
+) -> GetQuoteUseCase:
+    return GetQuoteUseCase(quote_service)
+
+
+def batch_quote_uc(
+    quote_service: Annotated[QuoteService, Depends(get_quote_service)],
+) -> BatchQuoteUseCase:
+    return BatchQuoteUseCase(quote_service)
+
+
 # --- Tipos anotados para inyección en rutas (sin Depends explícito en el handler) ---
 
 GetTaxRateByIdUseCaseDep = Annotated[GetTaxRateByIdUseCase, Depends(get_tax_rate_by_id_uc)]
 ListTaxRatesUseCaseDep = Annotated[ListTaxRatesUseCase, Depends(list_tax_rates_uc)]
+GetTaxRateAtUseCaseDep = Annotated[GetTaxRateAtUseCase, Depends(get_tax_rate_at_uc)]
 CreateTaxRateUseCaseDep = Annotated[CreateTaxRateUseCase, Depends(create_tax_rate_uc)]
 UpdateTaxRateUseCaseDep = Annotated[UpdateTaxRateUseCase, Depends(update_tax_rate_uc)]
+BulkCreateTaxRatesUseCaseDep = Annotated[BulkCreateTaxRatesUseCase, Depends(bulk_create_tax_rates_uc)]
+BulkUpdateTaxRatesUseCaseDep = Annotated[BulkUpdateTaxRatesUseCase, Depends(bulk_update_tax_rates_uc)]
 DeleteTaxRateUseCaseDep = Annotated[DeleteTaxRateUseCase, Depends(delete_tax_rate_uc)]
 
 GetTaxRateTrialByIdUseCaseDep = Annotated[GetTaxRateTrialByIdUseCase, Depends(get_tax_rate_trial_by_id_uc)]
@@ -167,4 +268,9 @@ GetCommissionByIdUseCaseDep = Annotated[GetCommissionByIdUseCase, Depends(get_co
 ListCommissionsUseCaseDep = Annotated[ListCommissionsUseCase, Depends(list_commissions_uc)]
 CreateCommissionUseCaseDep = Annotated[CreateCommissionUseCase, Depends(create_commission_uc)]
 UpdateCommissionUseCaseDep = Annotated[UpdateCommissionUseCase, Depends(update_commission_uc)]
+BulkCreateCommissionsUseCaseDep = Annotated[BulkCreateCommissionsUseCase, Depends(bulk_create_commissions_uc)]
+BulkUpdateCommissionsUseCaseDep = Annotated[BulkUpdateCommissionsUseCase, Depends(bulk_update_commissions_uc)]
 DeleteCommissionUseCaseDep = Annotated[DeleteCommissionUseCase, Depends(delete_commission_uc)]
+
+GetQuoteUseCaseDep = Annotated[GetQuoteUseCase, Depends(get_quote_uc)]
+BatchQuoteUseCaseDep = Annotated[BatchQuoteUseCase, Depends(batch_quote_uc)]
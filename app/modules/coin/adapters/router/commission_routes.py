@@ -1,11 +1,14 @@
 # app/modules/coin/adapters/router/commission_routes.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 from uuid import UUID
 from typing import List
 
+from app.core.catalog_cache import CatalogNamespace, catalog_response
 from app.modules.coin.application.schemas import (
     CommissionCreateCmd,
     CommissionUpdateCmd,
+    CommissionBulkCreateCmd,
+    CommissionBulkUpdateCmd,
     CommissionReadDTO,
 )
 from app.modules.coin.adapters.dependencies import (
@@ -13,6 +16,8 @@ from app.modules.coin.adapters.dependencies import (
     ListCommissionsUseCaseDep,
     CreateCommissionUseCaseDep,
     UpdateCommissionUseCaseDep,
+    BulkCreateCommissionsUseCaseDep,
+    BulkUpdateCommissionsUseCaseDep,
     DeleteCommissionUseCaseDep,
 )
 
@@ -20,8 +25,8 @@ router = APIRouter(prefix="/commission", tags=["commission"])
 
 
 @router.get("", response_model=List[CommissionReadDTO])
-async def list_commissions(use_case: ListCommissionsUseCaseDep):
-    return await use_case.execute()
+async def list_commissions(request: Request, use_case: ListCommissionsUseCaseDep):
+    return await catalog_response(request, CatalogNamespace.commissions, use_case.execute)
 
 
 @router.get("/{commission_id}", response_model=CommissionReadDTO)
@@ -48,6 +53,24 @@ async def update_commission(cmd: CommissionUpdateCmd, use_case: UpdateCommission
     return entity
 
 
+@router.post("/bulk", response_model=List[CommissionReadDTO], status_code=status.HTTP_201_CREATED)
+async def bulk_create_commissions(cmd: CommissionBulkCreateCmd, use_case: BulkCreateCommissionsUseCaseDep):
+    """Crea hasta 500 comisiones en un solo INSERT y un commit (todo o nada)."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.put("/bulk", response_model=List[CommissionReadDTO])
+async def bulk_update_commissions(cmd: CommissionBulkUpdateCmd, use_case: BulkUpdateCommissionsUseCaseDep):
+    """Actualiza hasta 500 comisiones en un commit; si algún id no existe no se aplica ninguno."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.delete("/{commission_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_commission(commission_id: UUID, use_case: DeleteCommissionUseCaseDep):
     await use_case.execute(commission_id)
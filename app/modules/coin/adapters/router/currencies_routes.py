@@ -1,7 +1,8 @@
 # app/modules/coin/adapters/router/currencies_routes.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from typing import List
 
+from app.core.catalog_cache import CatalogNamespace, catalog_response
 from app.modules.coin.application.schemas import CurrencyReadDTO
 from app.modules.coin.domain.enums import Currency
 
@@ -9,6 +10,8 @@ router = APIRouter(tags=["currencies"])
 
 
 @router.get("/currencies", response_model=List[CurrencyReadDTO])
-async def list_currencies() -> List[CurrencyReadDTO]:
+async def list_currencies(request: Request):
     """Lista las monedas disponibles (enum)."""
-    return [CurrencyReadDTO(**c.to_dto()) for c in Currency]
+    async def load() -> List[CurrencyReadDTO]:
+        return [CurrencyReadDTO(**c.to_dto()) for c in Currency]
+    return await catalog_response(request, CatalogNamespace.currencies, load)
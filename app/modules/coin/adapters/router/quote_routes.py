@@ -0,0 +1,36 @@
+# app/modules/coin/adapters/router/quote_routes.py
+from decimal import Decimal
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.modules.coin.application.schemas import (
+    QuoteReadDTO,
+    QuoteBatchCmd,
+    QuoteBatchItemDTO,
+)
+from app.modules.coin.adapters.dependencies import GetQuoteUseCaseDep, BatchQuoteUseCaseDep
+from app.modules.coin.domain.enums import Currency
+
+router = APIRouter(prefix="/quote", tags=["quote"])
+
+
+@router.get("", response_model=QuoteReadDTO)
+async def get_quote(
+    use_case: GetQuoteUseCaseDep,
+    coin_a: Currency = Query(..., alias="from"),
+    coin_b: Currency = Query(..., alias="to"),
+    amount: Decimal = Query(..., gt=0),
+):
+    """Cotiza una conversión con la tasa y el tramo de comisión vigentes (desde memoria)."""
+    try:
+        return await use_case.execute(coin_a, coin_b, amount)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/batch", response_model=List[QuoteBatchItemDTO])
+async def batch_quote(cmd: QuoteBatchCmd, use_case: BatchQuoteUseCaseDep):
+    """Cotiza hasta 500 conversiones (from, to, amount) en un request. Los resultados
+    respetan el orden de entrada; un item inválido trae `error` en vez de `quote`."""
+    return await use_case.execute(cmd)
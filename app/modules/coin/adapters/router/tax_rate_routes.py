@@ -1,18 +1,28 @@
 # app/modules/coin/adapters/router/tax_rate_routes.py
-from fastapi import APIRouter, HTTPException, status
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from uuid import UUID
 from typing import List
 
+from app.core.catalog_cache import CatalogNamespace, catalog_response
 from app.modules.coin.application.schemas import (
     TaxRateCreateCmd,
     TaxRateUpdateCmd,
+    TaxRateBulkCreateCmd,
+    TaxRateBulkUpdateCmd,
     TaxRateReadDTO,
+    TaxRateHistoryReadDTO,
 )
+from app.modules.coin.domain.enums import Currency
 from app.modules.coin.adapters.dependencies import (
     GetTaxRateByIdUseCaseDep,
     ListTaxRatesUseCaseDep,
+    GetTaxRateAtUseCaseDep,
     CreateTaxRateUseCaseDep,
     UpdateTaxRateUseCaseDep,
+    BulkCreateTaxRatesUseCaseDep,
+    BulkUpdateTaxRatesUseCaseDep,
     DeleteTaxRateUseCaseDep,
 )
 
@@ -20,8 +30,22 @@ router = APIRouter(prefix="/tax-rate", tags=["tax-rate"])
 
 
 @router.get("", response_model=List[TaxRateReadDTO])
-async def list_tax_rates(use_case: ListTaxRatesUseCaseDep):
-    return await use_case.execute()
+async def list_tax_rates(request: Request, use_case: ListTaxRatesUseCaseDep):
+    return await catalog_response(request, CatalogNamespace.tax_rates, use_case.execute)
+
+
+@router.get("/history/at", response_model=TaxRateHistoryReadDTO)
+async def get_tax_rate_at(
+    use_case: GetTaxRateAtUseCaseDep,
+    coin_a: Currency = Query(..., alias="from"),
+    coin_b: Currency = Query(..., alias="to"),
+    at: datetime = Query(..., description="Instante consultado (ISO 8601)"),
+):
+    """Tasa del par vigente en `at` según el historial (aunque luego se haya editado)."""
+    entity = await use_case.execute(coin_a, coin_b, at)
+    if not entity:
+        raise HTTPException(status_code=404, detail="No había tasa vigente para el par en esa fecha")
+    return entity
 
 
 @router.get("/{tax_rate_id}", response_model=TaxRateReadDTO)
@@ -48,6 +72,24 @@ async def update_tax_rate(cmd: TaxRateUpdateCmd, use_case: UpdateTaxRateUseCaseD
     return entity
 
 
+@router.post("/bulk", response_model=List[TaxRateReadDTO], status_code=status.HTTP_201_CREATED)
+async def bulk_create_tax_rates(cmd: TaxRateBulkCreateCmd, use_case: BulkCreateTaxRatesUseCaseDep):
+    """Crea hasta 500 tasas en un solo INSERT y un commit (todo o nada)."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.put("/bulk", response_model=List[TaxRateReadDTO])
+async def bulk_update_tax_rates(cmd: TaxRateBulkUpdateCmd, use_case: BulkUpdateTaxRatesUseCaseDep):
+    """Actualiza hasta 500 tasas en un commit; si algún id no existe no se aplica ninguno."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.delete("/{tax_rate_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_tax_rate(tax_rate_id: UUID, use_case: DeleteTaxRateUseCaseDep):
     await use_case.execute(tax_rate_id)
@@ -1,8 +1,9 @@
 # app/modules/coin/adapters/router/tax_rate_trial_routes.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 from uuid import UUID
 from typing import List
 
+from app.core.catalog_cache import CatalogNamespace, catalog_response
 from app.modules.coin.application.schemas import (
     TaxRateTrialCreateCmd,
     TaxRateTrialUpdateCmd,
@@ -20,8 +21,8 @@ router = APIRouter(prefix="/tax-rate-trial", tags=["tax-rate-trial"])
 
 
 @router.get("", response_model=List[TaxRateTrialReadDTO])
-async def list_tax_rate_trials(use_case: ListTaxRateTrialsUseCaseDep):
-    return await use_case.execute()
+async def list_tax_rate_trials(request: Request, use_case: ListTaxRateTrialsUseCaseDep):
+    return await catalog_response(request, CatalogNamespace.tax_rate_trials, use_case.execute)
 
 
 @router.get("/{tax_rate_trial_id}", response_model=TaxRateTrialReadDTO)
@@ -0,0 +1,78 @@
+# app/modules/coin/application/quote_service.py
+"""Servicio de cotización: mantiene en memoria la matriz de precios por par de monedas."""
+import asyncio
+import logging
+import time
+from decimal import Decimal
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.quote import Quote, QuoteMatrix
+
+logger = logging.getLogger(__name__)
+
+# Devuelve (tax_rates, commissions) vigentes
+PricingLoader = Callable[[], Awaitable[Tuple[Sequence, Sequence]]]
+
+
+class QuoteService:
+    """Cotiza sin tocar la BD usando un snapshot en memoria.
+
+    El snapshot se recarga al recibir la invalidación del catálogo que publica cada
+    escritura de TaxRate/Commission (en el worker que escribe y en los demás, ver
+    `refresh_invalidated`) y, como red de seguridad, cuando supera `ttl_seconds`.
+    """
+
+    def __init__(self, loader: PricingLoader, ttl_seconds: int = 300):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._matrix: Optional[QuoteMatrix] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._matrix is not None and (time.monotonic() - self._loaded_at) < self.ttl_seconds
+
+    async def snapshot(self) -> QuoteMatrix:
+        if self._is_fresh():
+            return self._matrix
+        async with self._lock:
+            if not self._is_fresh():
+                await self.refresh()
+            return self._matrix
+
+    async def refresh(self) -> None:
+        # Antigüedad desde el inicio de la carga: una escritura confirmada durante la
+        # carga puede no estar incluida
+        started = time.monotonic()
+        tax_rates, commissions = await self._loader()
+        self._matrix = QuoteMatrix.build(tax_rates, commissions)
+        self._loaded_at = started
+        logger.debug(f"Snapshot de cotización recargado: {len(self._matrix)} pares")
+
+    def invalidate(self) -> None:
+        """Fuerza la recarga en la próxima cotización."""
+        self._matrix = None
+
+    async def refresh_invalidated(self, invalidated_at: float) -> None:
+        """Recarga tras una invalidación recibida en `invalidated_at` (time.monotonic),
+        salvo que otra recarga ya haya empezado después (varios mensajes por escritura o
+        uno propio y otro del bus)."""
+        try:
+            async with self._lock:
+                if self._matrix is not None and self._loaded_at >= invalidated_at:
+                    return
+                await self.refresh()
+        except Exception as e:
+            logger.error(f"Error recargando snapshot de cotización: {str(e)}")
+            self.invalidate()
+
+    async def quote(self, coin_a: Currency, coin_b: Currency, amount: Decimal) -> Quote:
+        matrix = await self.snapshot()
+        return matrix.quote(coin_a, coin_b, amount)
+
+    async def quote_many(
+        self, items: Sequence[Tuple[Currency, Currency, Decimal]]
+    ) -> List[Union[Quote, ValueError]]:
+        matrix = await self.snapshot()
+        return matrix.quote_many(items)
@@ -3,7 +3,10 @@ from app.modules.coin.application.schemas.coin_schema import CurrencyReadDTO
 from app.modules.coin.application.schemas.tax_rate_schema import (
     TaxRateCreateCmd,
     TaxRateUpdateCmd,
+    TaxRateBulkCreateCmd,
+    TaxRateBulkUpdateCmd,
     TaxRateReadDTO,
+    TaxRateHistoryReadDTO,
 )
 from app.modules.coin.application.schemas.tax_rate_trial_schema import (
     TaxRateTrialCreateCmd,
@@ -13,18 +16,35 @@ from app.modules.coin.application.schemas.tax_rate_trial_schema import (
 from app.modules.coin.application.schemas.commission_schema import (
     CommissionCreateCmd,
     CommissionUpdateCmd,
+    CommissionBulkCreateCmd,
+    CommissionBulkUpdateCmd,
     CommissionReadDTO,
 )
+from app.modules.coin.application.schemas.quote_schema import (
+    QuoteReadDTO,
+    QuoteItemCmd,
+    QuoteBatchCmd,
+    QuoteBatchItemDTO,
+)
 
 __all__ = [
     "CurrencyReadDTO",
     "TaxRateCreateCmd",
     "TaxRateUpdateCmd",
+    "TaxRateBulkCreateCmd",
+    "TaxRateBulkUpdateCmd",
     "TaxRateReadDTO",
+    "TaxRateHistoryReadDTO",
     "TaxRateTrialCreateCmd",
     "TaxRateTrialUpdateCmd",
     "TaxRateTrialReadDTO",
     "CommissionCreateCmd",
     "CommissionUpdateCmd",
+    "CommissionBulkCreateCmd",
+    "CommissionBulkUpdateCmd",
     "CommissionReadDTO",
+    "QuoteReadDTO",
+    "QuoteItemCmd",
+    "QuoteBatchCmd",
+    "QuoteBatchItemDTO",
 ]
@@ -1,12 +1,13 @@
 # app/modules/coin/application/schemas/commission_schema.py
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.coin.domain.enums import Currency
+from app.shared.bulk import BULK_MAX_ITEMS
 
 
 class CommissionCreateCmd(BaseModel):
@@ -28,6 +29,14 @@ class CommissionUpdateCmd(BaseModel):
     max_amount: Optional[float] = None
 
 
+class CommissionBulkCreateCmd(BaseModel):
+    items: List[CommissionCreateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class CommissionBulkUpdateCmd(BaseModel):
+    items: List[CommissionUpdateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class CommissionReadDTO(BaseModel):
     id: UUID
     coin_a: Currency
@@ -0,0 +1,42 @@
+# app/modules/coin/application/schemas/quote_schema.py
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.modules.coin.domain.enums import Currency
+
+
+class QuoteReadDTO(BaseModel):
+    coin_a: Currency
+    coin_b: Currency
+    amount: Decimal
+    tax: Decimal
+    tax_rate_id: UUID
+    commission_id: Optional[UUID] = None
+    commission_percentage: Decimal
+    commission_amount: Decimal
+    net_amount: Decimal
+    destination_amount: Decimal
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class QuoteItemCmd(BaseModel):
+    coin_a: Currency = Field(alias="from")
+    coin_b: Currency = Field(alias="to")
+    amount: Decimal = Field(gt=0)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class QuoteBatchCmd(BaseModel):
+    items: List[QuoteItemCmd] = Field(min_length=1, max_length=500)
+
+
+class QuoteBatchItemDTO(BaseModel):
+    """Resultado de un item del batch: `quote` o `error` (p. ej. par no configurado)."""
+    index: int
+    quote: Optional[QuoteReadDTO] = None
+    error: Optional[str] = None
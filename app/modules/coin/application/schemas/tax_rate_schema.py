@@ -1,12 +1,13 @@
 # app/modules/coin/application/schemas/tax_rate_schema.py
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.coin.domain.enums import Currency
+from app.shared.bulk import BULK_MAX_ITEMS
 
 
 class TaxRateCreateCmd(BaseModel):
@@ -22,6 +23,14 @@ class TaxRateUpdateCmd(BaseModel):
     tax: Optional[Decimal] = Field(default=None, description="Tasa decimal, ej. 0.622")
 
 
+class TaxRateBulkCreateCmd(BaseModel):
+    items: List[TaxRateCreateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaxRateBulkUpdateCmd(BaseModel):
+    items: List[TaxRateUpdateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class TaxRateReadDTO(BaseModel):
     id: UUID
     coin_a: Currency
@@ -32,3 +41,16 @@ class TaxRateReadDTO(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaxRateHistoryReadDTO(BaseModel):
+    """Tramo del historial: valor de la tasa vigente en [valid_from, valid_to)."""
+    id: UUID
+    tax_rate_id: UUID
+    coin_a: Currency
+    coin_b: Currency
+    tax: Decimal
+    valid_from: datetime
+    valid_to: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
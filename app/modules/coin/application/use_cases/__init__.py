@@ -2,8 +2,11 @@
 from app.modules.coin.application.use_cases.tax_rate_use_cases import (
     GetTaxRateByIdUseCase,
     ListTaxRatesUseCase,
+    GetTaxRateAtUseCase,
     CreateTaxRateUseCase,
     UpdateTaxRateUseCase,
+    BulkCreateTaxRatesUseCase,
+    BulkUpdateTaxRatesUseCase,
     DeleteTaxRateUseCase,
 )
 from app.modules.coin.application.use_cases.tax_rate_trial_use_cases import (
@@ -18,14 +21,20 @@ from app.modules.coin.application.use_cases.commission_use_cases import (
     ListCommissionsUseCase,
     CreateCommissionUseCase,
     UpdateCommissionUseCase,
+    BulkCreateCommissionsUseCase,
+    BulkUpdateCommissionsUseCase,
     DeleteCommissionUseCase,
 )
+from app.modules.coin.application.use_cases.quote_use_cases import GetQuoteUseCase, BatchQuoteUseCase
 
 __all__ = [
     "GetTaxRateByIdUseCase",
     "ListTaxRatesUseCase",
+    "GetTaxRateAtUseCase",
     "CreateTaxRateUseCase",
     "UpdateTaxRateUseCase",
+    "BulkCreateTaxRatesUseCase",
+    "BulkUpdateTaxRatesUseCase",
     "DeleteTaxRateUseCase",
     "GetTaxRateTrialByIdUseCase",
     "ListTaxRateTrialsUseCase",
@@ -36,5 +45,9 @@ __all__ = [
     "ListCommissionsUseCase",
     "CreateCommissionUseCase",
     "UpdateCommissionUseCase",
+    "BulkCreateCommissionsUseCase",
+    "BulkUpdateCommissionsUseCase",
     "DeleteCommissionUseCase",
+    "GetQuoteUseCase",
+    "BatchQuoteUseCase",
 ]
@@ -3,11 +3,14 @@
 from uuid import UUID
 from typing import List, Optional
 
-from app.modules.coin.domain.models import Commission
+from app.core.catalog_cache import CatalogNamespace, invalidate_catalog
+from app.shared.bulk import create_rows, update_rows, validate_update_targets
 from app.modules.coin.interfaces.commission_repository import CommissionRepositoryInterface
 from app.modules.coin.application.schemas.commission_schema import (
     CommissionCreateCmd,
     CommissionUpdateCmd,
+    CommissionBulkCreateCmd,
+    CommissionBulkUpdateCmd,
     CommissionReadDTO,
 )
 
@@ -37,7 +40,7 @@ class CreateCommissionUseCase:
         self.repo = repo
 
     async def execute(self, cmd: CommissionCreateCmd) -> CommissionReadDTO:
-        entity = Commission(
+        values = dict(
             coin_a=cmd.coin_a,
             coin_b=cmd.coin_b,
             percentage=cmd.percentage,
@@ -45,9 +48,9 @@ class CreateCommissionUseCase:
             min_amount=cmd.min_amount,
             max_amount=cmd.max_amount,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
         await self.repo.commit()
-        await self.repo.refresh(saved)
+        await invalidate_catalog(CatalogNamespace.commissions)
         return CommissionReadDTO.model_validate(saved)
 
 
@@ -56,27 +59,42 @@ class UpdateCommissionUseCase:
         self.repo = repo
 
     async def execute(self, cmd: CommissionUpdateCmd) -> Optional[CommissionReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.coin_a is not None:
-            entity.coin_a = cmd.coin_a
-        if cmd.coin_b is not None:
-            entity.coin_b = cmd.coin_b
-        if cmd.percentage is not None:
-            entity.percentage = cmd.percentage
-        if cmd.reverse is not None:
-            entity.reverse = cmd.reverse
-        if cmd.min_amount is not None:
-            entity.min_amount = cmd.min_amount
-        if cmd.max_amount is not None:
-            entity.max_amount = cmd.max_amount
-        await self.repo.update(entity)
         await self.repo.commit()
-        await self.repo.refresh(entity)
+        await invalidate_catalog(CatalogNamespace.commissions)
         return CommissionReadDTO.model_validate(entity)
 
 
+class BulkCreateCommissionsUseCase:
+    """Alta de N filas: un INSERT multi-fila y un solo commit."""
+
+    def __init__(self, repo: CommissionRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: CommissionBulkCreateCmd) -> List[CommissionReadDTO]:
+        saved = await self.repo.add_many(create_rows(cmd.items))
+        await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.commissions)
+        return [CommissionReadDTO.model_validate(x) for x in saved]
+
+
+class BulkUpdateCommissionsUseCase:
+    """Actualización de N filas: valida todos los ids, UPDATE en lote y un solo commit."""
+
+    def __init__(self, repo: CommissionRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: CommissionBulkUpdateCmd) -> List[CommissionReadDTO]:
+        await validate_update_targets(self.repo, [item.id for item in cmd.items])
+        updated = await self.repo.update_many(update_rows(cmd.items))
+        await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.commissions)
+        return [CommissionReadDTO.model_validate(x) for x in updated]
+
+
 class DeleteCommissionUseCase:
     def __init__(self, repo: CommissionRepositoryInterface):
         self.repo = repo
@@ -84,3 +102,4 @@ class DeleteCommissionUseCase:
     async def execute(self, commission_id: UUID) -> None:
         await self.repo.delete(commission_id)
         await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.commissions)
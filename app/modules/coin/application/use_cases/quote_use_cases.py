@@ -0,0 +1,39 @@
+# app/modules/coin/application/use_cases/quote_use_cases.py
+"""Casos de uso de cotización (sin acceso a BD: usan el snapshot del QuoteService)."""
+from decimal import Decimal
+from typing import List
+
+from app.modules.coin.application.quote_service import QuoteService
+from app.modules.coin.application.schemas.quote_schema import (
+    QuoteBatchCmd,
+    QuoteBatchItemDTO,
+    QuoteReadDTO,
+)
+from app.modules.coin.domain.enums import Currency
+
+
+class GetQuoteUseCase:
+    def __init__(self, quote_service: QuoteService):
+        self.quote_service = quote_service
+
+    async def execute(self, coin_a: Currency, coin_b: Currency, amount: Decimal) -> QuoteReadDTO:
+        quote = await self.quote_service.quote(coin_a, coin_b, amount)
+        return QuoteReadDTO.model_validate(quote)
+
+
+class BatchQuoteUseCase:
+    """Cotiza N conversiones en un solo request, devolviendo resultados en orden de entrada."""
+
+    def __init__(self, quote_service: QuoteService):
+        self.quote_service = quote_service
+
+    async def execute(self, cmd: QuoteBatchCmd) -> List[QuoteBatchItemDTO]:
+        results = await self.quote_service.quote_many(
+            [(item.coin_a, item.coin_b, item.amount) for item in cmd.items]
+        )
+        return [
+            QuoteBatchItemDTO(index=i, error=str(result))
+            if isinstance(result, ValueError)
+            else QuoteBatchItemDTO(index=i, quote=QuoteReadDTO.model_validate(result))
+            for i, result in enumerate(results)
+        ]
@@ -2,7 +2,7 @@
 from uuid import UUID
 from typing import List, Optional
 
-from app.modules.coin.domain.models import TaxRateTrial
+from app.core.catalog_cache import CatalogNamespace, invalidate_catalog
 from app.modules.coin.interfaces.tax_rate_trial_repository import TaxRateTrialRepositoryInterface
 from app.modules.coin.application.schemas.tax_rate_trial_schema import (
     TaxRateTrialCreateCmd,
@@ -36,14 +36,14 @@ class CreateTaxRateTrialUseCase:
         self.repo = repo
 
     async def execute(self, cmd: TaxRateTrialCreateCmd) -> TaxRateTrialReadDTO:
-        entity = TaxRateTrial(
+        values = dict(
             coin_a=cmd.coin_a,
             coin_b=cmd.coin_b,
             tax=cmd.tax,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
         await self.repo.commit()
-        await self.repo.refresh(saved)
+        await invalidate_catalog(CatalogNamespace.tax_rate_trials)
         return TaxRateTrialReadDTO.model_validate(saved)
 
 
@@ -52,18 +52,12 @@ class UpdateTaxRateTrialUseCase:
         self.repo = repo
 
     async def execute(self, cmd: TaxRateTrialUpdateCmd) -> Optional[TaxRateTrialReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.coin_a is not None:
-            entity.coin_a = cmd.coin_a
-        if cmd.coin_b is not None:
-            entity.coin_b = cmd.coin_b
-        if cmd.tax is not None:
-            entity.tax = cmd.tax
-        await self.repo.update(entity)
         await self.repo.commit()
-        await self.repo.refresh(entity)
+        await invalidate_catalog(CatalogNamespace.tax_rate_trials)
         return TaxRateTrialReadDTO.model_validate(entity)
 
 
@@ -74,3 +68,4 @@ class DeleteTaxRateTrialUseCase:
     async def execute(self, tax_rate_trial_id: UUID) -> None:
         await self.repo.delete(tax_rate_trial_id)
         await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.tax_rate_trials)
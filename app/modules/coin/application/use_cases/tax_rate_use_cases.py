@@ -1,14 +1,20 @@
 # app/modules/coin/application/use_cases/tax_rate_use_cases.py
 """Casos de uso CRUD para TaxRate."""
+from datetime import datetime
 from uuid import UUID
 from typing import List, Optional
 
-from app.modules.coin.domain.models import TaxRate
+from app.core.catalog_cache import CatalogNamespace, invalidate_catalog
+from app.shared.bulk import create_rows, update_rows, validate_update_targets
+from app.modules.coin.domain.enums import Currency
 from app.modules.coin.interfaces.tax_rate_repository import TaxRateRepositoryInterface
 from app.modules.coin.application.schemas.tax_rate_schema import (
     TaxRateCreateCmd,
     TaxRateUpdateCmd,
+    TaxRateBulkCreateCmd,
+    TaxRateBulkUpdateCmd,
     TaxRateReadDTO,
+    TaxRateHistoryReadDTO,
 )
 
 
@@ -32,19 +38,33 @@ class ListTaxRatesUseCase:
         return [TaxRateReadDTO.model_validate(x) for x in items]
 
 
+class GetTaxRateAtUseCase:
+    """Tasa de un par vigente en un instante dado (desde el historial)."""
+
+    def __init__(self, repo: TaxRateRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, coin_a: Currency, coin_b: Currency, at: datetime) -> Optional[TaxRateHistoryReadDTO]:
+        entity = await self.repo.rate_at(coin_a, coin_b, at)
+        if not entity:
+            return None
+        return TaxRateHistoryReadDTO.model_validate(entity)
+
+
 class CreateTaxRateUseCase:
     def __init__(self, repo: TaxRateRepositoryInterface):
         self.repo = repo
 
     async def execute(self, cmd: TaxRateCreateCmd) -> TaxRateReadDTO:
-        entity = TaxRate(
+        values = dict(
             coin_a=cmd.coin_a,
             coin_b=cmd.coin_b,
             tax=cmd.tax,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
+        await self.repo.record_history([saved.id])
         await self.repo.commit()
-        await self.repo.refresh(saved)
+        await invalidate_catalog(CatalogNamespace.tax_rates)
         return TaxRateReadDTO.model_validate(saved)
 
 
@@ -53,25 +73,53 @@ class UpdateTaxRateUseCase:
         self.repo = repo
 
     async def execute(self, cmd: TaxRateUpdateCmd) -> Optional[TaxRateReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.coin_a is not None:
-            entity.coin_a = cmd.coin_a
-        if cmd.coin_b is not None:
-            entity.coin_b = cmd.coin_b
-        if cmd.tax is not None:
-            entity.tax = cmd.tax
-        await self.repo.update(entity)
+        if values:
+            await self.repo.record_history([entity.id])
         await self.repo.commit()
-        await self.repo.refresh(entity)
+        await invalidate_catalog(CatalogNamespace.tax_rates)
         return TaxRateReadDTO.model_validate(entity)
 
 
+class BulkCreateTaxRatesUseCase:
+    """Alta de N filas: un INSERT multi-fila y un solo commit."""
+
+    def __init__(self, repo: TaxRateRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: TaxRateBulkCreateCmd) -> List[TaxRateReadDTO]:
+        saved = await self.repo.add_many(create_rows(cmd.items))
+        await self.repo.record_history([x.id for x in saved])
+        await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.tax_rates)
+        return [TaxRateReadDTO.model_validate(x) for x in saved]
+
+
+class BulkUpdateTaxRatesUseCase:
+    """Actualización de N filas: valida todos los ids, UPDATE en lote y un solo commit."""
+
+    def __init__(self, repo: TaxRateRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: TaxRateBulkUpdateCmd) -> List[TaxRateReadDTO]:
+        await validate_update_targets(self.repo, [item.id for item in cmd.items])
+        rows = update_rows(cmd.items)
+        updated = await self.repo.update_many(rows)
+        await self.repo.record_history([row["id"] for row in rows if len(row) > 1])
+        await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.tax_rates)
+        return [TaxRateReadDTO.model_validate(x) for x in updated]
+
+
 class DeleteTaxRateUseCase:
     def __init__(self, repo: TaxRateRepositoryInterface):
         self.repo = repo
 
     async def execute(self, tax_rate_id: UUID) -> None:
         await self.repo.delete(tax_rate_id)
+        await self.repo.close_history([tax_rate_id])
         await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.tax_rates)
@@ -1,5 +1,5 @@
 # app/modules/coin/domain
-from app.modules.coin.domain.models import TaxRate, Commission
+from app.modules.coin.domain.models import TaxRate, TaxRateHistory, Commission
 from app.modules.coin.domain.enums import Currency, currency_display
 
-__all__ = ["TaxRate", "Commission", "Currency", "currency_display"]
+__all__ = ["TaxRate", "TaxRateHistory", "Commission", "Currency", "currency_display"]
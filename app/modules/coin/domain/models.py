@@ -1,9 +1,13 @@
 # app/modules/coin/domain/models.py
+from datetime import datetime
 from typing import Optional
+from uuid import UUID as PyUUID
 
-from sqlalchemy import Numeric
+from sqlalchemy import DateTime, ForeignKey, Numeric
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.db.configuration_hour import local_now
 from app.modules.coin.domain.enums import Currency, CurrencyEnumType
 from app.shared.model_base import ORMBaseModel
 
@@ -18,6 +22,23 @@ class TaxRate(ORMBaseModel):
     coin_b: Mapped[Currency] = mapped_column(CurrencyEnumType, nullable=False, index=True)
 
 
+class TaxRateHistory(ORMBaseModel):
+    """Historial append-only de TaxRate: valor vigente en [valid_from, valid_to) (valid_to NULL = vigente)."""
+    __tablename__ = "tax_rate_history"
+    __table_args__ = {"schema": "coin"}
+
+    tax_rate_id: Mapped[PyUUID] = mapped_column(
+        PgUUID(as_uuid=True), ForeignKey("coin.tax_rate.id"), nullable=False
+    )
+    coin_a: Mapped[Currency] = mapped_column(CurrencyEnumType, nullable=False)
+    coin_b: Mapped[Currency] = mapped_column(CurrencyEnumType, nullable=False)
+    tax: Mapped[float] = mapped_column(Numeric(20, 8), nullable=False)
+    valid_from: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=local_now()
+    )
+    valid_to: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
 class TaxRateTrial(ORMBaseModel):
     """Tasa prueba entre dos monedas (coin_a → coin_b) con valor tax. Misma estructura que TaxRate."""
     __tablename__ = "tax_rate_trial"
@@ -0,0 +1,162 @@
+# app/modules/coin/domain/quote.py
+"""
+Cotización de conversiones (lógica pura, sin BD).
+
+Matriz (coin_a, coin_b) -> (tax, tramos de comisión ordenados por min_amount).
+Fórmula:
+    commission_amount  = amount * percentage / 100
+    net_amount         = amount - commission_amount
+    destination_amount = net_amount * tax
+"""
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from app.modules.coin.domain.enums import Currency
+
+MONEY_QUANT = Decimal("0.01")
+HUNDRED = Decimal("100")
+
+
+def to_decimal(value) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+@dataclass(frozen=True)
+class CommissionTier:
+    commission_id: UUID
+    percentage: Decimal
+    reverse: Decimal
+    min_amount: Optional[Decimal]
+    max_amount: Optional[Decimal]
+
+    def covers(self, amount: Decimal) -> bool:
+        if self.min_amount is not None and amount < self.min_amount:
+            return False
+        if self.max_amount is not None and amount > self.max_amount:
+            return False
+        return True
+
+
+@dataclass
+class PairPricing:
+    tax_rate_id: UUID
+    tax: Decimal
+    tiers: List[CommissionTier] = field(default_factory=list)
+    _tier_mins: List[Decimal] = field(default_factory=list, repr=False)
+
+    def finalize(self) -> None:
+        """Ordena tramos por min_amount (None = sin mínimo) para búsqueda binaria."""
+        self.tiers.sort(key=lambda t: t.min_amount if t.min_amount is not None else Decimal("-Infinity"))
+        self._tier_mins = [
+            t.min_amount if t.min_amount is not None else Decimal("-Infinity") for t in self.tiers
+        ]
+
+    def tier_for(self, amount: Decimal) -> Optional[CommissionTier]:
+        """Tramo más específico (mayor min_amount <= amount) que cubre el monto."""
+        idx = bisect_right(self._tier_mins, amount) - 1
+        while idx >= 0:
+            tier = self.tiers[idx]
+            if tier.covers(amount):
+                return tier
+            idx -= 1
+        return None
+
+
+@dataclass(frozen=True)
+class Quote:
+    coin_a: Currency
+    coin_b: Currency
+    amount: Decimal
+    tax: Decimal
+    tax_rate_id: UUID
+    commission_id: Optional[UUID]
+    commission_percentage: Decimal
+    commission_amount: Decimal
+    net_amount: Decimal
+    destination_amount: Decimal
+
+
+class QuoteMatrix:
+    """Snapshot inmutable de precios por par de monedas."""
+
+    def __init__(self, pairs: Dict[Tuple[Currency, Currency], PairPricing]):
+        self._pairs = pairs
+
+    @classmethod
+    def build(cls, tax_rates: Iterable, commissions: Iterable) -> "QuoteMatrix":
+        """Construye la matriz a partir de filas TaxRate y Commission (no eliminadas).
+        Si hay varias tasas para un par, gana la actualizada más recientemente."""
+        latest: Dict[Tuple[Currency, Currency], object] = {}
+        for rate in tax_rates:
+            key = (Currency(rate.coin_a), Currency(rate.coin_b))
+            current = latest.get(key)
+            if current is None or rate.updated_at > current.updated_at:
+                latest[key] = rate
+
+        pairs = {
+            key: PairPricing(tax_rate_id=rate.id, tax=to_decimal(rate.tax))
+            for key, rate in latest.items()
+        }
+        for c in commissions:
+            pricing = pairs.get((Currency(c.coin_a), Currency(c.coin_b)))
+            if pricing is None:
+                continue
+            pricing.tiers.append(CommissionTier(
+                commission_id=c.id,
+                percentage=to_decimal(c.percentage),
+                reverse=to_decimal(c.reverse),
+                min_amount=to_decimal(c.min_amount) if c.min_amount is not None else None,
+                max_amount=to_decimal(c.max_amount) if c.max_amount is not None else None,
+            ))
+        for pricing in pairs.values():
+            pricing.finalize()
+        return cls(pairs)
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def quote(self, coin_a: Currency, coin_b: Currency, amount: Decimal) -> Quote:
+        """Cotiza una conversión. Lanza ValueError si el par no está configurado."""
+        amount = to_decimal(amount)
+        if amount <= 0:
+            raise ValueError("El monto debe ser mayor que 0")
+        pricing = self._pairs.get((coin_a, coin_b))
+        if pricing is None:
+            raise ValueError(f"No hay tasa configurada para {coin_a.value} -> {coin_b.value}")
+
+        tier = pricing.tier_for(amount)
+        percentage = tier.percentage if tier else Decimal("0")
+        commission_amount = (amount * percentage / HUNDRED).quantize(MONEY_QUANT, ROUND_HALF_UP)
+        net_amount = amount - commission_amount
+        destination_amount = (net_amount * pricing.tax).quantize(MONEY_QUANT, ROUND_HALF_UP)
+
+        return Quote(
+            coin_a=coin_a,
+            coin_b=coin_b,
+            amount=amount,
+            tax=pricing.tax,
+            tax_rate_id=pricing.tax_rate_id,
+            commission_id=tier.commission_id if tier else None,
+            commission_percentage=percentage,
+            commission_amount=commission_amount,
+            net_amount=net_amount,
+            destination_amount=destination_amount,
+        )
+
+    def quote_many(
+        self, items: Sequence[Tuple[Currency, Currency, Decimal]]
+    ) -> List[Union[Quote, ValueError]]:
+        """Cotiza varias conversiones sobre el mismo snapshot, en una pasada y en el
+        orden de entrada. Los items inválidos devuelven su ValueError en su posición."""
+        results: List[Union[Quote, ValueError]] = []
+        for coin_a, coin_b, amount in items:
+            try:
+                results.append(self.quote(coin_a, coin_b, amount))
+            except ValueError as e:
+                results.append(e)
+        return results
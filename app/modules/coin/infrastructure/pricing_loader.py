@@ -0,0 +1,16 @@
+# app/modules/coin/infrastructure/pricing_loader.py
+from typing import Sequence, Tuple
+
+from app.db.base import AsyncSessionLocal
+from app.modules.coin.infrastructure.repository import (
+    SQLAlchemyCommissionRepository,
+    SQLAlchemyTaxRateRepository,
+)
+
+
+async def load_pricing_rows() -> Tuple[Sequence, Sequence]:
+    """Carga tasas y comisiones vigentes con sesión propia (fuera del ciclo del request)."""
+    async with AsyncSessionLocal() as session:
+        tax_rates = await SQLAlchemyTaxRateRepository(session).list()
+        commissions = await SQLAlchemyCommissionRepository(session).list()
+        return tax_rates, commissions
@@ -1,12 +1,16 @@
 # app/modules/coin/infrastructure/repository.py
 from __future__ import annotations
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.coin.domain.models import TaxRate, TaxRateTrial, Commission
+from app.db.configuration_hour import local_now
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRate, TaxRateHistory, TaxRateTrial, Commission
 from app.modules.coin.interfaces.tax_rate_repository import TaxRateRepositoryInterface
 from app.modules.coin.interfaces.tax_rate_trial_repository import TaxRateTrialRepositoryInterface
 from app.modules.coin.interfaces.commission_repository import CommissionRepositoryInterface
@@ -17,6 +21,52 @@ class SQLAlchemyTaxRateRepository(BaseAsyncRepository[TaxRate], TaxRateRepositor
     def __init__(self, db: AsyncSession):
         super().__init__(TaxRate, db)
 
+    async def record_history(self, tax_rate_ids: Sequence[UUID]) -> None:
+        """Cierra el tramo vigente de cada tasa y abre uno con su valor actual, leído de
+        tax_rate en la misma transacción (2 statements para N tasas). now() es el inicio
+        de la transacción: valid_to del tramo anterior == valid_from del nuevo."""
+        if not tax_rate_ids:
+            return
+        await self.close_history(tax_rate_ids)
+        columns = ["id", "tax_rate_id", "coin_a", "coin_b", "tax", "valid_from"]
+        source = select(
+            func.gen_random_uuid(),
+            TaxRate.id,
+            TaxRate.coin_a,
+            TaxRate.coin_b,
+            TaxRate.tax,
+            local_now(),
+        ).where(TaxRate.id.in_(set(tax_rate_ids)), TaxRate.deleted.is_(False))
+        await self.session.execute(insert(TaxRateHistory.__table__).from_select(columns, source))
+
+    async def close_history(self, tax_rate_ids: Sequence[UUID]) -> None:
+        """Cierra (valid_to = ahora) el tramo abierto de cada tasa, p. ej. al eliminarla."""
+        if not tax_rate_ids:
+            return
+        stmt = (
+            update(TaxRateHistory)
+            .where(TaxRateHistory.tax_rate_id.in_(set(tax_rate_ids)), TaxRateHistory.valid_to.is_(None))
+            .values(valid_to=local_now())
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def rate_at(self, coin_a: Currency, coin_b: Currency, at: datetime) -> Optional[TaxRateHistory]:
+        """Tasa del par vigente en `at`: una búsqueda por índice (coin_a, coin_b, valid_from DESC)."""
+        stmt = (
+            select(TaxRateHistory)
+            .where(
+                TaxRateHistory.coin_a == coin_a,
+                TaxRateHistory.coin_b == coin_b,
+                TaxRateHistory.valid_from <= at,
+                or_(TaxRateHistory.valid_to.is_(None), TaxRateHistory.valid_to > at),
+            )
+            .order_by(TaxRateHistory.valid_from.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
 
 class SQLAlchemyTaxRateTrialRepository(BaseAsyncRepository[TaxRateTrial], TaxRateTrialRepositoryInterface):
     def __init__(self, db: AsyncSession):
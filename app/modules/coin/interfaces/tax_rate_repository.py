@@ -1,7 +1,24 @@
-# app/modules/coin/interfaces/tax_rate_repository.py
+from abc import abstractmethod
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
 from app.shared.interface_base import BaseRepositoryInterface
-from app.modules.coin.domain.models import TaxRate
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRate, TaxRateHistory
 
 
 class TaxRateRepositoryInterface(BaseRepositoryInterface[TaxRate]):
     """Puerto de persistencia para TaxRate."""
+
+    @abstractmethod
+    async def record_history(self, tax_rate_ids: Sequence[UUID]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close_history(self, tax_rate_ids: Sequence[UUID]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rate_at(self, coin_a: Currency, coin_b: Currency, at: datetime) -> Optional[TaxRateHistory]:
+        raise NotImplementedError
@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db
 from app.core.containers.common import get_security_utils
 from app.core.containers.unit_of_work import get_unit_of_work
 from app.modules.users.infrastructure.unit_of_work import AsyncUserAuthUnitOfWork
@@ -34,6 +34,12 @@ def get_integration_repository(
     return SQLAlchemyIntegrationRepository(db)
 
 
+def get_integration_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> IntegrationRepositoryInterface:
+    return SQLAlchemyIntegrationRepository(db)
+
+
 def get_social_account_repository(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> SocialAccountRepositoryInterface:
@@ -41,13 +47,13 @@ def get_social_account_repository(
 
 
 def get_integration_by_id_uc(
-    repo: Annotated[IntegrationRepositoryInterface, Depends(get_integration_repository)],
+    repo: Annotated[IntegrationRepositoryInterface, Depends(get_integration_read_repository)],
 ) -> GetIntegrationByIdUseCase:
     return GetIntegrationByIdUseCase(repo)
 
 
 def list_integrations_uc(
-    repo: Annotated[IntegrationRepositoryInterface, Depends(get_integration_repository)],
+    repo: Annotated[IntegrationRepositoryInterface, Depends(get_integration_read_repository)],
 ) -> ListIntegrationsUseCase:
     return ListIntegrationsUseCase(repo)
 
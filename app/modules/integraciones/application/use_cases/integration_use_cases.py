@@ -3,7 +3,6 @@
 from uuid import UUID
 from typing import List, Optional
 
-from app.modules.integraciones.domain.models import Integration
 from app.modules.integraciones.interfaces.integration_repository import IntegrationRepositoryInterface
 from app.modules.integraciones.application.schemas.integration_schema import (
     IntegrationCreateCmd,
@@ -37,16 +36,15 @@ class CreateIntegrationUseCase:
         self.repo = repo
 
     async def execute(self, cmd: IntegrationCreateCmd) -> IntegrationReadDTO:
-        entity = Integration(
+        values = dict(
             name=cmd.name,
             provider=cmd.provider,
             integration_type=cmd.integration_type,
             config=cmd.config,
             description=cmd.description,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
         await self.repo.commit()
-        await self.repo.refresh(saved)
         return IntegrationReadDTO.model_validate(saved)
 
 
@@ -55,22 +53,11 @@ class UpdateIntegrationUseCase:
         self.repo = repo
 
     async def execute(self, cmd: IntegrationUpdateCmd) -> Optional[IntegrationReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.name is not None:
-            entity.name = cmd.name
-        if cmd.provider is not None:
-            entity.provider = cmd.provider
-        if cmd.integration_type is not None:
-            entity.integration_type = cmd.integration_type
-        if cmd.config is not None:
-            entity.config = cmd.config
-        if cmd.description is not None:
-            entity.description = cmd.description
-        await self.repo.update(entity)
         await self.repo.commit()
-        await self.repo.refresh(entity)
         return IntegrationReadDTO.model_validate(entity)
 
 
@@ -163,7 +163,7 @@ class OAuthCallbackUseCase:
                 if not auth_id:
                     username = email.lower()
                     password = secrets.token_urlsafe(32)
-                    hashed = self.security_utils.hash_password(password)
+                    hashed = await self.security_utils.hash_password_async(password)
                     credentials = Credentials(
                         username=username,
                         password=hashed,
@@ -200,7 +200,7 @@ class OAuthCallbackUseCase:
         if not email and await self.uow.auth_repository.get_by_username(username):
             username = f"{provider}_{provider_user_id}_{uuid4().hex[:8]}"
         password = secrets.token_urlsafe(32)
-        hashed = self.security_utils.hash_password(password)
+        hashed = await self.security_utils.hash_password_async(password)
         credentials = Credentials(
             username=username,
             password=hashed,
@@ -0,0 +1 @@
+# app/modules/transactions/adapters/cli
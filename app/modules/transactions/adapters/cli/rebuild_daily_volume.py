@@ -0,0 +1,37 @@
+# app/modules/transactions/adapters/cli/rebuild_daily_volume.py
+"""
+Recalcula el rollup transaction.daily_volume desde transactions.
+
+    DB_POOL_PROFILE=migration python -m app.modules.transactions.adapters.cli.rebuild_daily_volume \
+        [--from 2025-01-01] [--to 2025-01-31]
+
+Sin rango recalcula todo (el perfil migration quita el statement_timeout). Bloquea las escrituras del rollup (no las de transactions)
+hasta terminar.
+"""
+import argparse
+import asyncio
+from datetime import date
+from typing import Optional
+
+from app.db.base import AsyncSessionLocal
+from app.modules.transactions.application.use_cases import RebuildDailyVolumeUseCase
+from app.modules.transactions.infrastructure.daily_volume_repository import SQLAlchemyDailyVolumeRepository
+
+
+async def rebuild(date_from: Optional[date], date_to: Optional[date]) -> int:
+    async with AsyncSessionLocal() as session:
+        use_case = RebuildDailyVolumeUseCase(SQLAlchemyDailyVolumeRepository(session))
+        return await use_case.execute(date_from, date_to)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recalcula transaction.daily_volume")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+    rows = asyncio.run(rebuild(args.date_from, args.date_to))
+    print(f"daily_volume: {rows} filas recalculadas")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,20 @@ from app.modules.transactions.adapters.dependencies.transaction_dependencies imp
     get_transaction_repository,
     GetTransactionByIdUseCaseDep,
     ListTransactionsUseCaseDep,
+    ExportTransactionsUseCaseDep,
+    GetTransactionRatesUseCaseDep,
     CreateTransactionUseCaseDep,
     UpdateTransactionUseCaseDep,
     DeleteTransactionUseCaseDep,
+    ListDailyVolumeUseCaseDep,
     get_bank_repository,
     GetBankByIdUseCaseDep,
     ListBanksUseCaseDep,
     ListBanksByCountryCurrencyUseCaseDep,
     CreateBankUseCaseDep,
     UpdateBankUseCaseDep,
+    BulkCreateBanksUseCaseDep,
+    BulkUpdateBanksUseCaseDep,
     DeleteBankUseCaseDep,
     get_bank_account_repository,
     GetBankAccountByIdUseCaseDep,
@@ -24,6 +29,8 @@ from app.modules.transactions.adapters.dependencies.transaction_dependencies imp
     ListCouponsUseCaseDep,
     CreateCouponUseCaseDep,
     UpdateCouponUseCaseDep,
+    BulkCreateCouponsUseCaseDep,
+    BulkUpdateCouponsUseCaseDep,
     DeleteCouponUseCaseDep,
 )
 
@@ -31,15 +38,20 @@ __all__ = [
     "get_transaction_repository",
     "GetTransactionByIdUseCaseDep",
     "ListTransactionsUseCaseDep",
+    "ExportTransactionsUseCaseDep",
+    "GetTransactionRatesUseCaseDep",
     "CreateTransactionUseCaseDep",
     "UpdateTransactionUseCaseDep",
     "DeleteTransactionUseCaseDep",
+    "ListDailyVolumeUseCaseDep",
     "get_bank_repository",
     "GetBankByIdUseCaseDep",
     "ListBanksUseCaseDep",
     "ListBanksByCountryCurrencyUseCaseDep",
     "CreateBankUseCaseDep",
     "UpdateBankUseCaseDep",
+    "BulkCreateBanksUseCaseDep",
+    "BulkUpdateBanksUseCaseDep",
     "DeleteBankUseCaseDep",
     "get_bank_account_repository",
     "GetBankAccountByIdUseCaseDep",
@@ -52,5 +64,7 @@ __all__ = [
     "ListCouponsUseCaseDep",
     "CreateCouponUseCaseDep",
     "UpdateCouponUseCaseDep",
+    "BulkCreateCouponsUseCaseDep",
+    "BulkUpdateCouponsUseCaseDep",
     "DeleteCouponUseCaseDep",
 ]
@@ -1,30 +1,38 @@
 # app/modules/transactions/adapters/dependencies/transaction_dependencies.py
 """Inyección de dependencias del módulo transactions para las rutas."""
-from typing import Annotated
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import AsyncSessionLocal, get_db, get_read_db
 from app.modules.transactions.interfaces.transaction_repository import TransactionRepositoryInterface
 from app.modules.transactions.interfaces.bank_repository import BankRepositoryInterface
 from app.modules.transactions.interfaces.bank_account_repository import BankAccountRepositoryInterface
 from app.modules.transactions.interfaces.coupon_repository import CouponRepositoryInterface
+from app.modules.transactions.interfaces.daily_volume_repository import DailyVolumeRepositoryInterface
 from app.modules.transactions.infrastructure.repository import SQLAlchemyTransactionRepository
 from app.modules.transactions.infrastructure.bank_repository import SQLAlchemyBankRepository
 from app.modules.transactions.infrastructure.bank_account_repository import SQLAlchemyBankAccountRepository
 from app.modules.transactions.infrastructure.coupon_repository import SQLAlchemyCouponRepository
+from app.modules.transactions.infrastructure.daily_volume_repository import SQLAlchemyDailyVolumeRepository
 from app.modules.transactions.application.use_cases import (
     GetTransactionByIdUseCase,
     ListTransactionsUseCase,
+    ExportTransactionsUseCase,
+    GetTransactionRatesUseCase,
     CreateTransactionUseCase,
     UpdateTransactionUseCase,
     DeleteTransactionUseCase,
+    ListDailyVolumeUseCase,
     GetBankByIdUseCase,
     ListBanksUseCase,
     ListBanksByCountryCurrencyUseCase,
     CreateBankUseCase,
     UpdateBankUseCase,
+    BulkCreateBanksUseCase,
+    BulkUpdateBanksUseCase,
     DeleteBankUseCase,
     GetBankAccountByIdUseCase,
     ListBankAccountsUseCase,
@@ -35,6 +43,8 @@ from app.modules.transactions.application.use_cases import (
     ListCouponsUseCase,
     CreateCouponUseCase,
     UpdateCouponUseCase,
+    BulkCreateCouponsUseCase,
+    BulkUpdateCouponsUseCase,
     DeleteCouponUseCase,
 )
 
@@ -45,41 +55,89 @@ def get_transaction_repository(
     return SQLAlchemyTransactionRepository(db)
 
 
+def get_transaction_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> TransactionRepositoryInterface:
+    return SQLAlchemyTransactionRepository(db)
+
+
+def get_daily_volume_repository(
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> DailyVolumeRepositoryInterface:
+    return SQLAlchemyDailyVolumeRepository(db)
+
+
+def get_daily_volume_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> DailyVolumeRepositoryInterface:
+    return SQLAlchemyDailyVolumeRepository(db)
+
+
 def get_transaction_by_id_uc(
-    repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_repository)],
+    repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_read_repository)],
 ) -> GetTransactionByIdUseCase:
     return GetTransactionByIdUseCase(repo)
 
 
 def list_transactions_uc(
-    repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_repository)],
+    repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_read_repository)],
 ) -> ListTransactionsUseCase:
     return ListTransactionsUseCase(repo)
 
 
+@asynccontextmanager
+async def transaction_repository_scope() -> AsyncIterator[TransactionRepositoryInterface]:
+    """Repositorio con sesión propia, para trabajo que sigue vivo tras cerrar el request
+    (ej. cuerpo de un StreamingResponse)."""
+    async with AsyncSessionLocal() as session:
+        yield SQLAlchemyTransactionRepository(session)
+
+
+def export_transactions_uc() -> ExportTransactionsUseCase:
+    return ExportTransactionsUseCase(transaction_repository_scope)
+
+
+def get_transaction_rates_uc(
+    repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_read_repository)],
+) -> GetTransactionRatesUseCase:
+    return GetTransactionRatesUseCase(repo)
+
+
 def create_transaction_uc(
     repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_repository)],
+    volume_repo: Annotated[DailyVolumeRepositoryInterface, Depends(get_daily_volume_repository)],
 ) -> CreateTransactionUseCase:
-    return CreateTransactionUseCase(repo)
+    return CreateTransactionUseCase(repo, volume_repo)
 
 
 def update_transaction_uc(
     repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_repository)],
+    volume_repo: Annotated[DailyVolumeRepositoryInterface, Depends(get_daily_volume_repository)],
 ) -> UpdateTransactionUseCase:
-    return UpdateTransactionUseCase(repo)
+    return UpdateTransactionUseCase(repo, volume_repo)
 
 
 def delete_transaction_uc(
     repo: Annotated[TransactionRepositoryInterface, Depends(get_transaction_repository)],
+    volume_repo: Annotated[DailyVolumeRepositoryInterface, Depends(get_daily_volume_repository)],
 ) -> DeleteTransactionUseCase:
-    return DeleteTransactionUseCase(repo)
+    return DeleteTransactionUseCase(repo, volume_repo)
+
+
+def list_daily_volume_uc(
+    repo: Annotated[DailyVolumeRepositoryInterface, Depends(get_daily_volume_read_repository)],
+) -> ListDailyVolumeUseCase:
+    return ListDailyVolumeUseCase(repo)
 
 
 GetTransactionByIdUseCaseDep = Annotated[GetTransactionByIdUseCase, Depends(get_transaction_by_id_uc)]
 ListTransactionsUseCaseDep = Annotated[ListTransactionsUseCase, Depends(list_transactions_uc)]
+ExportTransactionsUseCaseDep = Annotated[ExportTransactionsUseCase, Depends(export_transactions_uc)]
+GetTransactionRatesUseCaseDep = Annotated[GetTransactionRatesUseCase, Depends(get_transaction_rates_uc)]
 CreateTransactionUseCaseDep = Annotated[CreateTransactionUseCase, Depends(create_transaction_uc)]
 UpdateTransactionUseCaseDep = Annotated[UpdateTransactionUseCase, Depends(update_transaction_uc)]
 DeleteTransactionUseCaseDep = Annotated[DeleteTransactionUseCase, Depends(delete_transaction_uc)]
+ListDailyVolumeUseCaseDep = Annotated[ListDailyVolumeUseCase, Depends(list_daily_volume_uc)]
 
 
 # Bank
@@ -89,20 +147,26 @@ def get_bank_repository(
     return SQLAlchemyBankRepository(db)
 
 
+def get_bank_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> BankRepositoryInterface:
+    return SQLAlchemyBankRepository(db)
+
+
 def get_bank_by_id_uc(
-    repo: Annotated[BankRepositoryInterface, Depends(get_bank_repository)],
+    repo: Annotated[BankRepositoryInterface, Depends(get_bank_read_repository)],
 ) -> GetBankByIdUseCase:
     return GetBankByIdUseCase(repo)
 
 
 def list_banks_uc(
-    repo: Annotated[BankRepositoryInterface, Depends(get_bank_repository)],
+    repo: Annotated[BankRepositoryInterface, Depends(get_bank_read_repository)],
 ) -> ListBanksUseCase:
     return ListBanksUseCase(repo)
 
 
 def list_banks_by_country_currency_uc(
-    repo: Annotated[BankRepositoryInterface, Depends(get_bank_repository)],
+    repo: Annotated[BankRepositoryInterface, Depends(get_bank_read_repository)],
 ) -> ListBanksByCountryCurrencyUseCase:
     return ListBanksByCountryCurrencyUseCase(repo)
 
@@ -119,6 +183,18 @@ def update_bank_uc(
     return UpdateBankUseCase(repo)
 
 
+def bulk_create_banks_uc(
+    repo: Annotated[BankRepositoryInterface, Depends(get_bank_repository)],
+) -> BulkCreateBanksUseCase:
+    return BulkCreateBanksUseCase(repo)
+
+
+def bulk_update_banks_uc(
+    repo: Annotated[BankRepositoryInterface, Depends(get_bank_repository)],
+) -> BulkUpdateBanksUseCase:
+    return BulkUpdateBanksUseCase(repo)
+
+
 def delete_bank_uc(
     repo: Annotated[BankRepositoryInterface, Depends(get_bank_repository)],
 ) -> DeleteBankUseCase:
@@ -130,6 +206,8 @@ ListBanksUseCaseDep = Annotated[ListBanksUseCase, Depends(list_banks_uc)]
 ListBanksByCountryCurrencyUseCaseDep = Annotated[ListBanksByCountryCurrencyUseCase, Depends(list_banks_by_country_currency_uc)]
 CreateBankUseCaseDep = Annotated[CreateBankUseCase, Depends(create_bank_uc)]
 UpdateBankUseCaseDep = Annotated[UpdateBankUseCase, Depends(update_bank_uc)]
+BulkCreateBanksUseCaseDep = Annotated[BulkCreateBanksUseCase, Depends(bulk_create_banks_uc)]
+BulkUpdateBanksUseCaseDep = Annotated[BulkUpdateBanksUseCase, Depends(bulk_update_banks_uc)]
 DeleteBankUseCaseDep = Annotated[DeleteBankUseCase, Depends(delete_bank_uc)]
 
 
@@ -140,14 +218,20 @@ def get_bank_account_repository(
     return SQLAlchemyBankAccountRepository(db)
 
 
+def get_bank_account_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> BankAccountRepositoryInterface:
+    return SQLAlchemyBankAccountRepository(db)
+
+
 def get_bank_account_by_id_uc(
-    repo: Annotated[BankAccountRepositoryInterface, Depends(get_bank_account_repository)],
+    repo: Annotated[BankAccountRepositoryInterface, Depends(get_bank_account_read_repository)],
 ) -> GetBankAccountByIdUseCase:
     return GetBankAccountByIdUseCase(repo)
 
 
 def list_bank_accounts_uc(
-    repo: Annotated[BankAccountRepositoryInterface, Depends(get_bank_account_repository)],
+    repo: Annotated[BankAccountRepositoryInterface, Depends(get_bank_account_read_repository)],
 ) -> ListBankAccountsUseCase:
     return ListBankAccountsUseCase(repo)
 
@@ -184,14 +268,20 @@ def get_coupon_repository(
     return SQLAlchemyCouponRepository(db)
 
 
+def get_coupon_read_repository(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> CouponRepositoryInterface:
+    return SQLAlchemyCouponRepository(db)
+
+
 def get_coupon_by_id_uc(
-    repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_repository)],
+    repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_read_repository)],
 ) -> GetCouponByIdUseCase:
     return GetCouponByIdUseCase(repo)
 
 
 def list_coupons_uc(
-    repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_repository)],
+    repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_read_repository)],
 ) -> ListCouponsUseCase:
     return ListCouponsUseCase(repo)
 
@@ -208,6 +298,18 @@ def update_coupon_uc(
     return UpdateCouponUseCase(repo)
 
 
+def bulk_create_coupons_uc(
+    repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_repository)],
+) -> BulkCreateCouponsUseCase:
+    return BulkCreateCouponsUseCase(repo)
+
+
+def bulk_update_coupons_uc(
+    repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_repository)],
+) -> BulkUpdateCouponsUseCase:
+    return BulkUpdateCouponsUseCase(repo)
+
+
 def delete_coupon_uc(
     repo: Annotated[CouponRepositoryInterface, Depends(get_coupon_repository)],
 ) -> DeleteCouponUseCase:
@@ -218,4 +320,6 @@ GetCouponByIdUseCaseDep = Annotated[GetCouponByIdUseCase, Depends(get_coupon_by_
 ListCouponsUseCaseDep = Annotated[ListCouponsUseCase, Depends(list_coupons_uc)]
 CreateCouponUseCaseDep = Annotated[CreateCouponUseCase, Depends(create_coupon_uc)]
 UpdateCouponUseCaseDep = Annotated[UpdateCouponUseCase, Depends(update_coupon_uc)]
+BulkCreateCouponsUseCaseDep = Annotated[BulkCreateCouponsUseCase, Depends(bulk_create_coupons_uc)]
+BulkUpdateCouponsUseCaseDep = Annotated[BulkUpdateCouponsUseCase, Depends(bulk_update_coupons_uc)]
 DeleteCouponUseCaseDep = Annotated[DeleteCouponUseCase, Depends(delete_coupon_uc)]
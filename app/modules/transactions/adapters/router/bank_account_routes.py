@@ -1,9 +1,11 @@
 # app/modules/transactions/adapters/router/bank_account_routes.py
 from uuid import UUID
-from typing import List
+from typing import List, Union
 
 from fastapi import APIRouter, HTTPException, status
 
+from app.core.pagination.cursor import CursorPage
+from app.core.pagination.dependencies import CursorParamsDep
 from app.modules.transactions.application.schemas import (
     BankAccountCreateCmd,
     BankAccountUpdateCmd,
@@ -20,9 +22,13 @@ from app.modules.transactions.adapters.dependencies import (
 router = APIRouter(prefix="/bank-accounts", tags=["bank-accounts"])
 
 
-@router.get("/", response_model=List[BankAccountReadDTO])
-async def list_bank_accounts(use_case: ListBankAccountsUseCaseDep):
-    return await use_case.execute()
+@router.get("/", response_model=Union[CursorPage[BankAccountReadDTO], List[BankAccountReadDTO]])
+async def list_bank_accounts(use_case: ListBankAccountsUseCaseDep, page: CursorParamsDep):
+    """Sin `limit`/`cursor` devuelve la lista completa; con ellos, una página keyset."""
+    try:
+        return await use_case.execute(page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{bank_account_id}", response_model=BankAccountReadDTO)
@@ -2,11 +2,14 @@
 from uuid import UUID
 from typing import List
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 
+from app.core.catalog_cache import CatalogNamespace, catalog_response
 from app.modules.transactions.application.schemas import (
     BankCreateCmd,
     BankUpdateCmd,
+    BankBulkCreateCmd,
+    BankBulkUpdateCmd,
     BankReadDTO,
     BanksByCountryCurrencyDTO,
 )
@@ -16,6 +19,8 @@ from app.modules.transactions.adapters.dependencies import (
     ListBanksByCountryCurrencyUseCaseDep,
     CreateBankUseCaseDep,
     UpdateBankUseCaseDep,
+    BulkCreateBanksUseCaseDep,
+    BulkUpdateBanksUseCaseDep,
     DeleteBankUseCaseDep,
 )
 
@@ -23,14 +28,16 @@ router = APIRouter(prefix="/banks", tags=["banks"])
 
 
 @router.get("/", response_model=List[BankReadDTO])
-async def list_banks(use_case: ListBanksUseCaseDep):
-    return await use_case.execute()
+async def list_banks(request: Request, use_case: ListBanksUseCaseDep):
+    return await catalog_response(request, CatalogNamespace.banks, use_case.execute)
 
 
 @router.get("/by-country-currency", response_model=BanksByCountryCurrencyDTO)
-async def list_banks_by_country_currency(use_case: ListBanksByCountryCurrencyUseCaseDep):
+async def list_banks_by_country_currency(request: Request, use_case: ListBanksByCountryCurrencyUseCaseDep):
     """Devuelve bancos agrupados por país (PE, BR) y moneda (PEN, USD, BRL)."""
-    return await use_case.execute()
+    return await catalog_response(
+        request, CatalogNamespace.banks, use_case.execute, key="by_country_currency"
+    )
 
 
 @router.get("/{bank_id}", response_model=BankReadDTO)
@@ -57,6 +64,24 @@ async def update_bank(cmd: BankUpdateCmd, use_case: UpdateBankUseCaseDep):
     return entity
 
 
+@router.post("/bulk", response_model=List[BankReadDTO], status_code=status.HTTP_201_CREATED)
+async def bulk_create_banks(cmd: BankBulkCreateCmd, use_case: BulkCreateBanksUseCaseDep):
+    """Crea hasta 500 bancos en un solo INSERT y un commit (todo o nada)."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.put("/bulk", response_model=List[BankReadDTO])
+async def bulk_update_banks(cmd: BankBulkUpdateCmd, use_case: BulkUpdateBanksUseCaseDep):
+    """Actualiza hasta 500 bancos en un commit; si algún id no existe no se aplica ninguno."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.delete("/{bank_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_bank(bank_id: UUID, use_case: DeleteBankUseCaseDep):
     await use_case.execute(bank_id)
@@ -7,6 +7,8 @@ from fastapi import APIRouter, HTTPException, status
 from app.modules.transactions.application.schemas import (
     CouponCreateCmd,
     CouponUpdateCmd,
+    CouponBulkCreateCmd,
+    CouponBulkUpdateCmd,
     CouponReadDTO,
 )
 from app.modules.transactions.adapters.dependencies import (
@@ -14,6 +16,8 @@ from app.modules.transactions.adapters.dependencies import (
     ListCouponsUseCaseDep,
     CreateCouponUseCaseDep,
     UpdateCouponUseCaseDep,
+    BulkCreateCouponsUseCaseDep,
+    BulkUpdateCouponsUseCaseDep,
     DeleteCouponUseCaseDep,
 )
 
@@ -49,6 +53,24 @@ async def update_coupon(cmd: CouponUpdateCmd, use_case: UpdateCouponUseCaseDep):
     return entity
 
 
+@router.post("/bulk", response_model=List[CouponReadDTO], status_code=status.HTTP_201_CREATED)
+async def bulk_create_coupons(cmd: CouponBulkCreateCmd, use_case: BulkCreateCouponsUseCaseDep):
+    """Crea hasta 500 cupones en un solo INSERT y un commit (todo o nada)."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.put("/bulk", response_model=List[CouponReadDTO])
+async def bulk_update_coupons(cmd: CouponBulkUpdateCmd, use_case: BulkUpdateCouponsUseCaseDep):
+    """Actualiza hasta 500 cupones en un commit; si algún id no existe no se aplica ninguno."""
+    try:
+        return await use_case.execute(cmd)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.delete("/{coupon_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_coupon(coupon_id: UUID, use_case: DeleteCouponUseCaseDep):
     await use_case.execute(coupon_id)
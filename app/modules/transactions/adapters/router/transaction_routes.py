@@ -1,27 +1,93 @@
 # app/modules/transactions/adapters/router/transaction_routes.py
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from uuid import UUID
-from typing import List
+from typing import Annotated, List
 
+from app.core.pagination.cursor import CursorPage
+from app.core.pagination.dependencies import RequiredCursorParamsDep
 from app.modules.transactions.application.schemas import (
     TransactionCreateCmd,
     TransactionUpdateCmd,
     TransactionReadDTO,
+    TransactionListItemDTO,
+    TransactionListFilter,
+    TransactionExportFormat,
+    TransactionRatesCmd,
+    TransactionRateDTO,
+    DailyVolumeFilter,
+    DailyVolumeReadDTO,
 )
 from app.modules.transactions.adapters.dependencies import (
     GetTransactionByIdUseCaseDep,
     ListTransactionsUseCaseDep,
+    ExportTransactionsUseCaseDep,
+    GetTransactionRatesUseCaseDep,
     CreateTransactionUseCaseDep,
     UpdateTransactionUseCaseDep,
     DeleteTransactionUseCaseDep,
+    ListDailyVolumeUseCaseDep,
 )
 
 router = APIRouter(tags=["transactions"])
 
 
-@router.get("/", response_model=List[TransactionReadDTO])
-async def list_transactions(use_case: ListTransactionsUseCaseDep):
-    return await use_case.execute()
+@router.get("/", response_model=CursorPage[TransactionListItemDTO])
+async def list_transactions(
+    filters: Annotated[TransactionListFilter, Depends(TransactionListFilter.from_query)],
+    page: RequiredCursorParamsDep,
+    use_case: ListTransactionsUseCaseDep,
+):
+    """Listado paginado por cursor. Filtros: status, user_id, rango de created_at
+    [date_from, date_to) y par de monedas (coin_a, coin_b) del tipo de cambio."""
+    try:
+        return await use_case.execute(filters, page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+export_media_types = {
+    TransactionExportFormat.ndjson: "application/x-ndjson",
+    TransactionExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+@router.get("/export")
+async def export_transactions(
+    filters: Annotated[TransactionListFilter, Depends(TransactionListFilter.from_query)],
+    use_case: ExportTransactionsUseCaseDep,
+    export_format: TransactionExportFormat = Query(TransactionExportFormat.ndjson, alias="format"),
+):
+    """Export completo (mismos filtros que el listado) en streaming, NDJSON o CSV."""
+    try:
+        body = use_case.execute(filters, export_format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    filename = f"transactions.{export_format.value}"
+    return StreamingResponse(
+        body,
+        media_type=export_media_types[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/rates", response_model=List[TransactionRateDTO])
+async def get_transaction_rates(cmd: TransactionRatesCmd, use_case: GetTransactionRatesUseCaseDep):
+    """Tasa vigente al crear cada transacción (hasta 500 ids), desde el historial de tasas."""
+    return await use_case.execute(cmd)
+
+
+@router.get("/volume", response_model=List[DailyVolumeReadDTO])
+async def list_daily_volume(
+    filters: Annotated[DailyVolumeFilter, Depends(DailyVolumeFilter.from_query)],
+    use_case: ListDailyVolumeUseCaseDep,
+):
+    """Volumen por día, par de monedas y status (rollup daily_volume). Rango de días
+    [date_from, date_to] inclusivo; by_day=false devuelve los totales del rango."""
+    try:
+        return await use_case.execute(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{transaction_id}", response_model=TransactionReadDTO)
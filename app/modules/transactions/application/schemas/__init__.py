@@ -3,10 +3,19 @@ from app.modules.transactions.application.schemas.transaction_schema import (
     TransactionCreateCmd,
     TransactionUpdateCmd,
     TransactionReadDTO,
+    TransactionListItemDTO,
+    TransactionRatesCmd,
+    TransactionRateDTO,
+    TransactionListFilter,
+    TransactionExportFormat,
+    DailyVolumeFilter,
+    DailyVolumeReadDTO,
 )
 from app.modules.transactions.application.schemas.bank_schema import (
     BankCreateCmd,
     BankUpdateCmd,
+    BankBulkCreateCmd,
+    BankBulkUpdateCmd,
     BankReadDTO,
     BankItemDTO,
     BanksByCountryCurrencyDTO,
@@ -19,6 +28,8 @@ from app.modules.transactions.application.schemas.bank_account_schema import (
 from app.modules.transactions.application.schemas.coupon_schema import (
     CouponCreateCmd,
     CouponUpdateCmd,
+    CouponBulkCreateCmd,
+    CouponBulkUpdateCmd,
     CouponReadDTO,
 )
 
@@ -26,8 +37,17 @@ __all__ = [
     "TransactionCreateCmd",
     "TransactionUpdateCmd",
     "TransactionReadDTO",
+    "TransactionListItemDTO",
+    "TransactionRatesCmd",
+    "TransactionRateDTO",
+    "TransactionListFilter",
+    "TransactionExportFormat",
+    "DailyVolumeFilter",
+    "DailyVolumeReadDTO",
     "BankCreateCmd",
     "BankUpdateCmd",
+    "BankBulkCreateCmd",
+    "BankBulkUpdateCmd",
     "BankReadDTO",
     "BankItemDTO",
     "BanksByCountryCurrencyDTO",
@@ -36,5 +56,7 @@ __all__ = [
     "BankAccountReadDTO",
     "CouponCreateCmd",
     "CouponUpdateCmd",
+    "CouponBulkCreateCmd",
+    "CouponBulkUpdateCmd",
     "CouponReadDTO",
 ]
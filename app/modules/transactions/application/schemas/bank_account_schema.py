@@ -5,6 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from app.modules.coin.domain.enums import Currency
 from app.modules.transactions.domain.enums import BankCountry, AccountFlowType, AccountHolderType
 
 
@@ -55,6 +56,18 @@ class BankAccountUpdateCmd(BaseModel):
     cpf: Optional[str] = None
 
 
+class BankAccountBankDTO(BaseModel):
+    """Banco de la cuenta (relación `bank`, cargada en lote en los casos de uso de lectura)."""
+    id: UUID
+    bank: str
+    company: str
+    currency: Currency
+    image: str
+    country: BankCountry
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class BankAccountReadDTO(BaseModel):
     id: UUID
     user_id: UUID
@@ -77,6 +90,7 @@ class BankAccountReadDTO(BaseModel):
     pix_key_confirmation: Optional[str] = None
     pix_key_type: Optional[str] = None
     cpf: Optional[str] = None
+    bank: Optional[BankAccountBankDTO] = None
     created_at: datetime
     created_by: Optional[str] = None
     updated_at: datetime
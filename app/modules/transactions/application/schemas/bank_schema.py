@@ -1,13 +1,14 @@
 # app/modules/transactions/application/schemas/bank_schema.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.coin.domain.enums import Currency
 from app.modules.transactions.domain.enums import BankCountry
 from app.modules.transactions.domain.models import Bank
+from app.shared.bulk import BULK_MAX_ITEMS
 
 
 # Display string por moneda para la respuesta (ej. "Soles (PEN)")
@@ -39,6 +40,14 @@ class BankUpdateCmd(BaseModel):
     country: Optional[BankCountry] = None
 
 
+class BankBulkCreateCmd(BaseModel):
+    items: List[BankCreateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BankBulkUpdateCmd(BaseModel):
+    items: List[BankUpdateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class BankReadDTO(BaseModel):
     id: UUID
     bank: str
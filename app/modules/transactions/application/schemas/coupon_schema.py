@@ -1,11 +1,12 @@
 # app/modules/transactions/application/schemas/coupon_schema.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.coin.domain.enums import Currency
+from app.shared.bulk import BULK_MAX_ITEMS
 
 
 class CouponCreateCmd(BaseModel):
@@ -31,6 +32,14 @@ class CouponUpdateCmd(BaseModel):
     is_active: Optional[bool] = None
 
 
+class CouponBulkCreateCmd(BaseModel):
+    items: List[CouponCreateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class CouponBulkUpdateCmd(BaseModel):
+    items: List[CouponUpdateCmd] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class CouponReadDTO(BaseModel):
     id: UUID
     code: str
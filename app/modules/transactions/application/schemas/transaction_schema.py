@@ -1,11 +1,16 @@
 # app/modules/transactions/application/schemas/transaction_schema.py
-from datetime import datetime
-from typing import Optional
+import enum
+from datetime import date, datetime
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from fastapi import Query
+from pydantic import BaseModel, ConfigDict, Field
 
-from app.modules.transactions.domain.enums import TransactionStatus
+from app.modules.coin.application.schemas.tax_rate_schema import TaxRateHistoryReadDTO
+from app.modules.coin.domain.enums import Currency
+from app.modules.transactions.domain.enums import AccountFlowType, BankCountry, TransactionStatus
+from app.shared.bulk import BULK_MAX_ITEMS
 
 
 class TransactionCreateCmd(BaseModel):
@@ -58,3 +63,112 @@ class TransactionReadDTO(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TransactionBankAccountDTO(BaseModel):
+    """Resumen de la cuenta bancaria de la transacción (relación `bank_account`)."""
+    id: UUID
+    bank_id: UUID
+    account_flow: AccountFlowType
+    bank_country: BankCountry
+    holder_names: Optional[str] = None
+    holder_surnames: Optional[str] = None
+    business_name: Optional[str] = None
+    account_number: Optional[str] = None
+    cci_number: Optional[str] = None
+    pix_key: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TransactionListItemDTO(TransactionReadDTO):
+    """Item del listado: la cuenta bancaria se carga en lote para toda la página."""
+    bank_account: Optional[TransactionBankAccountDTO] = None
+
+
+class TransactionRatesCmd(BaseModel):
+    transaction_ids: List[UUID] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TransactionRateDTO(BaseModel):
+    """Tasa vigente cuando se creó la transacción (None si no hay historial)."""
+    transaction_id: UUID
+    rate: Optional[TaxRateHistoryReadDTO] = None
+
+
+class TransactionListFilter(BaseModel):
+    """Filtros del listado de transacciones (query params)."""
+    status: Optional[TransactionStatus] = None
+    user_id: Optional[UUID] = None
+    date_from: Optional[datetime] = None  # created_at >= date_from
+    date_to: Optional[datetime] = None  # created_at < date_to
+    coin_a: Optional[Currency] = None  # moneda origen del tipo de cambio
+    coin_b: Optional[Currency] = None  # moneda destino del tipo de cambio
+
+    @classmethod
+    def from_query(
+        cls,
+        status: Optional[TransactionStatus] = Query(None),
+        user_id: Optional[UUID] = Query(None),
+        date_from: Optional[datetime] = Query(None),
+        date_to: Optional[datetime] = Query(None),
+        coin_a: Optional[Currency] = Query(None),
+        coin_b: Optional[Currency] = Query(None),
+    ) -> "TransactionListFilter":
+        return cls(
+            status=status,
+            user_id=user_id,
+            date_from=date_from,
+            date_to=date_to,
+            coin_a=coin_a,
+            coin_b=coin_b,
+        )
+
+    @property
+    def has_currency_pair(self) -> bool:
+        return self.coin_a is not None or self.coin_b is not None
+
+
+class TransactionExportFormat(str, enum.Enum):
+    """Formato del export de transacciones."""
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class DailyVolumeFilter(BaseModel):
+    """Filtros del rollup diario (query params); rango de días inclusivo."""
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    coin_a: Optional[Currency] = None
+    coin_b: Optional[Currency] = None
+    status: Optional[TransactionStatus] = None
+    by_day: bool = True  # False: totales del rango por par y status
+
+    @classmethod
+    def from_query(
+        cls,
+        date_from: Optional[date] = Query(None),
+        date_to: Optional[date] = Query(None),
+        coin_a: Optional[Currency] = Query(None),
+        coin_b: Optional[Currency] = Query(None),
+        status: Optional[TransactionStatus] = Query(None),
+        by_day: bool = Query(True),
+    ) -> "DailyVolumeFilter":
+        return cls(
+            date_from=date_from,
+            date_to=date_to,
+            coin_a=coin_a,
+            coin_b=coin_b,
+            status=status,
+            by_day=by_day,
+        )
+
+
+class DailyVolumeReadDTO(BaseModel):
+    day: Optional[date] = None  # None en totales (by_day=False)
+    coin_a: Currency
+    coin_b: Currency
+    status: TransactionStatus
+    tx_count: int
+    origin_amount: float
+    destination_amount: float
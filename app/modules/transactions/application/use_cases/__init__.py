@@ -2,9 +2,13 @@
 from app.modules.transactions.application.use_cases.transaction_use_cases import (
     GetTransactionByIdUseCase,
     ListTransactionsUseCase,
+    ExportTransactionsUseCase,
+    GetTransactionRatesUseCase,
     CreateTransactionUseCase,
     UpdateTransactionUseCase,
     DeleteTransactionUseCase,
+    ListDailyVolumeUseCase,
+    RebuildDailyVolumeUseCase,
 )
 from app.modules.transactions.application.use_cases.bank_use_cases import (
     GetBankByIdUseCase,
@@ -12,6 +16,8 @@ from app.modules.transactions.application.use_cases.bank_use_cases import (
     ListBanksByCountryCurrencyUseCase,
     CreateBankUseCase,
     UpdateBankUseCase,
+    BulkCreateBanksUseCase,
+    BulkUpdateBanksUseCase,
     DeleteBankUseCase,
 )
 from app.modules.transactions.application.use_cases.bank_account_use_cases import (
@@ -26,20 +32,28 @@ from app.modules.transactions.application.use_cases.coupon_use_cases import (
     ListCouponsUseCase,
     CreateCouponUseCase,
     UpdateCouponUseCase,
+    BulkCreateCouponsUseCase,
+    BulkUpdateCouponsUseCase,
     DeleteCouponUseCase,
 )
 
 __all__ = [
     "GetTransactionByIdUseCase",
     "ListTransactionsUseCase",
+    "ExportTransactionsUseCase",
+    "GetTransactionRatesUseCase",
     "CreateTransactionUseCase",
     "UpdateTransactionUseCase",
     "DeleteTransactionUseCase",
+    "ListDailyVolumeUseCase",
+    "RebuildDailyVolumeUseCase",
     "GetBankByIdUseCase",
     "ListBanksUseCase",
     "ListBanksByCountryCurrencyUseCase",
     "CreateBankUseCase",
     "UpdateBankUseCase",
+    "BulkCreateBanksUseCase",
+    "BulkUpdateBanksUseCase",
     "DeleteBankUseCase",
     "GetBankAccountByIdUseCase",
     "ListBankAccountsUseCase",
@@ -50,5 +64,7 @@ __all__ = [
     "ListCouponsUseCase",
     "CreateCouponUseCase",
     "UpdateCouponUseCase",
+    "BulkCreateCouponsUseCase",
+    "BulkUpdateCouponsUseCase",
     "DeleteCouponUseCase",
 ]
@@ -1,8 +1,8 @@
 """Casos de uso CRUD para BankAccount."""
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from app.modules.transactions.domain.models import BankAccount
+from app.core.pagination.cursor import CursorPage, CursorParams
 from app.modules.transactions.interfaces.bank_account_repository import BankAccountRepositoryInterface
 from app.modules.transactions.application.schemas.bank_account_schema import (
     BankAccountCreateCmd,
@@ -19,6 +19,7 @@ class GetBankAccountByIdUseCase:
         entity = await self.repo.get(bank_account_id)
         if not entity:
             return None
+        await self.repo.load_relations([entity], ["bank"])
         return BankAccountReadDTO.model_validate(entity)
 
 
@@ -26,8 +27,16 @@ class ListBankAccountsUseCase:
     def __init__(self, repo: BankAccountRepositoryInterface):
         self.repo = repo
 
-    async def execute(self) -> List[BankAccountReadDTO]:
+    async def execute(
+        self, page: Optional[CursorParams] = None
+    ) -> Union[List[BankAccountReadDTO], CursorPage[BankAccountReadDTO]]:
+        """El banco de cada cuenta se carga en lote (una consulta por listado)."""
+        if page is not None:
+            result = await self.repo.list(cursor=page)
+            await self.repo.load_relations(result.items, ["bank"])
+            return result.map_items(BankAccountReadDTO.model_validate)
         items = await self.repo.list()
+        await self.repo.load_relations(items, ["bank"])
         return [BankAccountReadDTO.model_validate(x) for x in items]
 
 
@@ -36,7 +45,7 @@ class CreateBankAccountUseCase:
         self.repo = repo
 
     async def execute(self, cmd: BankAccountCreateCmd) -> BankAccountReadDTO:
-        entity = BankAccount(
+        values = dict(
             user_id=cmd.user_id,
             bank_id=cmd.bank_id,
             account_flow=cmd.account_flow,
@@ -58,9 +67,8 @@ class CreateBankAccountUseCase:
             pix_key_type=cmd.pix_key_type,
             cpf=cmd.cpf,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
         await self.repo.commit()
-        await self.repo.refresh(saved)
         return BankAccountReadDTO.model_validate(saved)
 
 
@@ -69,52 +77,11 @@ class UpdateBankAccountUseCase:
         self.repo = repo
 
     async def execute(self, cmd: BankAccountUpdateCmd) -> Optional[BankAccountReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.user_id is not None:
-            entity.user_id = cmd.user_id
-        if cmd.bank_id is not None:
-            entity.bank_id = cmd.bank_id
-        if cmd.account_flow is not None:
-            entity.account_flow = cmd.account_flow
-        if cmd.account_holder_type is not None:
-            entity.account_holder_type = cmd.account_holder_type
-        if cmd.bank_country is not None:
-            entity.bank_country = cmd.bank_country
-        if cmd.holder_names is not None:
-            entity.holder_names = cmd.holder_names
-        if cmd.holder_surnames is not None:
-            entity.holder_surnames = cmd.holder_surnames
-        if cmd.document_number is not None:
-            entity.document_number = cmd.document_number
-        if cmd.business_name is not None:
-            entity.business_name = cmd.business_name
-        if cmd.ruc_number is not None:
-            entity.ruc_number = cmd.ruc_number
-        if cmd.legal_representative_name is not None:
-            entity.legal_representative_name = cmd.legal_representative_name
-        if cmd.legal_representative_document is not None:
-            entity.legal_representative_document = cmd.legal_representative_document
-        if cmd.account_number is not None:
-            entity.account_number = cmd.account_number
-        if cmd.account_number_confirmation is not None:
-            entity.account_number_confirmation = cmd.account_number_confirmation
-        if cmd.cci_number is not None:
-            entity.cci_number = cmd.cci_number
-        if cmd.cci_number_confirmation is not None:
-            entity.cci_number_confirmation = cmd.cci_number_confirmation
-        if cmd.pix_key is not None:
-            entity.pix_key = cmd.pix_key
-        if cmd.pix_key_confirmation is not None:
-            entity.pix_key_confirmation = cmd.pix_key_confirmation
-        if cmd.pix_key_type is not None:
-            entity.pix_key_type = cmd.pix_key_type
-        if cmd.cpf is not None:
-            entity.cpf = cmd.cpf
-        await self.repo.update(entity)
         await self.repo.commit()
-        await self.repo.refresh(entity)
         return BankAccountReadDTO.model_validate(entity)
 
 
@@ -2,11 +2,15 @@
 from uuid import UUID
 from typing import List, Optional
 
+from app.core.catalog_cache import CatalogNamespace, invalidate_catalog
+from app.shared.bulk import create_rows, update_rows, validate_update_targets
 from app.modules.transactions.domain.models import Bank
 from app.modules.transactions.interfaces.bank_repository import BankRepositoryInterface
 from app.modules.transactions.application.schemas.bank_schema import (
     BankCreateCmd,
     BankUpdateCmd,
+    BankBulkCreateCmd,
+    BankBulkUpdateCmd,
     BankReadDTO,
     BankItemDTO,
     BanksByCountryCurrencyDTO,
@@ -70,7 +74,7 @@ class CreateBankUseCase:
         self.repo = repo
 
     async def execute(self, cmd: BankCreateCmd) -> BankReadDTO:
-        entity = Bank(
+        values = dict(
             bank=cmd.bank,
             account=cmd.account,
             pix=cmd.pix,
@@ -79,9 +83,9 @@ class CreateBankUseCase:
             image=cmd.image,
             country=cmd.country,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
         await self.repo.commit()
-        await self.repo.refresh(saved)
+        await invalidate_catalog(CatalogNamespace.banks)
         return BankReadDTO.from_bank(saved)
 
 
@@ -90,29 +94,42 @@ class UpdateBankUseCase:
         self.repo = repo
 
     async def execute(self, cmd: BankUpdateCmd) -> Optional[BankReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.bank is not None:
-            entity.bank = cmd.bank
-        if cmd.account is not None:
-            entity.account = cmd.account
-        if cmd.pix is not None:
-            entity.pix = cmd.pix
-        if cmd.company is not None:
-            entity.company = cmd.company
-        if cmd.currency is not None:
-            entity.currency = cmd.currency
-        if cmd.image is not None:
-            entity.image = cmd.image
-        if cmd.country is not None:
-            entity.country = cmd.country
-        await self.repo.update(entity)
         await self.repo.commit()
-        await self.repo.refresh(entity)
+        await invalidate_catalog(CatalogNamespace.banks)
         return BankReadDTO.from_bank(entity)
 
 
+class BulkCreateBanksUseCase:
+    """Alta de N bancos: un INSERT multi-fila y un solo commit."""
+
+    def __init__(self, repo: BankRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: BankBulkCreateCmd) -> List[BankReadDTO]:
+        saved = await self.repo.add_many(create_rows(cmd.items))
+        await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.banks)
+        return [BankReadDTO.from_bank(x) for x in saved]
+
+
+class BulkUpdateBanksUseCase:
+    """Actualización de N bancos: valida todos los ids, UPDATE en lote y un solo commit."""
+
+    def __init__(self, repo: BankRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: BankBulkUpdateCmd) -> List[BankReadDTO]:
+        await validate_update_targets(self.repo, [item.id for item in cmd.items])
+        updated = await self.repo.update_many(update_rows(cmd.items))
+        await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.banks)
+        return [BankReadDTO.from_bank(x) for x in updated]
+
+
 class DeleteBankUseCase:
     def __init__(self, repo: BankRepositoryInterface):
         self.repo = repo
@@ -120,3 +137,4 @@ class DeleteBankUseCase:
     async def execute(self, bank_id: UUID) -> None:
         await self.repo.delete(bank_id)
         await self.repo.commit()
+        await invalidate_catalog(CatalogNamespace.banks)
@@ -1,16 +1,35 @@
 """Casos de uso CRUD para Coupon."""
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from app.modules.transactions.domain.models import Coupon
+from app.shared.bulk import create_rows, find_duplicates, update_rows, validate_update_targets
 from app.modules.transactions.interfaces.coupon_repository import CouponRepositoryInterface
 from app.modules.transactions.application.schemas.coupon_schema import (
     CouponCreateCmd,
     CouponUpdateCmd,
+    CouponBulkCreateCmd,
+    CouponBulkUpdateCmd,
     CouponReadDTO,
 )
 
 
+async def validate_codes(
+    repo: CouponRepositoryInterface, codes: Sequence[str], row_ids: Optional[Sequence[UUID]] = None
+) -> None:
+    """Códigos únicos dentro del lote y libres. En actualizaciones `row_ids[i]` es el
+    cupón que recibe `codes[i]`: el código solo puede tenerlo ya ese mismo cupón. Mover
+    o intercambiar códigos entre cupones del lote no está soportado (el índice único se
+    verifica fila a fila)."""
+    duplicates = find_duplicates(codes)
+    if duplicates:
+        raise ValueError(f"Códigos repetidos en el lote: {', '.join(duplicates)}")
+    owners = await repo.code_owners(codes)
+    ids = row_ids if row_ids is not None else [None] * len(codes)
+    taken = [code for code, id in zip(codes, ids) if code in owners and owners[code] != id]
+    if taken:
+        raise ValueError(f"Códigos ya existentes: {', '.join(sorted(taken))}")
+
+
 class GetCouponByIdUseCase:
     def __init__(self, repo: CouponRepositoryInterface):
         self.repo = repo
@@ -36,7 +55,7 @@ class CreateCouponUseCase:
         self.repo = repo
 
     async def execute(self, cmd: CouponCreateCmd) -> CouponReadDTO:
-        entity = Coupon(
+        values = dict(
             code=cmd.code,
             discount_percentage=cmd.discount_percentage,
             max_uses=cmd.max_uses,
@@ -46,9 +65,8 @@ class CreateCouponUseCase:
             end_date=cmd.end_date,
             is_active=cmd.is_active,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
         await self.repo.commit()
-        await self.repo.refresh(saved)
         return CouponReadDTO.model_validate(saved)
 
 
@@ -57,31 +75,46 @@ class UpdateCouponUseCase:
         self.repo = repo
 
     async def execute(self, cmd: CouponUpdateCmd) -> Optional[CouponReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.code is not None:
-            entity.code = cmd.code
-        if cmd.discount_percentage is not None:
-            entity.discount_percentage = cmd.discount_percentage
-        if cmd.max_uses is not None:
-            entity.max_uses = cmd.max_uses
-        if cmd.origin_currency is not None:
-            entity.origin_currency = cmd.origin_currency
-        if cmd.destination_currency is not None:
-            entity.destination_currency = cmd.destination_currency
-        if cmd.start_date is not None:
-            entity.start_date = cmd.start_date
-        if cmd.end_date is not None:
-            entity.end_date = cmd.end_date
-        if cmd.is_active is not None:
-            entity.is_active = cmd.is_active
-        await self.repo.update(entity)
         await self.repo.commit()
-        await self.repo.refresh(entity)
         return CouponReadDTO.model_validate(entity)
 
 
+class BulkCreateCouponsUseCase:
+    """Alta de N cupones: valida códigos, un INSERT multi-fila y un solo commit."""
+
+    def __init__(self, repo: CouponRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: CouponBulkCreateCmd) -> List[CouponReadDTO]:
+        await validate_codes(self.repo, [item.code for item in cmd.items])
+        saved = await self.repo.add_many(create_rows(cmd.items))
+        await self.repo.commit()
+        return [CouponReadDTO.model_validate(x) for x in saved]
+
+
+class BulkUpdateCouponsUseCase:
+    """Actualización de N cupones: valida ids y códigos, UPDATE en lote y un solo commit."""
+
+    def __init__(self, repo: CouponRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, cmd: CouponBulkUpdateCmd) -> List[CouponReadDTO]:
+        ids = [item.id for item in cmd.items]
+        await validate_update_targets(self.repo, ids)
+        with_code = [item for item in cmd.items if item.code is not None]
+        if with_code:
+            await validate_codes(
+                self.repo, [item.code for item in with_code], row_ids=[item.id for item in with_code]
+            )
+        updated = await self.repo.update_many(update_rows(cmd.items))
+        await self.repo.commit()
+        return [CouponReadDTO.model_validate(x) for x in updated]
+
+
 class DeleteCouponUseCase:
     def __init__(self, repo: CouponRepositoryInterface):
         self.repo = repo
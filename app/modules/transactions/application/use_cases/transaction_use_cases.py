@@ -1,17 +1,56 @@
 # app/modules/transactions/application/use_cases/transaction_use_cases.py
 """Casos de uso CRUD para Transaction."""
+import csv
+import io
+import json
+from datetime import date
 from uuid import UUID
-from typing import List, Optional
+from typing import AsyncContextManager, AsyncIterator, Callable, List, Optional
 
-from app.modules.transactions.domain.models import Transaction
+from app.core.pagination.cursor import CursorPage, CursorParams
+from app.modules.coin.application.schemas.tax_rate_schema import TaxRateHistoryReadDTO
+from app.shared.query_filter import OperatorEnum, QueryFilter, QueryFilterBuilder
 from app.modules.transactions.interfaces.transaction_repository import TransactionRepositoryInterface
+from app.modules.transactions.interfaces.daily_volume_repository import (
+    VOLUME_FIELDS,
+    DailyVolumeRepositoryInterface,
+)
 from app.modules.transactions.application.schemas.transaction_schema import (
     TransactionCreateCmd,
     TransactionUpdateCmd,
     TransactionReadDTO,
+    TransactionListItemDTO,
+    TransactionRatesCmd,
+    TransactionRateDTO,
+    TransactionListFilter,
+    TransactionExportFormat,
+    DailyVolumeFilter,
+    DailyVolumeReadDTO,
 )
 
 
+def validate_list_filter(filters: TransactionListFilter) -> None:
+    if filters.date_from and filters.date_to and filters.date_from > filters.date_to:
+        raise ValueError("date_from debe ser anterior a date_to")
+
+
+async def build_list_filter(
+    repo: TransactionRepositoryInterface, filters: TransactionListFilter
+) -> Optional[QueryFilter]:
+    """Traduce los filtros del listado a un QueryFilter."""
+    builder = (
+        QueryFilterBuilder()
+        .add_filter(True, "status", filters.status)
+        .add_filter(True, "user_id", filters.user_id)
+        .add_filter(True, "created_at", filters.date_from, OperatorEnum.GTE)
+        .add_filter(True, "created_at", filters.date_to, OperatorEnum.LT)
+    )
+    if filters.has_currency_pair:
+        tax_rate_ids = await repo.tax_rate_ids_for_pair(filters.coin_a, filters.coin_b)
+        builder.add_filter(True, "tax_rate_id", tax_rate_ids, OperatorEnum.IN)
+    return builder.build()
+
+
 class GetTransactionByIdUseCase:
     def __init__(self, repo: TransactionRepositoryInterface):
         self.repo = repo
@@ -27,17 +66,99 @@ class ListTransactionsUseCase:
     def __init__(self, repo: TransactionRepositoryInterface):
         self.repo = repo
 
-    async def execute(self) -> List[TransactionReadDTO]:
-        items = await self.repo.list()
-        return [TransactionReadDTO.model_validate(x) for x in items]
+    async def execute(
+        self, filters: TransactionListFilter, page: CursorParams
+    ) -> CursorPage[TransactionListItemDTO]:
+        """Listado filtrado y siempre paginado por cursor (tamaño máximo de página acotado).
+        Las cuentas bancarias de la página se cargan en una sola consulta."""
+        validate_list_filter(filters)
+        query_filter = await build_list_filter(self.repo, filters)
+        result = await self.repo.list(query_filter=query_filter, cursor=page)
+        await self.repo.load_relations(result.items, ["bank_account"])
+        return result.map_items(TransactionListItemDTO.model_validate)
 
 
-class CreateTransactionUseCase:
+class GetTransactionRatesUseCase:
+    """Tasa histórica de N transacciones (la vigente al crearlas) en una consulta."""
+
     def __init__(self, repo: TransactionRepositoryInterface):
         self.repo = repo
 
+    async def execute(self, cmd: TransactionRatesCmd) -> List[TransactionRateDTO]:
+        rows = await self.repo.historical_rates(cmd.transaction_ids)
+        return [
+            TransactionRateDTO(
+                transaction_id=transaction_id,
+                rate=TaxRateHistoryReadDTO.model_validate(rate) if rate else None,
+            )
+            for transaction_id, rate in rows
+        ]
+
+
+class ExportTransactionsUseCase:
+    """Export completo (con filtros) como NDJSON o CSV, en streaming.
+
+    Recibe un `repository_scope` (context manager que abre su propia sesión) porque el
+    cuerpo se genera después de que FastAPI cierra las dependencias del request.
+    """
+
+    batch_rows = 500  # filas por chunk enviado al cliente
+
+    def __init__(
+        self,
+        repository_scope: Callable[[], AsyncContextManager[TransactionRepositoryInterface]],
+    ):
+        self.repository_scope = repository_scope
+
+    def execute(
+        self, filters: TransactionListFilter, export_format: TransactionExportFormat
+    ) -> AsyncIterator[str]:
+        # Validar antes de empezar a emitir: luego ya no se puede devolver un 400
+        validate_list_filter(filters)
+        if export_format == TransactionExportFormat.csv:
+            return self._stream_csv(filters)
+        return self._stream_ndjson(filters)
+
+    async def _stream_rows(self, filters: TransactionListFilter) -> AsyncIterator[dict]:
+        async with self.repository_scope() as repo:
+            query_filter = await build_list_filter(repo, filters)
+            async for entity in repo.stream(query_filter, batch_size=self.batch_rows):
+                yield TransactionReadDTO.model_validate(entity).model_dump(mode="json")
+
+    async def _stream_ndjson(self, filters: TransactionListFilter) -> AsyncIterator[str]:
+        lines = []
+        async for row in self._stream_rows(filters):
+            lines.append(json.dumps(row, ensure_ascii=False))
+            if len(lines) >= self.batch_rows:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    async def _stream_csv(self, filters: TransactionListFilter) -> AsyncIterator[str]:
+        fieldnames = list(TransactionReadDTO.model_fields.keys())
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+        writer.writeheader()
+        rows = 0
+        async for row in self._stream_rows(filters):
+            writer.writerow(row)
+            rows += 1
+            if rows >= self.batch_rows:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                rows = 0
+        yield buffer.getvalue()
+
+
+class CreateTransactionUseCase:
+    def __init__(self, repo: TransactionRepositoryInterface, volume_repo: DailyVolumeRepositoryInterface):
+        self.repo = repo
+        self.volume_repo = volume_repo
+
     async def execute(self, cmd: TransactionCreateCmd) -> TransactionReadDTO:
-        entity = Transaction(
+        values = dict(
             bank_account_id=cmd.bank_account_id,
             user_id=cmd.user_id,
             tax_rate_id=cmd.tax_rate_id,
@@ -51,54 +172,75 @@ class CreateTransactionUseCase:
             send_voucher=cmd.send_voucher,
             payment_voucher=cmd.payment_voucher,
         )
-        saved = await self.repo.add(entity)
+        saved = await self.repo.insert_returning(values)
+        await self.volume_repo.apply([saved.id], 1)
         await self.repo.commit()
-        await self.repo.refresh(saved)
         return TransactionReadDTO.model_validate(saved)
 
 
 class UpdateTransactionUseCase:
-    def __init__(self, repo: TransactionRepositoryInterface):
+    def __init__(self, repo: TransactionRepositoryInterface, volume_repo: DailyVolumeRepositoryInterface):
         self.repo = repo
+        self.volume_repo = volume_repo
 
     async def execute(self, cmd: TransactionUpdateCmd) -> Optional[TransactionReadDTO]:
-        entity = await self.repo.get(cmd.id)
+        values = cmd.model_dump(exclude={"id"}, exclude_none=True)
+        # Solo si cambia algo que agrega el rollup: quitar el aporte viejo y sumar el nuevo.
+        # El lock evita que dos updates concurrentes resten el mismo aporte viejo.
+        affects_volume = not VOLUME_FIELDS.isdisjoint(values)
+        if affects_volume:
+            await self.repo.lock_for_update([cmd.id])
+            await self.volume_repo.apply([cmd.id], -1)
+        entity = await self.repo.update_returning(cmd.id, values)
         if not entity:
             return None
-        if cmd.bank_account_id is not None:
-            entity.bank_account_id = cmd.bank_account_id
-        if cmd.user_id is not None:
-            entity.user_id = cmd.user_id
-        if cmd.tax_rate_id is not None:
-            entity.tax_rate_id = cmd.tax_rate_id
-        if cmd.commission_id is not None:
-            entity.commission_id = cmd.commission_id
-        if cmd.status is not None:
-            entity.status = cmd.status
-        if cmd.origin_amount is not None:
-            entity.origin_amount = cmd.origin_amount
-        if cmd.destination_amount is not None:
-            entity.destination_amount = cmd.destination_amount
-        if cmd.code is not None:
-            entity.code = cmd.code
-        if cmd.send_date is not None:
-            entity.send_date = cmd.send_date
-        if cmd.payment_date is not None:
-            entity.payment_date = cmd.payment_date
-        if cmd.send_voucher is not None:
-            entity.send_voucher = cmd.send_voucher
-        if cmd.payment_voucher is not None:
-            entity.payment_voucher = cmd.payment_voucher
-        await self.repo.update(entity)
+        if affects_volume:
+            await self.volume_repo.apply([cmd.id], 1)
         await self.repo.commit()
-        await self.repo.refresh(entity)
         return TransactionReadDTO.model_validate(entity)
 
 
 class DeleteTransactionUseCase:
-    def __init__(self, repo: TransactionRepositoryInterface):
+    def __init__(self, repo: TransactionRepositoryInterface, volume_repo: DailyVolumeRepositoryInterface):
         self.repo = repo
+        self.volume_repo = volume_repo
 
     async def execute(self, transaction_id: UUID) -> None:
+        await self.repo.lock_for_update([transaction_id])
+        await self.volume_repo.apply([transaction_id], -1)
         await self.repo.delete(transaction_id)
         await self.repo.commit()
+
+
+class ListDailyVolumeUseCase:
+    """Volumen diario por par de monedas y status, leído del rollup (no de transactions)."""
+
+    def __init__(self, repo: DailyVolumeRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, filters: DailyVolumeFilter) -> List[DailyVolumeReadDTO]:
+        if filters.date_from and filters.date_to and filters.date_from > filters.date_to:
+            raise ValueError("date_from debe ser anterior a date_to")
+        rows = await self.repo.query(
+            date_from=filters.date_from,
+            date_to=filters.date_to,
+            coin_a=filters.coin_a,
+            coin_b=filters.coin_b,
+            status=filters.status,
+            by_day=filters.by_day,
+        )
+        return [DailyVolumeReadDTO.model_validate(row) for row in rows]
+
+
+class RebuildDailyVolumeUseCase:
+    """Recalcula el rollup desde transactions (backfill o corrección de desvíos)."""
+
+    def __init__(self, repo: DailyVolumeRepositoryInterface):
+        self.repo = repo
+
+    async def execute(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> int:
+        if date_from and date_to and date_from > date_to:
+            raise ValueError("date_from debe ser anterior a date_to")
+        rows = await self.repo.rebuild(date_from, date_to)
+        await self.repo.commit()
+        return rows
@@ -1,5 +1,5 @@
 # app/modules/transactions/domain
-from app.modules.transactions.domain.models import Transaction
+from app.modules.transactions.domain.models import Transaction, DailyVolume
 from app.modules.transactions.domain.enums import TransactionType, TransactionStatus
 
-__all__ = ["Transaction", "TransactionType", "TransactionStatus"]
+__all__ = ["Transaction", "DailyVolume", "TransactionType", "TransactionStatus"]
@@ -2,6 +2,8 @@
 """Enums para el módulo de transacciones."""
 import enum
 
+from sqlalchemy import Enum as SaEnum
+
 
 class TransactionType(str, enum.Enum):
     """Tipo de transacción."""
@@ -17,6 +19,12 @@ class TransactionStatus(str, enum.Enum):
     failed = "failed"
 
 
+# Tipo ENUM de PostgreSQL en esquema transaction (creado por migraciones).
+TransactionStatusEnumType = SaEnum(
+    TransactionStatus, name="transaction_status", schema="transaction", create_type=False
+)
+
+
 class BankCountry(str, enum.Enum):
     """País/región para agrupar bancos (PE, BR)."""
     pe = "pe"
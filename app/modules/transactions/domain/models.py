@@ -1,20 +1,21 @@
 # app/modules/transactions/domain/models.py
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Numeric, Enum, String, ForeignKey, DateTime, Boolean, Integer
+from sqlalchemy import BigInteger, Date, Numeric, Enum, String, ForeignKey, DateTime, Boolean, Integer, text
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.modules.coin.domain.enums import Currency, CurrencyEnumType
 from app.modules.transactions.domain.enums import (
     TransactionStatus,
+    TransactionStatusEnumType,
     BankCountry,
     AccountFlowType,
     AccountHolderType,
 )
-from app.shared.model_base import ORMBaseModel
+from app.shared.model_base import ORMBase, ORMBaseModel
 
 
 class Transaction(ORMBaseModel):
@@ -49,7 +50,7 @@ class Transaction(ORMBaseModel):
     )
 
     status: Mapped[TransactionStatus] = mapped_column(
-        Enum(TransactionStatus),
+        TransactionStatusEnumType,
         nullable=False,
         default=TransactionStatus.pending,
         index=True,
@@ -172,3 +173,22 @@ class Coupon(ORMBaseModel):
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, index=True)
 
 
+class DailyVolume(ORMBase):
+    """Rollup diario de transacciones por día de creación, par de monedas (vía tax_rate) y status.
+
+    Lo mantienen los casos de uso de transacciones con deltas (upsert) y se puede
+    reconstruir desde transactions (RebuildDailyVolumeUseCase).
+    """
+    __tablename__ = "daily_volume"
+    __table_args__ = {"schema": "transaction"}
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    coin_a: Mapped[Currency] = mapped_column(CurrencyEnumType, primary_key=True)
+    coin_b: Mapped[Currency] = mapped_column(CurrencyEnumType, primary_key=True)
+    status: Mapped[TransactionStatus] = mapped_column(TransactionStatusEnumType, primary_key=True)
+    tx_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    origin_amount: Mapped[float] = mapped_column(Numeric(24, 8), nullable=False, default=0)
+    destination_amount: Mapped[float] = mapped_column(Numeric(24, 8), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now()")
+    )
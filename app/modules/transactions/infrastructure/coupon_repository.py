@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Dict, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.transactions.domain.models import Coupon
@@ -12,3 +16,11 @@ class SQLAlchemyCouponRepository(
 ):
     def __init__(self, db: AsyncSession):
         super().__init__(Coupon, db)
+
+    async def code_owners(self, codes: Sequence[str]) -> Dict[str, UUID]:
+        """Cupón que tiene cada código (incluye eliminados: el índice único es de la tabla)."""
+        if not codes:
+            return {}
+        stmt = select(Coupon.code, Coupon.id).where(Coupon.code.in_(set(codes)))
+        result = await self.session.execute(stmt)
+        return {code: id for code, id in result.all()}
@@ -0,0 +1,151 @@
+# app/modules/transactions/infrastructure/daily_volume_repository.py
+"""
+Rollup diario de transacciones (transaction.daily_volume).
+
+Las escrituras son deltas calculados en SQL desde las propias filas de transactions
+(INSERT ... SELECT ... GROUP BY ... ON CONFLICT DO UPDATE con suma): un statement por
+operación, conmutativo entre requests concurrentes. Restar el aporte de una fila que
+otro request puede estar cambiando exige bloquearla antes (lock_for_update del
+repositorio de transacciones).
+
+El par de monedas es el del tramo de tax_rate_history vigente al crear la transacción
+(o el primer tramo, si la tasa es posterior): el historial es append-only, así que el
+par de una transacción no cambia aunque se edite la tasa y `apply(-1)` resta siempre
+del mismo par al que sumó. Sin historial se usa el par actual de la tasa.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, select, text, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRate, TaxRateHistory
+from app.modules.transactions.domain.enums import TransactionStatus
+from app.modules.transactions.domain.models import DailyVolume, Transaction
+from app.modules.transactions.interfaces.daily_volume_repository import DailyVolumeRepositoryInterface
+
+_KEY = ["day", "coin_a", "coin_b", "status"]
+_COLUMNS = _KEY + ["tx_count", "origin_amount", "destination_amount"]
+
+
+def _created_between(date_from: Optional[date], date_to: Optional[date]) -> list:
+    """Rango por created_at (usa índices) equivalente a date(created_at) BETWEEN from AND to."""
+    conditions = []
+    if date_from is not None:
+        conditions.append(Transaction.created_at >= date_from)
+    if date_to is not None:
+        conditions.append(Transaction.created_at < date_to + timedelta(days=1))
+    return conditions
+
+
+class SQLAlchemyDailyVolumeRepository(DailyVolumeRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _contributions(sign: int, *conditions):
+        day = func.date(Transaction.created_at)
+        started = TaxRateHistory.valid_from <= Transaction.created_at
+        pair = (
+            select(TaxRateHistory.coin_a, TaxRateHistory.coin_b)
+            .where(TaxRateHistory.tax_rate_id == Transaction.tax_rate_id)
+            .order_by(case((started, TaxRateHistory.valid_from)).desc().nulls_last(), TaxRateHistory.valid_from)
+            .limit(1)
+            .correlate(Transaction)
+            .lateral("pair")
+        )
+        coin_a = func.coalesce(pair.c.coin_a, TaxRate.coin_a)
+        coin_b = func.coalesce(pair.c.coin_b, TaxRate.coin_b)
+        return (
+            select(
+                day,
+                coin_a,
+                coin_b,
+                Transaction.status,
+                func.count() * sign,
+                func.sum(Transaction.origin_amount) * sign,
+                func.sum(Transaction.destination_amount) * sign,
+            )
+            .join(TaxRate, TaxRate.id == Transaction.tax_rate_id)
+            .outerjoin(pair, true())
+            .where(Transaction.deleted.is_(False), *conditions)
+            .group_by(day, coin_a, coin_b, Transaction.status)
+        )
+
+    async def apply(self, transaction_ids: Sequence[UUID], sign: int) -> None:
+        if not transaction_ids:
+            return
+        table = DailyVolume.__table__
+        source = self._contributions(sign, Transaction.id.in_(set(transaction_ids)))
+        stmt = pg_insert(table).from_select(_COLUMNS, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_KEY,
+            set_={
+                "tx_count": table.c.tx_count + stmt.excluded.tx_count,
+                "origin_amount": table.c.origin_amount + stmt.excluded.origin_amount,
+                "destination_amount": table.c.destination_amount + stmt.excluded.destination_amount,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def rebuild(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> int:
+        """Borra y recalcula el rango. El LOCK bloquea los deltas concurrentes hasta el
+        commit, así ninguna escritura se pierde ni se cuenta dos veces."""
+        table = DailyVolume.__table__
+        await self.session.execute(text(
+            'LOCK TABLE "transaction".daily_volume IN SHARE ROW EXCLUSIVE MODE'
+        ))
+        stmt = delete(table)
+        if date_from is not None:
+            stmt = stmt.where(table.c.day >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(table.c.day <= date_to)
+        await self.session.execute(stmt)
+        source = self._contributions(1, *_created_between(date_from, date_to))
+        result = await self.session.execute(pg_insert(table).from_select(_COLUMNS, source))
+        return result.rowcount
+
+    async def query(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        coin_a: Optional[Currency] = None,
+        coin_b: Optional[Currency] = None,
+        status: Optional[TransactionStatus] = None,
+        by_day: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Lee el rollup: por día (by_day) o totales del rango por par y status."""
+        group = [DailyVolume.coin_a, DailyVolume.coin_b, DailyVolume.status]
+        if by_day:
+            group.insert(0, DailyVolume.day)
+        tx_count = func.sum(DailyVolume.tx_count)
+        stmt = (
+            select(
+                *group,
+                tx_count.label("tx_count"),
+                func.sum(DailyVolume.origin_amount).label("origin_amount"),
+                func.sum(DailyVolume.destination_amount).label("destination_amount"),
+            )
+            .group_by(*group)
+            .having(tx_count != 0)
+            .order_by(*group)
+        )
+        if date_from is not None:
+            stmt = stmt.where(DailyVolume.day >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(DailyVolume.day <= date_to)
+        if coin_a is not None:
+            stmt = stmt.where(DailyVolume.coin_a == coin_a)
+        if coin_b is not None:
+            stmt = stmt.where(DailyVolume.coin_b == coin_b)
+        if status is not None:
+            stmt = stmt.where(DailyVolume.status == status)
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def commit(self) -> None:
+        await self.session.commit()
@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
+from sqlalchemy import select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRate, TaxRateHistory
 from app.modules.transactions.domain.models import Transaction
 from app.modules.transactions.interfaces.transaction_repository import TransactionRepositoryInterface
 from app.shared.repositorie_base import BaseAsyncRepository
@@ -16,3 +20,61 @@ class SQLAlchemyTransactionRepository(
 ):
     def __init__(self, db: AsyncSession):
         super().__init__(Transaction, db)
+
+    async def tax_rate_ids_for_pair(
+        self,
+        coin_a: Optional[Currency] = None,
+        coin_b: Optional[Currency] = None,
+    ) -> List[UUID]:
+        """Ids de tax_rate del par de monedas (incluye eliminadas: las transacciones
+        históricas siguen apuntando a ellas). Catálogo pequeño: una sola consulta."""
+        stmt = select(TaxRate.id)
+        if coin_a is not None:
+            stmt = stmt.where(TaxRate.coin_a == coin_a)
+        if coin_b is not None:
+            stmt = stmt.where(TaxRate.coin_b == coin_b)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def lock_for_update(self, transaction_ids: Sequence[UUID]) -> None:
+        """Serializa escrituras concurrentes sobre las mismas transacciones (p. ej. para
+        leer su aporte al rollup sin que otro request lo cambie). Orden por id: sin deadlocks."""
+        if not transaction_ids:
+            return
+        stmt = (
+            select(Transaction.id)
+            .where(Transaction.id.in_(set(transaction_ids)))
+            .order_by(Transaction.id)
+            .with_for_update()
+        )
+        await self.session.execute(stmt)
+
+    async def historical_rates(
+        self, transaction_ids: Sequence[UUID]
+    ) -> List[Tuple[UUID, Optional[TaxRateHistory]]]:
+        """Tramo de tasa vigente al crear cada transacción, en una consulta:
+        LEFT JOIN LATERAL (... ORDER BY valid_from DESC LIMIT 1) por transacción, resuelto
+        con el índice (tax_rate_id, valid_from DESC): N búsquedas por índice, sin full scan.
+        Omite las transacciones inexistentes; respeta el orden de `transaction_ids`."""
+        if not transaction_ids:
+            return []
+        history = (
+            select(TaxRateHistory)
+            .where(
+                TaxRateHistory.tax_rate_id == Transaction.tax_rate_id,
+                TaxRateHistory.valid_from <= Transaction.created_at,
+            )
+            .order_by(TaxRateHistory.valid_from.desc())
+            .limit(1)
+            .correlate(Transaction)
+            .lateral("rate")
+        )
+        rate = aliased(TaxRateHistory, history)
+        stmt = (
+            select(Transaction.id, rate)
+            .outerjoin(rate, true())
+            .where(Transaction.id.in_(set(transaction_ids)), Transaction.deleted.is_(False))
+        )
+        result = await self.session.execute(stmt)
+        by_id = {transaction_id: entry for transaction_id, entry in result.all()}
+        return [(id, by_id[id]) for id in dict.fromkeys(transaction_ids) if id in by_id]
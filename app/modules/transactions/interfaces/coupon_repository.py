@@ -1,6 +1,14 @@
+from abc import abstractmethod
+from typing import Dict, Sequence
+from uuid import UUID
+
 from app.shared.interface_base import BaseRepositoryInterface
 from app.modules.transactions.domain.models import Coupon
 
 
 class CouponRepositoryInterface(BaseRepositoryInterface[Coupon]):
     """Puerto de persistencia para Coupon."""
+
+    @abstractmethod
+    async def code_owners(self, codes: Sequence[str]) -> Dict[str, UUID]:
+        raise NotImplementedError
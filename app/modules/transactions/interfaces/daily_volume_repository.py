@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from app.modules.coin.domain.enums import Currency
+from app.modules.transactions.domain.enums import TransactionStatus
+
+# Columnas de Transaction que cambian el rollup al actualizarse (created_at no cambia)
+VOLUME_FIELDS = frozenset({"status", "origin_amount", "destination_amount", "tax_rate_id"})
+
+
+class DailyVolumeRepositoryInterface(ABC):
+    """Puerto de persistencia del rollup diario de transacciones."""
+
+    @abstractmethod
+    async def apply(self, transaction_ids: Sequence[UUID], sign: int) -> None:
+        """Suma (sign=1) o resta (sign=-1) el aporte actual de las transacciones."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> int:
+        """Recalcula el rollup del rango [date_from, date_to] desde transactions."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        coin_a: Optional[Currency] = None,
+        coin_b: Optional[Currency] = None,
+        status: Optional[TransactionStatus] = None,
+        by_day: bool = True,
+    ) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
@@ -1,7 +1,32 @@
 # app/modules/transactions/interfaces/transaction_repository.py
+from abc import abstractmethod
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
 from app.shared.interface_base import BaseRepositoryInterface
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRateHistory
 from app.modules.transactions.domain.models import Transaction
 
 
 class TransactionRepositoryInterface(BaseRepositoryInterface[Transaction]):
     """Puerto de persistencia para Transaction."""
+
+    @abstractmethod
+    async def tax_rate_ids_for_pair(
+        self,
+        coin_a: Optional[Currency] = None,
+        coin_b: Optional[Currency] = None,
+    ) -> List[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lock_for_update(self, transaction_ids: Sequence[UUID]) -> None:
+        """Bloquea las filas (SELECT ... FOR UPDATE) hasta el fin de la transacción."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def historical_rates(
+        self, transaction_ids: Sequence[UUID]
+    ) -> List[Tuple[UUID, Optional[TaxRateHistory]]]:
+        raise NotImplementedError
@@ -1,4 +1,11 @@
 # app/modules/users/adapters/router
-from app.modules.users.adapters.router.user_routes import router
+from fastapi import APIRouter
+
+from app.modules.users.adapters.router.user_routes import router as user_router
+from app.modules.users.adapters.router.admin_routes import router as admin_router
+
+router = APIRouter()
+router.include_router(user_router)
+router.include_router(admin_router)
 
 __all__ = ["router"]
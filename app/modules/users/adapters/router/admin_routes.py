@@ -0,0 +1,17 @@
+# app/modules/users/adapters/router/admin_routes.py
+from fastapi import APIRouter, Depends
+
+from app.modules.auth.application.schemas.auth_schema import PasswordHashReportDTO
+from app.modules.auth.application.use_cases import PasswordHashReportUseCase
+from app.core.container import get_password_hash_report_uc, require_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/password-hash-report", response_model=PasswordHashReportDTO)
+async def password_hash_report(
+    use_case: PasswordHashReportUseCase = Depends(get_password_hash_report_uc),
+):
+    """Hashes de contraseña por esquema; `legacy` debe llegar a 0 antes de retirar los
+    esquemas viejos (bcrypt, PBKDF2 legado)."""
+    return await use_case.execute()
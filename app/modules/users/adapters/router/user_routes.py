@@ -1,8 +1,10 @@
 # app/modules/users/adapters/router/user_routes.py
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from uuid import UUID
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Union
 
+from app.core.pagination.cursor import CursorPage
+from app.core.pagination.dependencies import CursorParamsDep
 from app.modules.auth.application.schemas.auth_schema import UserInfoDTO
 from app.modules.users.application.schemas.user_schema import (
     UserCreateCmd,
@@ -95,18 +97,27 @@ async def delete_user(
     await use_case.execute(user_id)
 
 
-@router.get("/detail/", response_model=List[UserInfoDTO])
+@router.get("/detail/", response_model=Union[CursorPage[UserInfoDTO], List[UserInfoDTO]])
 async def list_users_with_details(
+    page: CursorParamsDep,
     use_case: ListUsersWithDetailsUseCase = Depends(list_users_with_details_uc),
 ):
-    return await use_case.execute()
+    try:
+        return await use_case.execute(page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[UserReadGeneralDTO])
+@router.get("/", response_model=Union[CursorPage[UserReadGeneralDTO], List[UserReadGeneralDTO]])
 async def list_users(
+    page: CursorParamsDep,
     use_case: ListUserUseCase = Depends(list_users_uc),
 ):
-    return await use_case.execute()
+    """Sin `limit`/`cursor` devuelve la lista completa; con ellos, una página keyset."""
+    try:
+        return await use_case.execute(page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/detail/name-list/", response_model=List[UserNameDTO])
@@ -1,15 +1,15 @@
 # app/modules/users/application/use_cases/user_use_cases.py
 """Casos de uso del módulo users."""
 from uuid import UUID, uuid4
-from typing import Optional, List
+from typing import Optional, List, Union
 import logging
 
 from fastapi import UploadFile
 
+from app.core.pagination.cursor import CursorPage, CursorParams
 from app.core.unit_of_work import UnitOfWorkBase
 from app.modules.auth.application.use_cases import CreateAuthService
 from app.modules.auth.application.schemas.auth_schema import UserInfoDTO
-from app.modules.users.domain.models import User
 from app.modules.users.interfaces.user_repository import UserRepositoryInterface
 from app.modules.users.application.schemas.user_schema import (
     UserCreateCmd,
@@ -86,7 +86,7 @@ class CreateUserUseCase:
             if profile_image:
                 image_path = f"profile_{uuid4()}.jpg"
 
-            user = User(
+            values = dict(
                 auth_id=auth_id,
                 names=cmd.names,
                 lastnames=cmd.lastnames,
@@ -99,9 +99,8 @@ class CreateUserUseCase:
                 code_phone=cmd.code_phone.value if cmd.code_phone else None,
             )
 
-            saved = await self._uow.user_repository.add(user)
+            saved = await self._uow.user_repository.insert_returning(values)
             await self._uow.commit()
-            saved = await self._uow.user_repository.get(saved.id)
             logger.info(f"Usuario creado: {saved.id}")
             return UserReadDTO.model_validate(saved)
         except Exception as e:
@@ -117,21 +116,18 @@ class UpdateUserUseCase:
 
     async def execute(self, cmd: UserUpdateCmd) -> Optional[UserReadDTO]:
         try:
-            existing_user = await self._uow.user_repository.get(cmd.id)
-            if not existing_user:
-                return None
-
             update_data = cmd.model_dump(exclude_unset=True, exclude={"id"})
-            for field, value in update_data.items():
-                if hasattr(value, "value"):
-                    value = value.value
-                setattr(existing_user, field, value)
+            values = {
+                field: value.value if hasattr(value, "value") else value
+                for field, value in update_data.items()
+            }
+            updated_user = await self._uow.user_repository.update_returning(cmd.id, values)
+            if not updated_user:
+                return None
 
-            updated_user = await self._uow.user_repository.update(existing_user)
             await self._uow.commit()
-            updated_user = await self._uow.user_repository.get(updated_user.id)
             logger.info(f"Usuario actualizado: {updated_user.id}")
-            return UserReadDTO.model_validate(updated_user) if updated_user else None
+            return UserReadDTO.model_validate(updated_user)
         except Exception as e:
             await self._uow.rollback()
             raise e
@@ -164,8 +160,13 @@ class ListUsersWithDetailsUseCase:
     def __init__(self, repo: UserRepositoryInterface):
         self.repo = repo
 
-    async def execute(self) -> List[UserInfoDTO]:
+    async def execute(
+        self, page: Optional[CursorParams] = None
+    ) -> Union[List[UserInfoDTO], CursorPage[UserInfoDTO]]:
         try:
+            if page is not None:
+                result = await self.repo.list(cursor=page)
+                return result.map_items(UserInfoDTO.model_validate)
             users = await self.repo.list()
             return [UserInfoDTO.model_validate(user) for user in users]
         except Exception as e:
@@ -177,8 +178,13 @@ class ListUserUseCase:
     def __init__(self, repo: UserRepositoryInterface):
         self.repo = repo
 
-    async def execute(self) -> List[UserReadGeneralDTO]:
+    async def execute(
+        self, page: Optional[CursorParams] = None
+    ) -> Union[List[UserReadGeneralDTO], CursorPage[UserReadGeneralDTO]]:
         try:
+            if page is not None:
+                result = await self.repo.list(cursor=page)
+                return result.map_items(UserReadGeneralDTO.model_validate)
             users = await self.repo.list()
             return [UserReadGeneralDTO.model_validate(user) for user in users]
         except Exception as e:
@@ -13,7 +13,7 @@ class User(ORMBaseModel):
     __tablename__ = "user"
     __table_args__ = {"schema": "user"}
 
-    auth_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    auth_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
     names: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     lastnames: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     email: Mapped[Optional[str]] = mapped_column(String(255), unique=True, nullable=True)
@@ -7,6 +7,10 @@ from app.modules.users.interfaces.user_repository import UserRepositoryInterface
 from app.modules.auth.interfaces.auth_repository import AuthRepositoryInterface
 from app.modules.users.infrastructure.repository import SQLAlchemyUserRepository
 from app.modules.auth.infrastructure.repository import SQLAlchemyAuthRepository
+from app.modules.auth.infrastructure.session_cache import (
+    discard_pending_revocations,
+    revoke_pending_sessions,
+)
 
 
 class AsyncUserAuthUnitOfWork(UnitOfWorkBase):
@@ -35,6 +39,9 @@ class AsyncUserAuthUnitOfWork(UnitOfWorkBase):
 
     async def commit(self) -> None:
         await self._session.commit()
+        # Tokens rotados/revocados en esta transacción: ya confirmados, sacarlos del cache
+        await revoke_pending_sessions(self._session)
 
     async def rollback(self) -> None:
         await self._session.rollback()
+        discard_pending_revocations(self._session)
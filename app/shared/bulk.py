@@ -0,0 +1,41 @@
+# app/shared/bulk.py
+"""
+Utilidades para altas/actualizaciones en lote.
+
+Todas las filas se validan antes de escribir; si alguna falla se lanza ValueError y no
+se escribe nada (un único commit al final en el caso de uso).
+"""
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Sequence
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.shared.interface_base import BaseRepositoryInterface
+
+BULK_MAX_ITEMS = 500
+
+
+def find_duplicates(values: Iterable[Hashable]) -> List[Hashable]:
+    return [value for value, count in Counter(values).items() if count > 1]
+
+
+def create_rows(items: Sequence[BaseModel]) -> List[Dict[str, Any]]:
+    """Filas para add_many (los comandos de alta mapean 1:1 a columnas)."""
+    return [item.model_dump() for item in items]
+
+
+def update_rows(items: Sequence[BaseModel]) -> List[Dict[str, Any]]:
+    """Filas para update_many: id + campos enviados no nulos de cada comando."""
+    return [{"id": item.id, **item.model_dump(exclude={"id"}, exclude_none=True)} for item in items]
+
+
+async def validate_update_targets(repo: BaseRepositoryInterface, ids: Sequence[UUID]) -> None:
+    """Ids sin repetir y existentes (no eliminados); una sola consulta."""
+    duplicates = find_duplicates(ids)
+    if duplicates:
+        raise ValueError(f"Ids repetidos en el lote: {', '.join(map(str, duplicates))}")
+    found = {entity.id for entity in await repo.get_many(ids)}
+    missing = [id for id in ids if id not in found]
+    if missing:
+        raise ValueError(f"No existen: {', '.join(map(str, missing))}")
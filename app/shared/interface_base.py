@@ -1,10 +1,11 @@
 # app/shared/interfaces/base_repository.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict, TypeVar, Generic, Optional, List, Union
+from typing import Any, AsyncIterator, Dict, TypeVar, Generic, Optional, List, Union
 from uuid import UUID
 
 from sqlalchemy import Sequence
 
+from app.core.pagination.cursor import CursorPage, CursorParams
 from app.core.pagination.offset import PaginatedResult
 from app.shared.query_filter import QueryFilter
 
@@ -29,7 +30,17 @@ class BaseRepositoryInterface(ABC, Generic[T]):
         default_sort_direction: str = "desc",
         limit: int | None = None,
         offset: int | None = None,
-    ) -> Union[List[T], PaginatedResult[T]]:
+        cursor: CursorParams | None = None,
+        include_total: bool = True,
+    ) -> Union[List[T], PaginatedResult[T], CursorPage[T]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(
+        self,
+        query_filter: QueryFilter | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[T]:
         raise NotImplementedError
 
     @abstractmethod
@@ -44,6 +55,26 @@ class BaseRepositoryInterface(ABC, Generic[T]):
     async def update(self, obj: T) -> T:
         raise NotImplementedError
 
+    @abstractmethod
+    async def insert_returning(self, values: Dict[str, Any]) -> T:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_returning(self, id: UUID, values: Dict[str, Any]) -> Optional[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_many(self, rows: List[Dict[str, Any]]) -> List[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(self, rows: List[Dict[str, Any]]) -> List[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, ids: List[UUID], *, populate_existing: bool = False) -> List[T]:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, pk: UUID) -> None:
         raise NotImplementedError
@@ -79,3 +110,7 @@ class BaseRepositoryInterface(ABC, Generic[T]):
         load_noload_relations: List[str] | None = None,
     ) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def load_relations(self, objs: List[T], relations: List[str]) -> None:
+        raise NotImplementedError
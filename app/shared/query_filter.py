@@ -1,15 +1,20 @@
 # Simplified query filter - can be expanded later
-from typing import Any, List, Optional, Type, Union, Dict, TypeVar
-from sqlalchemy import func, select, and_, or_, desc
+from typing import Any, Callable, List, Optional, Tuple, Type, Union, Dict, TypeVar
+from sqlalchemy import Integer, bindparam, func, select, and_, or_, desc, tuple_
 from sqlalchemy.sql import Select
 from pydantic import BaseModel
 from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination.cursor import CursorPage, CursorParams, decode_cursor, encode_cursor
 from app.core.pagination.offset import PageParams, PaginatedResult
+from app.shared.statement_cache import statement_cache
 
 T = TypeVar("T")
 
+# Sentencias por (variante, modelo, forma del filtro); los valores van como bindparam
+_statements = statement_cache("query_filter")
+
 class OperatorEnum(str, Enum):
     EQ = "eq"
     NEQ = "neq"
@@ -49,18 +54,33 @@ class QueryFilter:
         self.eager_options = eager_options or []
         self.filter_deleted = filter_deleted
 
+    @staticmethod
+    def _param_name(index: int) -> str:
+        return f"qf_{index}"
+
     def apply(self, stmt: Select, model: Type) -> Select:
-        """Aplica filtros y ordenamiento"""
+        """Aplica filtros y ordenamiento. Cada valor es un bindparam `qf_<i>` (con el
+        valor actual), así la misma sentencia sirve para otros valores (ver `params`)."""
         if self.filter_deleted and hasattr(model, "deleted"):
             stmt = stmt.where(model.deleted.is_(False))
 
         filter_conditions = []
-        for f in self.filters:
+        for index, f in enumerate(self.filters):
             field = getattr(model, f.field, None)
             if field is None:
                 continue
-            condition = self._get_operator(field, f.operator, f.value)
-            if condition:
+            if f.operator == OperatorEnum.IS_NULL:
+                value = f.value  # define la forma (IS / IS NOT), no es parámetro
+            else:
+                # Tipo de la columna (no inferido del valor: enums, UUID, fechas)
+                value = bindparam(
+                    self._param_name(index),
+                    f.value,
+                    type_=field.type,
+                    expanding=f.operator in (OperatorEnum.IN, OperatorEnum.NOT_IN),
+                )
+            condition = self._get_operator(field, f.operator, value)
+            if condition is not None:
                 filter_conditions.append(condition)
 
         if filter_conditions:
@@ -81,6 +101,33 @@ class QueryFilter:
 
         return stmt
 
+    def shape_key(self, model: Type) -> Optional[Tuple]:
+        """Clave de la forma de la consulta (sin valores). None si no es cacheable
+        (eager options arbitrarias)."""
+        if self.eager_options:
+            return None
+        filters = tuple(
+            (f.field, f.operator, bool(f.value) if f.operator == OperatorEnum.IS_NULL else None)
+            for f in self.filters
+        )
+        return (model, self.operation, self.filter_deleted, filters, tuple(self.order_by))
+
+    def params(self) -> Dict[str, Any]:
+        """Valores de los bindparam de `apply` para ejecutar una sentencia cacheada."""
+        return {
+            self._param_name(index): f.value
+            for index, f in enumerate(self.filters)
+            if f.operator != OperatorEnum.IS_NULL
+        }
+
+    def cached(self, variant: str, model: Type, build: Callable[[], Any]) -> Any:
+        """Sentencia de esta forma + variante (list, count, ...) desde el cache; si no
+        es cacheable se construye cada vez (con los valores ya ligados)."""
+        key = self.shape_key(model)
+        if key is None:
+            return build()
+        return _statements.get_or_build((variant, key), build)
+
     def _get_operator(self, column, operator: OperatorEnum, value: Any):
         """Operadores de filtrado"""
         if operator == OperatorEnum.EQ:
@@ -107,46 +154,130 @@ class QueryFilter:
             return column.ilike(value)
         return None
 
+    def count_statement(self, model: Type) -> Select:
+        filtered_stmt = self.apply(select(model), model).order_by(None)
+        return select(func.count()).select_from(filtered_stmt.subquery())
+
+    def _keyset_statement(self, model: Type, after_cursor: bool) -> Select:
+        """Página keyset (created_at, id) desc; el orden keyset reemplaza el del filtro."""
+        stmt = self.apply(select(model), model)
+        if after_cursor:
+            stmt = stmt.where(
+                tuple_(model.created_at, model.id)
+                < tuple_(
+                    bindparam("qf_cursor_created_at", type_=model.created_at.type),
+                    bindparam("qf_cursor_id", type_=model.id.type),
+                )
+            )
+        return (
+            stmt.order_by(None)
+            .order_by(desc(model.created_at), desc(model.id))
+            .limit(bindparam("qf_limit", type_=Integer))
+        )
+
     async def execute_paginated(
         self, 
         session: AsyncSession, 
         model: Type[T],
+        include_total: bool = True,
     ) -> PaginatedResult[T]:
-        """Ejecuta la consulta con paginación"""
+        """Ejecuta la consulta con paginación. Sin `include_total` no hay COUNT:
+        has_next se calcula pidiendo limit + 1 filas."""
         if self.pagination:
             self.pagination.validate_limit()
         
-        base_stmt = select(model)
-        filtered_stmt = self.apply(base_stmt, model)
-        
+        params = self.params()
+
         # Contar total
-        count_stmt = select(func.count()).select_from(filtered_stmt.subquery())
-        total_result = await session.execute(count_stmt)
-        total = total_result.scalar_one()
+        total = None
+        if include_total:
+            count_stmt = self.cached("count", model, lambda: self.count_statement(model))
+            total_result = await session.execute(count_stmt, params)
+            total = total_result.scalar_one()
         
         # Aplicar paginación
         if self.pagination:
-            filtered_stmt = filtered_stmt.offset(self.pagination.skip).limit(self.pagination.limit)
+            fetch = self.pagination.limit if include_total else self.pagination.limit + 1
+            filtered_stmt = self.cached(
+                "page",
+                model,
+                lambda: self.apply(select(model), model)
+                .offset(bindparam("qf_offset", type_=Integer))
+                .limit(bindparam("qf_limit", type_=Integer)),
+            )
+            params = {**params, "qf_offset": self.pagination.skip, "qf_limit": fetch}
+        else:
+            filtered_stmt = self.cached("list", model, lambda: self.apply(select(model), model))
         
-        result = await session.execute(filtered_stmt)
+        result = await session.execute(filtered_stmt, params)
         
         if self.eager_options:
-            items = result.unique().scalars().all()
+            items = list(result.unique().scalars().all())
         else:
-            items = result.scalars().all()
+            items = list(result.scalars().all())
         
         skip = self.pagination.skip if self.pagination else 0
         limit = self.pagination.limit if self.pagination else len(items)
         
+        if total is not None:
+            has_next = skip + limit < total
+        else:
+            has_next = len(items) > limit
+            items = items[:limit]
+        
         return PaginatedResult(
             total=total,
             items=items,
             skip=skip,
             limit=limit,
-            has_next=skip + limit < total,
+            has_next=has_next,
             has_previous=skip > 0
         )
 
+    async def execute_cursor_paginated(
+        self,
+        session: AsyncSession,
+        model: Type[T],
+        params: CursorParams,
+    ) -> CursorPage[T]:
+        """Paginación keyset sobre (created_at, id) descendente. Pide limit + 1 filas
+        para saber si hay página siguiente; el COUNT solo se ejecuta si se pide."""
+        params.validate_limit()
+
+        values = self.params()
+
+        total = None
+        if params.include_total:
+            count_stmt = self.cached("count", model, lambda: self.count_statement(model))
+            total = (await session.execute(count_stmt, values)).scalar_one()
+
+        values["qf_limit"] = params.limit + 1
+        if params.cursor:
+            values["qf_cursor_created_at"], values["qf_cursor_id"] = decode_cursor(params.cursor)
+        variant = "cursor_next" if params.cursor else "cursor_first"
+        stmt = self.cached(variant, model, lambda: self._keyset_statement(model, bool(params.cursor)))
+        result = await session.execute(stmt, values)
+
+        if self.eager_options:
+            items = list(result.unique().scalars().all())
+        else:
+            items = list(result.scalars().all())
+
+        has_next = len(items) > params.limit
+        items = items[:params.limit]
+        next_cursor = None
+        if has_next and items:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return CursorPage(
+            items=items,
+            limit=params.limit,
+            has_next=has_next,
+            next_cursor=next_cursor,
+            total=total,
+        )
+
 class QueryFilterBuilder:
     """Builder para QueryFilter"""
     
@@ -0,0 +1,92 @@
+# app/shared/relation_loader.py
+"""
+Carga en lote de relaciones `noload`.
+
+Para una lista de objetos padre, cada relación se resuelve con una sola consulta
+`WHERE <columna> IN (...)` (en bloques de IN_CHUNK_SIZE claves) y se asigna como
+valor ya cargado (set_committed_value: no marca el objeto como modificado).
+Costo: O(relaciones) consultas en vez de O(filas × relaciones).
+
+La metadata de cada relación (dirección, columna local y remota) se calcula una vez
+por modelo.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import MANYTOONE, ONETOMANY
+
+IN_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class RelationMeta:
+    name: str
+    target_model: Type
+    uselist: bool
+    local_key: str  # atributo del padre con el valor a buscar (FK o PK)
+    remote_key: str  # atributo del modelo relacionado comparado con IN (...)
+
+
+@lru_cache(maxsize=None)
+def relation_metadata(model: Type) -> Dict[str, RelationMeta]:
+    """Relaciones de un modelo soportadas por el loader (1 columna, sin tabla secundaria)."""
+    mapper = class_mapper(model)
+    result: Dict[str, RelationMeta] = {}
+    for rel in mapper.relationships:
+        if rel.secondary is not None or rel.direction not in (MANYTOONE, ONETOMANY):
+            continue
+        pairs = rel.local_remote_pairs
+        if len(pairs) != 1:
+            continue
+        local_col, remote_col = pairs[0]
+        result[rel.key] = RelationMeta(
+            name=rel.key,
+            target_model=rel.mapper.class_,
+            uselist=rel.uselist,
+            local_key=mapper.get_property_by_column(local_col).key,
+            remote_key=rel.mapper.get_property_by_column(remote_col).key,
+        )
+    return result
+
+
+async def load_relations(session: AsyncSession, objs: Sequence[Any], relations: Sequence[str]) -> None:
+    """Carga `relations` en todos los `objs` (del mismo modelo) con una consulta por relación."""
+    objs = [o for o in objs if o is not None]
+    if not objs or not relations:
+        return
+    metadata = relation_metadata(type(objs[0]))
+    for name in relations:
+        meta = metadata.get(name)
+        if meta is None:
+            raise ValueError(f"Relación no soportada para carga en lote: {type(objs[0]).__name__}.{name}")
+        await _load_relation(session, objs, meta)
+
+
+async def _load_relation(session: AsyncSession, objs: List[Any], meta: RelationMeta) -> None:
+    keys = {getattr(o, meta.local_key) for o in objs}
+    keys.discard(None)
+
+    related: Dict[Any, List[Any]] = defaultdict(list)
+    if keys:
+        remote_attr = getattr(meta.target_model, meta.remote_key)
+        key_list = list(keys)
+        for start in range(0, len(key_list), IN_CHUNK_SIZE):
+            chunk = key_list[start:start + IN_CHUNK_SIZE]
+            rows = await session.execute(select(meta.target_model).where(remote_attr.in_(chunk)))
+            for row in rows.scalars():
+                related[getattr(row, meta.remote_key)].append(row)
+
+    for obj in objs:
+        matches = related.get(getattr(obj, meta.local_key), [])
+        value: Optional[Any]
+        if meta.uselist:
+            value = list(matches)
+        else:
+            value = matches[0] if matches else None
+        set_committed_value(obj, meta.name, value)
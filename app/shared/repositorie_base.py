@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+from app.core.pagination.cursor import CursorPage, CursorParams
 from app.core.pagination.offset import PageParams, PaginatedResult
 from app.shared.query_filter import FilterSchema, OperationEnum, OperatorEnum, QueryFilter
+from app.shared.relation_loader import load_relations
+from app.shared.statement_cache import statement_cache
 
-from typing import Any, Generic, TypeVar, Type, Optional, List, Sequence, Union
+from typing import Any, AsyncIterator, Dict, Generic, TypeVar, Type, Optional, List, Sequence, Union
 from uuid import UUID
 
-from sqlalchemy import desc, asc, select, func
+from sqlalchemy import bindparam, desc, asc, select, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 T = TypeVar("T")
 
+# get / get_by_field / get_many por modelo (y campo): se construyen una vez
+_statements = statement_cache("repository")
+
 class BaseAsyncRepository(Generic[T]):
     """Repositorio base asíncrono con operaciones CRUD genéricas."""
 
@@ -26,19 +32,25 @@ class BaseAsyncRepository(Generic[T]):
         eager_options: Sequence | None = None,
     ) -> Optional[T]:
         """Obtiene una entidad por id (que no esté *deleted*)."""
-        stmt = select(self.model).where(
-            self.model.id == id, self.model.deleted.is_(False)
-        )
         if eager_options:
-            stmt = stmt.options(*eager_options)
-        
-        result = await self.session.execute(stmt)
+            stmt = select(self.model).where(
+                self.model.id == id, self.model.deleted.is_(False)
+            ).options(*eager_options)
+            result = await self.session.execute(stmt)
+        else:
+            stmt = _statements.get_or_build(("get", self.model), self._get_statement)
+            result = await self.session.execute(stmt, {"id": id})
         
         if eager_options:
             return result.unique().scalar_one_or_none()
         else:
             return result.scalar_one_or_none()
     
+    def _get_statement(self):
+        return select(self.model).where(
+            self.model.id == bindparam("id"), self.model.deleted.is_(False)
+        )
+
     async def list(
         self,
         query_filter: QueryFilter | None = None,
@@ -46,12 +58,25 @@ class BaseAsyncRepository(Generic[T]):
         default_sort_direction: str = "desc",
         limit: int | None = None,
         offset: int | None = None,
-    ) -> Union[List[T], PaginatedResult[T]]:
-        """Lista entidades con soporte inteligente para paginación."""
+        cursor: CursorParams | None = None,
+        include_total: bool = True,
+    ) -> Union[List[T], PaginatedResult[T], CursorPage[T]]:
+        """Lista entidades con soporte inteligente para paginación.
+
+        - `cursor`: paginación keyset por (created_at, id), sin OFFSET.
+        - `limit`/`offset`: paginación clásica; `include_total=False` evita el COUNT.
+        """
         
         if query_filter is None:
             query_filter = QueryFilter()
         
+        if eager_options:
+            existing_options = query_filter.eager_options or []
+            query_filter.eager_options = existing_options + list(eager_options)
+
+        if cursor is not None:
+            return await query_filter.execute_cursor_paginated(self.session, self.model, cursor)
+
         has_pagination = limit is not None or offset is not None
         if has_pagination:
             query_filter.pagination = PageParams(
@@ -59,40 +84,64 @@ class BaseAsyncRepository(Generic[T]):
                 limit=limit or 20
             )
             query_filter.pagination.validate_limit()
-        
-        if eager_options:
-            existing_options = query_filter.eager_options or []
-            query_filter.eager_options = existing_options + list(eager_options)
 
         if not query_filter.order_by and hasattr(self.model, 'created_at'):
             query_filter.order_by = [("created_at", default_sort_direction)]
 
         if has_pagination:
-            return await self._execute_paginated_query(query_filter)
+            return await self._execute_paginated_query(query_filter, include_total)
         else:
             return await self._execute_simple_query(query_filter)
 
     async def _execute_simple_query(self, query_filter: QueryFilter) -> List[T]:
         """Ejecuta consulta simple optimizada sin COUNT."""
-        stmt = select(self.model)
-        stmt = query_filter.apply(stmt, self.model)
-        
-        if query_filter.eager_options:
-            stmt = stmt.options(*query_filter.eager_options)
-        
-        if query_filter.pagination:
-            stmt = stmt.offset(query_filter.pagination.skip).limit(query_filter.pagination.limit)
-        
-        result = await self.session.execute(stmt)
+        if query_filter.eager_options or query_filter.pagination:
+            stmt = query_filter.apply(select(self.model), self.model)
+            if query_filter.pagination:
+                stmt = stmt.offset(query_filter.pagination.skip).limit(query_filter.pagination.limit)
+            result = await self.session.execute(stmt)
+        else:
+            stmt = query_filter.cached(
+                "list", self.model, lambda: query_filter.apply(select(self.model), self.model)
+            )
+            result = await self.session.execute(stmt, query_filter.params())
         
         if query_filter.eager_options:
             return result.unique().scalars().all()
         else:
             return result.scalars().all()
         
-    async def _execute_paginated_query(self, query_filter: QueryFilter) -> PaginatedResult[T]:
-        """Ejecuta consulta con metadata de paginación (incluye COUNT)."""
-        return await query_filter.execute_paginated(self.session, self.model)
+    async def _execute_paginated_query(
+        self, query_filter: QueryFilter, include_total: bool = True
+    ) -> PaginatedResult[T]:
+        """Ejecuta consulta con metadata de paginación (COUNT opcional)."""
+        return await query_filter.execute_paginated(self.session, self.model, include_total)
+
+    async def stream(
+        self,
+        query_filter: QueryFilter | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[T]:
+        """Itera entidades en orden (created_at, id) ascendente con un cursor de servidor
+        (`stream` + `yield_per`): memoria constante sin importar el número de filas."""
+        if query_filter is None:
+            query_filter = QueryFilter()
+
+        stmt = query_filter.cached(
+            "stream",
+            self.model,
+            lambda: query_filter.apply(select(self.model), self.model)
+            .order_by(None)
+            .order_by(asc(self.model.created_at), asc(self.model.id)),
+        )
+        result = await self.session.stream(
+            stmt, query_filter.params(), execution_options={"yield_per": batch_size}
+        )
+        try:
+            async for obj in result.scalars():
+                yield obj
+        finally:
+            await result.close()
 
     async def count(
         self,
@@ -101,15 +150,16 @@ class BaseAsyncRepository(Generic[T]):
         """Cuenta entidades que coinciden con los filtros."""
         
         if query_filter:
-            base_stmt = select(self.model)
-            filtered_stmt = query_filter.apply(base_stmt, self.model)
-            count_stmt = select(func.count()).select_from(filtered_stmt.subquery())
+            count_stmt = query_filter.cached(
+                "count", self.model, lambda: query_filter.count_statement(self.model)
+            )
+            result = await self.session.execute(count_stmt, query_filter.params())
         else:
-            count_stmt = select(func.count()).select_from(self.model).where(
-                self.model.deleted.is_(False)
+            count_stmt = _statements.get_or_build(
+                ("count", self.model),
+                lambda: select(func.count()).select_from(self.model).where(self.model.deleted.is_(False)),
             )
-        
-        result = await self.session.execute(count_stmt)
+            result = await self.session.execute(count_stmt)
         return result.scalar_one()
 
     async def exists(
@@ -125,8 +175,11 @@ class BaseAsyncRepository(Generic[T]):
                 self.model.deleted.is_(False)
             ).limit(1)
         elif query_filter:
-            base_stmt = select(self.model.id).limit(1)
-            stmt = query_filter.apply(base_stmt, self.model)
+            stmt = query_filter.cached(
+                "exists", self.model, lambda: query_filter.apply(select(self.model.id).limit(1), self.model)
+            )
+            result = await self.session.execute(stmt, query_filter.params())
+            return result.scalar_one_or_none() is not None
         else:
             stmt = select(self.model.id).where(
                 self.model.deleted.is_(False)
@@ -177,6 +230,65 @@ class BaseAsyncRepository(Generic[T]):
         await self.session.refresh(obj)
         return obj
 
+    async def insert_returning(self, values: Dict[str, Any]) -> T:
+        """INSERT ... RETURNING: crea la fila y devuelve la entidad con PK y defaults del
+        servidor (created_at, updated_at) en un solo round trip, sin flush ni refresh."""
+        stmt = insert(self.model).values(**values).returning(self.model)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def update_returning(self, id: UUID, values: Dict[str, Any]) -> Optional[T]:
+        """UPDATE ... RETURNING sobre una entidad no eliminada (sin SELECT previo).
+
+        Devuelve la entidad ya actualizada (incluye updated_at) o None si no existe.
+        """
+        if not values:
+            return await self.get(id)
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, self.model.deleted.is_(False))
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def add_many(self, rows: Sequence[Dict[str, Any]]) -> List[T]:
+        """INSERT multi-fila con RETURNING (insertmanyvalues de SQLAlchemy): las filas se
+        envían en lotes de VALUES y se devuelven con PK y defaults, en el orden de `rows`."""
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, list(rows))
+        return list(result.scalars().all())
+
+    async def update_many(self, rows: Sequence[Dict[str, Any]]) -> List[T]:
+        """UPDATE por PK en lote (executemany). Cada fila trae `id` y las columnas a cambiar.
+
+        No filtra `deleted`: validar antes que los ids existan (`get_many`). Devuelve las
+        entidades actualizadas en el orden de `rows`.
+        """
+        changed = [row for row in rows if len(row) > 1]
+        if changed:
+            await self.session.execute(update(self.model), changed)
+        return await self.get_many([row["id"] for row in rows], populate_existing=True)
+
+    async def get_many(self, ids: Sequence[UUID], *, populate_existing: bool = False) -> List[T]:
+        """Entidades no eliminadas con id en `ids` (una consulta), en el orden de `ids`."""
+        if not ids:
+            return []
+        stmt = _statements.get_or_build(
+            ("get_many", self.model),
+            lambda: select(self.model).where(
+                self.model.id.in_(bindparam("ids", expanding=True)), self.model.deleted.is_(False)
+            ),
+        )
+        execution_options = {"populate_existing": True} if populate_existing else {}
+        result = await self.session.execute(stmt, {"ids": list(set(ids))}, execution_options=execution_options)
+        by_id = {obj.id: obj for obj in result.scalars()}
+        return [by_id[id] for id in ids if id in by_id]
+
     async def soft_delete(self, obj: T) -> None:
         """Marca `deleted=True` y sincroniza."""
         obj.deleted = True  # type: ignore[attr-defined]
@@ -236,71 +348,15 @@ class BaseAsyncRepository(Generic[T]):
             return
         
         try:
-            await self._load_noload_relations_direct(obj, load_noload_relations)
+            await self.load_relations([obj], load_noload_relations)
             if attrs:
                 await self.session.refresh(obj, attribute_names=attrs)
         except Exception as e:
             await self.session.refresh(obj, attribute_names=attrs)
 
-    async def _load_noload_relations_direct(self, obj: T, relations: List[str]) -> None:
-        """Carga relaciones noload usando asignación directa al __dict__."""
-        from sqlalchemy import select
-        from sqlalchemy.orm import class_mapper
-        
-        mapper = class_mapper(self.model)
-        
-        for relation_name in relations:
-            if relation_name in mapper.relationships:
-                relationship = mapper.relationships[relation_name]
-                target_model = relationship.mapper.class_
-                is_collection = relationship.uselist
-                
-                has_local_fk = False
-                fk_field = None
-                
-                table_fks = set()
-                for fk in mapper.mapped_table.foreign_keys:
-                    table_fks.add(fk.parent.name)
-                
-                if relationship.local_columns:
-                    for col in relationship.local_columns:
-                        if hasattr(obj, col.name) and col.name in table_fks:
-                            has_local_fk = True
-                            fk_field = col.name
-                            break
-                
-                if has_local_fk and fk_field:
-                    fk_value = getattr(obj, fk_field, None)
-                    if fk_value:
-                        stmt = select(target_model).where(target_model.id == fk_value)
-                        result = await self.session.execute(stmt)
-                        related_obj = result.scalar_one_or_none()
-                        if related_obj:
-                            obj.__dict__[relation_name] = related_obj
-                    else:
-                        obj.__dict__[relation_name] = None
-                else:
-                    remote_columns = list(relationship.remote_side) if relationship.remote_side else []
-                    if not remote_columns:
-                        continue
-                    
-                    remote_col = remote_columns[0]
-                    fk_column_name = remote_col.key
-                    
-                    try:
-                        fk_attr = getattr(target_model, fk_column_name)
-                    except AttributeError:
-                        continue
-                    
-                    stmt = select(target_model).where(fk_attr == obj.id)
-                    result = await self.session.execute(stmt)
-                    
-                    if is_collection:
-                        related_objs = result.scalars().all()
-                        obj.__dict__[relation_name] = list(related_objs)
-                    else:
-                        related_obj = result.scalar_one_or_none()
-                        obj.__dict__[relation_name] = related_obj
+    async def load_relations(self, objs: Sequence[T], relations: List[str]) -> None:
+        """Carga relaciones noload de varios objetos: una consulta IN (...) por relación."""
+        await load_relations(self.session, objs, relations)
     
     async def get_by_field(
         self,
@@ -312,15 +368,18 @@ class BaseAsyncRepository(Generic[T]):
         """Obtiene una entidad por un campo específico (que no esté deleted)."""
         field = getattr(self.model, field_name)
         
-        stmt = select(self.model).where(
-            field == field_value,
-            self.model.deleted.is_(False)
-        )
-        
         if eager_options:
-            stmt = stmt.options(*eager_options)
-        
-        result = await self.session.execute(stmt)
+            stmt = select(self.model).where(
+                field == field_value,
+                self.model.deleted.is_(False)
+            ).options(*eager_options)
+            result = await self.session.execute(stmt)
+        else:
+            stmt = _statements.get_or_build(
+                ("get_by_field", self.model, field_name),
+                lambda: select(self.model).where(field == bindparam("value"), self.model.deleted.is_(False)),
+            )
+            result = await self.session.execute(stmt, {"value": field_value})
         
         if eager_options:
             return result.unique().scalar_one_or_none()
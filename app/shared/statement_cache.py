@@ -0,0 +1,79 @@
+# app/shared/statement_cache.py
+"""
+Cache de sentencias SQLAlchemy por forma.
+
+Las consultas calientes se construyen una vez con `bindparam` en lugar de valores y se
+reutilizan (LRU por nombre). Reusar el mismo objeto evita reconstruir la sentencia y
+recalcular su cache key: SQLAlchemy encuentra el SQL compilado en su cache y asyncpg
+reutiliza el prepared statement de la conexión (mismo texto SQL).
+
+Los valores se pasan al ejecutar: `session.execute(stmt, params)`.
+Métricas: statement_cache_{hits,misses}_total, statement_cache_hit_ratio y
+statement_cache_size por cache.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, TypeVar
+
+from app.core.metrics import REGISTRY, MetricFamily
+
+S = TypeVar("S")
+
+DEFAULT_MAX_SIZE = 512
+
+
+class StatementCache:
+    def __init__(self, name: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.name = name
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], S]) -> S:
+        stmt = self._entries.get(key)
+        if stmt is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return stmt
+        self.misses += 1
+        stmt = build()
+        self._entries[key] = stmt
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return stmt
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_caches: Dict[str, StatementCache] = {}
+
+
+def statement_cache(name: str, max_size: int = DEFAULT_MAX_SIZE) -> StatementCache:
+    """Cache con nombre (uno por módulo/uso), creado la primera vez que se pide."""
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = StatementCache(name, max_size)
+    return cache
+
+
+def _collect() -> Iterable[MetricFamily]:
+    labels = ("cache",)
+    hits = MetricFamily("statement_cache_hits_total", "counter", "Sentencias reutilizadas", labels)
+    misses = MetricFamily("statement_cache_misses_total", "counter", "Sentencias construidas", labels)
+    ratio = MetricFamily("statement_cache_hit_ratio", "gauge", "hits / (hits + misses)", labels)
+    size = MetricFamily("statement_cache_size", "gauge", "Sentencias en cache", labels)
+    for name, cache in _caches.items():
+        hits.add(cache.hits, name)
+        misses.add(cache.misses, name)
+        ratio.add(cache.hit_ratio, name)
+        size.add(len(cache), name)
+    return [hits, misses, ratio, size]
+
+
+REGISTRY.register_collector(_collect)
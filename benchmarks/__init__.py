@@ -0,0 +1,9 @@
+# benchmarks/__init__.py
+"""
+Benchmarks de endpoints calientes contra un Postgres local.
+
+- seed: genera datos reproducibles (usuarios, cuentas, tasas, comisiones, transacciones).
+- scenarios: requests de cada escenario (login, token, catálogo, transacciones, OAuth).
+- run: ejecuta los escenarios con un cliente ASGI en proceso y escribe el reporte JSON.
+- compare: compara dos reportes (p. ej. main vs rama en CI).
+"""
@@ -0,0 +1,62 @@
+# benchmarks/compare.py
+"""
+Compara dos reportes de benchmarks.run (base vs candidato).
+
+    python -m benchmarks.compare base.json bench.json [--max-regression 0.2]
+
+Sale con código 1 si en algún escenario común el p95 empeora más de --max-regression
+(fracción), suben las queries por request o aparecen errores nuevos.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional, Sequence
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["scenarios"]
+
+
+def compare(base: dict, candidate: dict, max_regression: float) -> List[str]:
+    """Imprime la tabla de diferencias; devuelve las regresiones encontradas."""
+    regressions = []
+    print(f"{'escenario':<22} {'p95 base':>10} {'p95 nuevo':>10} {'Δ%':>7} {'q/req':>12} {'req/s':>16}")
+    for name in sorted(set(base) & set(candidate)):
+        old, new = base[name], candidate[name]
+        old_p95, new_p95 = old["latency_ms"]["p95"], new["latency_ms"]["p95"]
+        delta = (new_p95 - old_p95) / old_p95 if old_p95 else 0.0
+        print(
+            f"{name:<22} {old_p95:>10} {new_p95:>10} {delta * 100:>6.1f}% "
+            f"{old['queries_per_request']:>5} -> {new['queries_per_request']:<4} "
+            f"{old['throughput_rps']:>7} -> {new['throughput_rps']:<7}"
+        )
+        if delta > max_regression:
+            regressions.append(f"{name}: p95 {old_p95}ms -> {new_p95}ms (+{delta * 100:.1f}%)")
+        if new["queries_per_request"] > old["queries_per_request"]:
+            regressions.append(
+                f"{name}: queries por request {old['queries_per_request']} -> {new['queries_per_request']}"
+            )
+        if new["errors"] > old["errors"]:
+            regressions.append(f"{name}: errores {old['errors']} -> {new['errors']}")
+    for name in sorted(set(base) ^ set(candidate)):
+        print(f"{name:<22} solo en {'base' if name in base else 'candidato'}")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compara dos reportes de benchmark")
+    parser.add_argument("base")
+    parser.add_argument("candidate")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Máximo empeoramiento de p95 (fracción)")
+    args = parser.parse_args(argv)
+    regressions = compare(_load(args.base), _load(args.candidate), args.max_regression)
+    if regressions:
+        print("\nRegresiones:", file=sys.stderr)
+        for line in regressions:
+            print(f"- {line}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# benchmarks/run.py
+"""
+Benchmark de endpoints calientes contra el Postgres configurado (.env / POSTGRES_*).
+
+    python -m benchmarks.run --users 200 --transactions 20000 --requests 500 \
+        --concurrency 10 --output bench.json
+    python -m benchmarks.compare base.json bench.json
+
+La app corre en proceso (httpx.ASGITransport, con su lifespan): se mide API + base sin
+red ni servidor. Por escenario: latencia p50/p95/p99 (ms), throughput (req/s), queries
+SQL por request (delta de db_queries_total) y conteo de status. El JSON sale con claves
+ordenadas y valores redondeados para poder versionarlo y compararlo en CI.
+"""
+import os
+
+# Antes de cargar settings: sin rate limit de login (todas las requests salen de la misma
+# IP) y sin pings de liveness en segundo plano (ensucian el conteo de queries)
+os.environ.setdefault("LOGIN_RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("DB_POOL_LIVENESS_INTERVAL_SECONDS", "0")
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+from httpx import ASGITransport, AsyncClient
+
+from app.db.instrumentation import DB_QUERIES
+from benchmarks import seed as bench_seed
+from benchmarks.scenarios import SCENARIOS, BenchContext, Scenario, fake_oauth_provider, open_sessions
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Percentil por rango más cercano (valores ya ordenados)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_scenario(
+    client: AsyncClient,
+    ctx: BenchContext,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> dict:
+    for i in range(warmup):
+        await scenario.request(client, ctx, i)
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    indexes = iter(range(warmup, warmup + requests))
+
+    async def worker() -> None:
+        for i in indexes:
+            started = time.perf_counter()
+            response = await scenario.request(client, ctx, i)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] += 1
+
+    queries_before = DB_QUERIES.value()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    queries = DB_QUERIES.value() - queries_before
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        "requests": requests,
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "status": {str(status): count for status, count in sorted(statuses.items())},
+        "latency_ms": {
+            "p50": round(percentile(ms, 50), 2),
+            "p95": round(percentile(ms, 95), 2),
+            "p99": round(percentile(ms, 99), 2),
+            "mean": round(sum(ms) / len(ms), 2) if ms else 0.0,
+            "max": round(ms[-1], 2) if ms else 0.0,
+        },
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "queries_per_request": round(queries / requests, 2) if requests else 0.0,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    if args.skip_seed:
+        seed_data = await bench_seed.load()
+    else:
+        await bench_seed.clear()
+        seed_data = await bench_seed.seed(args.users, args.transactions, args.seed)
+
+    from app.main import app
+
+    scenarios = [s for s in SCENARIOS if not args.scenarios or s.name in args.scenarios]
+    results: Dict[str, dict] = {}
+    transport = ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            ctx = BenchContext(seed_data)
+            ctx.tokens = await open_sessions(client, seed_data, min(args.sessions, len(seed_data.usernames)))
+            with fake_oauth_provider():
+                for scenario in scenarios:
+                    result = await run_scenario(
+                        client, ctx, scenario, args.requests, args.concurrency, args.warmup
+                    )
+                    results[scenario.name] = result
+                    latency = result["latency_ms"]
+                    print(
+                        f"{scenario.name:<22} p50={latency['p50']:>8}ms p95={latency['p95']:>8}ms "
+                        f"p99={latency['p99']:>8}ms {result['throughput_rps']:>8} req/s "
+                        f"{result['queries_per_request']:>6} q/req errors={result['errors']}",
+                        file=sys.stderr,
+                    )
+
+    return {
+        "config": {
+            "users": len(seed_data.user_ids),
+            "transactions": None if args.skip_seed else args.transactions,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "sessions": len(ctx.tokens),
+        },
+        "scenarios": results,
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de endpoints calientes")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--transactions", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=200, help="Requests medidas por escenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=10, help="Requests previas no medidas por escenario")
+    parser.add_argument("--sessions", type=int, default=20, help="Usuarios con sesión para escenarios autenticados")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla del generador de datos")
+    parser.add_argument("--skip-seed", action="store_true", help="Reusar los datos del seed anterior")
+    parser.add_argument(
+        "--scenarios", type=lambda value: set(value.split(",")), default=None, help="Lista separada por comas"
+    )
+    parser.add_argument("--output", default=None, help="Archivo JSON (por defecto stdout)")
+    args = parser.parse_args(argv)
+    if args.users < 1 or args.requests < 1 or args.concurrency < 1:
+        parser.error("--users, --requests y --concurrency deben ser >= 1")
+    if args.scenarios:
+        unknown = args.scenarios - {s.name for s in SCENARIOS}
+        if unknown:
+            parser.error(f"Escenarios desconocidos: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# benchmarks/scenarios.py
+"""
+Escenarios de benchmark: cada uno es una función (client, ctx, i) -> Response para la
+i-ésima request. Los usuarios se recorren en round-robin con `i`.
+
+Orden de SCENARIOS: login y oauth_callback van al final porque emiten tokens nuevos y
+rotan el token guardado en auth_login de los usuarios que usan los escenarios previos.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterator, List, Tuple
+from uuid import uuid4
+
+from httpx import AsyncClient, Response
+
+from app.modules.integraciones.application.use_cases import oauth_use_cases
+from benchmarks.seed import OAUTH_PROVIDER, PAIRS, SeedData, bench_email, provider_user_id
+
+
+@dataclass
+class BenchContext:
+    seed: SeedData
+    tokens: List[str] = field(default_factory=list)  # tokens[k]: sesión de seed.user_ids[k]
+
+    def user(self, i: int) -> int:
+        return i % len(self.seed.user_ids)
+
+    def auth_user(self, i: int) -> Tuple[int, Dict[str, str]]:
+        """Usuario con sesión abierta y su header Authorization."""
+        k = i % len(self.tokens)
+        return k, {"Authorization": f"Bearer {self.tokens[k]}"}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    request: Callable[[AsyncClient, BenchContext, int], Awaitable[Response]]
+
+
+async def open_sessions(client: AsyncClient, seed: SeedData, count: int) -> List[str]:
+    """Login (fuera de medición) de los primeros `count` usuarios; devuelve sus tokens."""
+    tokens = []
+    for username in seed.usernames[:count]:
+        response = await client.post("/auth/login/", json={"username": username, "password": seed.password})
+        response.raise_for_status()
+        tokens.append(response.json()["token"])
+    return tokens
+
+
+@contextmanager
+def fake_oauth_provider() -> Iterator[None]:
+    """Reemplaza las llamadas HTTP a Google por respuestas en proceso: el benchmark mide
+    la API y la base, no la red del proveedor. El code es el provider_user_id sembrado."""
+
+    async def exchange_code(**kwargs) -> dict:
+        return {"access_token": f"bench-access-{kwargs['code']}"}
+
+    async def userinfo(access_token: str) -> dict:
+        provider_id = access_token[len("bench-access-"):]
+        index = int(provider_id.rsplit("-", 1)[1])
+        return {"id": provider_id, "email": bench_email(index), "name": f"Bench User {index}"}
+
+    originals = (oauth_use_cases.google_exchange_code, oauth_use_cases.google_userinfo)
+    oauth_use_cases.google_exchange_code = exchange_code
+    oauth_use_cases.google_userinfo = userinfo
+    try:
+        yield
+    finally:
+        oauth_use_cases.google_exchange_code, oauth_use_cases.google_userinfo = originals
+
+
+async def catalog_currencies(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    return await client.get("/coin/currencies")
+
+
+async def catalog_tax_rates(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    return await client.get("/coin/tax-rate")
+
+
+async def catalog_commissions(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    return await client.get("/coin/commission")
+
+
+async def catalog_quote(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    coin_a, coin_b, _ = PAIRS[i % len(PAIRS)]
+    return await client.get("/coin/quote", params={"from": coin_a.value, "to": coin_b.value, "amount": 100})
+
+
+async def token_validation(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    k, headers = ctx.auth_user(i)
+    return await client.get(f"/user/{ctx.seed.user_ids[k]}", headers=headers)
+
+
+async def transactions_list(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    k, headers = ctx.auth_user(i)
+    params = {"limit": 20, "user_id": str(ctx.seed.user_ids[k])}
+    return await client.get("/transactions/", params=params, headers=headers)
+
+
+async def transactions_create(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    k, headers = ctx.auth_user(i)
+    user_id = ctx.seed.user_ids[k]
+    pair = i % len(ctx.seed.tax_rate_ids)
+    payload = {
+        "bank_account_id": str(ctx.seed.bank_account_ids[user_id]),
+        "user_id": str(user_id),
+        "tax_rate_id": str(ctx.seed.tax_rate_ids[pair]),
+        "commission_id": str(ctx.seed.commission_ids[pair]),
+        "origin_amount": 100.0,
+        "destination_amount": 152.0,
+        "code": f"BENCH-RUN-{uuid4().hex[:12]}",
+    }
+    return await client.post("/transactions/", json=payload, headers=headers)
+
+
+async def login(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    username = ctx.seed.usernames[ctx.user(i)]
+    return await client.post("/auth/login/", json={"username": username, "password": ctx.seed.password})
+
+
+async def oauth_callback(client: AsyncClient, ctx: BenchContext, i: int) -> Response:
+    code = provider_user_id(ctx.user(i))
+    return await client.get(f"/integraciones/oauth/{OAUTH_PROVIDER}/callback", params={"code": code})
+
+
+SCENARIOS: Tuple[Scenario, ...] = (
+    Scenario("catalog_currencies", catalog_currencies),
+    Scenario("catalog_tax_rates", catalog_tax_rates),
+    Scenario("catalog_commissions", catalog_commissions),
+    Scenario("catalog_quote", catalog_quote),
+    Scenario("token_validation", token_validation),
+    Scenario("transactions_list", transactions_list),
+    Scenario("transactions_create", transactions_create),
+    Scenario("login", login),
+    Scenario("oauth_callback", oauth_callback),
+)
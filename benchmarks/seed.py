@@ -0,0 +1,256 @@
+# benchmarks/seed.py
+"""
+Datos de benchmark reproducibles (misma semilla -> mismas filas salvo ids).
+
+Todas las filas se marcan con created_by=SEED_TAG; `clear` las borra (y lo que cuelga de
+los usuarios de benchmark) antes de volver a sembrar. Usar una base local dedicada: el
+rollup daily_volume se recalcula completo al terminar.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, insert, select
+
+from app.core.containers.common import get_security_utils
+from app.db.base import AsyncSessionLocal
+from app.modules.auth.domain.models import AuthModel
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import Commission, TaxRate, TaxRateHistory
+from app.modules.coin.infrastructure.repository import SQLAlchemyTaxRateRepository
+from app.modules.integraciones.domain.enums import IntegrationType
+from app.modules.integraciones.domain.models import Integration, SocialAccount
+from app.modules.transactions.application.use_cases import RebuildDailyVolumeUseCase
+from app.modules.transactions.domain.enums import (
+    AccountFlowType,
+    AccountHolderType,
+    BankCountry,
+    TransactionStatus,
+)
+from app.modules.transactions.domain.models import Bank, BankAccount, Transaction
+from app.modules.transactions.infrastructure.daily_volume_repository import SQLAlchemyDailyVolumeRepository
+from app.modules.users.domain.models import User
+
+SEED_TAG = "benchmark"
+PASSWORD = "bench-password"
+OAUTH_PROVIDER = "google"
+INSERT_CHUNK_SIZE = 1000
+HISTORY_DAYS = 90
+
+# Pares con tasa y comisión: (moneda origen, moneda destino, tasa)
+PAIRS: Tuple[Tuple[Currency, Currency, float], ...] = (
+    (Currency.pen, Currency.brl, 1.52),
+    (Currency.brl, Currency.pen, 0.65),
+    (Currency.usd, Currency.pen, 3.74),
+    (Currency.usd, Currency.brl, 5.61),
+)
+BANK_COUNTRIES = {Currency.pen: BankCountry.pe, Currency.brl: BankCountry.br, Currency.usd: BankCountry.pe}
+
+
+def bench_username(index: int) -> str:
+    return f"bench_user_{index}"
+
+
+def bench_email(index: int) -> str:
+    return f"bench_user_{index}@example.com"
+
+
+def provider_user_id(index: int) -> str:
+    return f"bench-{index}"
+
+
+@dataclass
+class SeedData:
+    """Lo que los escenarios necesitan del seed (ids y credenciales)."""
+    usernames: List[str] = field(default_factory=list)
+    user_ids: List[UUID] = field(default_factory=list)
+    bank_account_ids: Dict[UUID, UUID] = field(default_factory=dict)  # user_id -> cuenta origen
+    tax_rate_ids: List[UUID] = field(default_factory=list)
+    commission_ids: List[UUID] = field(default_factory=list)
+    password: str = PASSWORD
+
+
+async def clear() -> None:
+    """Borra los datos de benchmark (incluidas las transacciones creadas por los escenarios)."""
+    async with AsyncSessionLocal() as session:
+        users = select(User.id).where(User.created_by == SEED_TAG)
+        tax_rates = select(TaxRate.id).where(TaxRate.created_by == SEED_TAG)
+        await session.execute(delete(Transaction).where(Transaction.user_id.in_(users)))
+        await session.execute(delete(SocialAccount).where(SocialAccount.user_id.in_(users)))
+        await session.execute(delete(BankAccount).where(BankAccount.user_id.in_(users)))
+        await session.execute(delete(TaxRateHistory).where(TaxRateHistory.tax_rate_id.in_(tax_rates)))
+        for model in (User, AuthModel, TaxRate, Commission, Bank, Integration):
+            await session.execute(delete(model).where(model.created_by == SEED_TAG))
+        await session.commit()
+
+
+async def seed(users: int, transactions: int, random_seed: int = 42) -> SeedData:
+    """Siembra `users` usuarios (auth + cuenta origen + cuenta social) y `transactions`
+    transacciones repartidas en los últimos HISTORY_DAYS días."""
+    rng = random.Random(random_seed)
+    # Un solo hash para todos: el costo del hash se mide en el escenario de login
+    hashed = await get_security_utils().hash_password_async(PASSWORD)
+    data = SeedData()
+
+    async with AsyncSessionLocal() as session:
+        banks = {}
+        for currency, country in BANK_COUNTRIES.items():
+            bank = Bank(
+                bank=f"Bench {currency.value}",
+                company="Bench",
+                currency=currency,
+                image="bench.png",
+                country=country,
+                created_by=SEED_TAG,
+            )
+            session.add(bank)
+            banks[currency] = bank
+
+        for coin_a, coin_b, tax in PAIRS:
+            tax_rate = TaxRate(coin_a=coin_a, coin_b=coin_b, tax=tax, created_by=SEED_TAG)
+            commission = Commission(
+                coin_a=coin_a, coin_b=coin_b, percentage=1.5, reverse=1.5, created_by=SEED_TAG
+            )
+            session.add_all([tax_rate, commission])
+            await session.flush()
+            data.tax_rate_ids.append(tax_rate.id)
+            data.commission_ids.append(commission.id)
+        await SQLAlchemyTaxRateRepository(session).record_history(data.tax_rate_ids)
+
+        has_integration = await session.scalar(
+            select(Integration.id).where(Integration.provider == OAUTH_PROVIDER).limit(1)
+        )
+        if not has_integration:
+            session.add(
+                Integration(
+                    name="Google (benchmark)",
+                    provider=OAUTH_PROVIDER,
+                    integration_type=IntegrationType.oauth,
+                    config={
+                        "client_id": "bench-client",
+                        "client_secret": "bench-secret",
+                        "redirect_uri": "http://localhost/bench/callback",
+                    },
+                    created_by=SEED_TAG,
+                )
+            )
+        await session.flush()
+
+        auth_rows, user_rows, account_rows, social_rows = [], [], [], []
+        for index in range(users):
+            auth_id, user_id, account_id = uuid4(), uuid4(), uuid4()
+            auth_rows.append(
+                {"id": auth_id, "username": bench_username(index), "password": hashed, "created_by": SEED_TAG}
+            )
+            user_rows.append(
+                {
+                    "id": user_id,
+                    "auth_id": auth_id,
+                    "names": "Bench",
+                    "lastnames": f"User {index}",
+                    "email": bench_email(index),
+                    "created_by": SEED_TAG,
+                }
+            )
+            account_rows.append(
+                {
+                    "id": account_id,
+                    "user_id": user_id,
+                    "bank_id": banks[Currency.pen].id,
+                    "account_flow": AccountFlowType.origin,
+                    "account_holder_type": AccountHolderType.personal,
+                    "bank_country": BankCountry.pe,
+                    "holder_names": "Bench",
+                    "account_number": f"{index:012d}",
+                    "account_number_confirmation": f"{index:012d}",
+                    "created_by": SEED_TAG,
+                }
+            )
+            # Cuenta social ya vinculada: el callback recorre el camino de usuario recurrente
+            social_rows.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "provider": OAUTH_PROVIDER,
+                    "provider_user_id": provider_user_id(index),
+                    "email": bench_email(index),
+                    "created_by": SEED_TAG,
+                }
+            )
+            data.usernames.append(bench_username(index))
+            data.user_ids.append(user_id)
+            data.bank_account_ids[user_id] = account_id
+
+        for model, rows in (
+            (AuthModel, auth_rows),
+            (User, user_rows),
+            (BankAccount, account_rows),
+            (SocialAccount, social_rows),
+        ):
+            await _insert_chunks(session, model, rows)
+
+        now = datetime.now(timezone.utc)
+        statuses = list(TransactionStatus)
+        transaction_rows = []
+        for index in range(transactions):
+            user_id = data.user_ids[rng.randrange(users)]
+            pair = rng.randrange(len(PAIRS))
+            origin_amount = round(rng.uniform(10, 5000), 2)
+            transaction_rows.append(
+                {
+                    "id": uuid4(),
+                    "bank_account_id": data.bank_account_ids[user_id],
+                    "user_id": user_id,
+                    "tax_rate_id": data.tax_rate_ids[pair],
+                    "commission_id": data.commission_ids[pair],
+                    "status": rng.choice(statuses),
+                    "origin_amount": origin_amount,
+                    "destination_amount": round(origin_amount * PAIRS[pair][2], 2),
+                    "code": f"BENCH-{index:08d}",
+                    "created_at": now - timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400)),
+                    "created_by": SEED_TAG,
+                }
+            )
+        await _insert_chunks(session, Transaction, transaction_rows)
+        await session.commit()
+
+        await RebuildDailyVolumeUseCase(SQLAlchemyDailyVolumeRepository(session)).execute()
+    return data
+
+
+async def load() -> SeedData:
+    """SeedData de un seed anterior (para --skip-seed)."""
+    data = SeedData()
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(
+            select(User.id, AuthModel.username, BankAccount.id)
+            .join(AuthModel, AuthModel.id == User.auth_id)
+            .join(BankAccount, BankAccount.user_id == User.id)
+            .where(User.created_by == SEED_TAG, BankAccount.created_by == SEED_TAG)
+            .order_by(AuthModel.username)
+        )
+        for user_id, username, account_id in rows:
+            data.user_ids.append(user_id)
+            data.usernames.append(username)
+            data.bank_account_ids[user_id] = account_id
+        # Mismo orden de pares en ambas listas (el escenario de alta las indexa juntas)
+        data.tax_rate_ids = list(
+            await session.scalars(
+                select(TaxRate.id).where(TaxRate.created_by == SEED_TAG).order_by(TaxRate.coin_a, TaxRate.coin_b)
+            )
+        )
+        data.commission_ids = list(
+            await session.scalars(
+                select(Commission.id).where(Commission.created_by == SEED_TAG).order_by(Commission.coin_a, Commission.coin_b)
+            )
+        )
+    if not data.user_ids or not data.tax_rate_ids:
+        raise ValueError("No hay datos de benchmark: ejecutar sin --skip-seed")
+    return data
+
+
+async def _insert_chunks(session, model, rows: List[dict]) -> None:
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        await session.execute(insert(model), rows[start:start + INSERT_CHUNK_SIZE])
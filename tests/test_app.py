@@ -0,0 +1,14 @@
+def test_app_imports_and_registers_routers():
+    """Importar app.main resuelve las dependencias de todos los routers."""
+    from app.main import app
+
+    paths = app.openapi()["paths"]
+    for path in (
+        "/auth/login/",
+        "/user/{user_id}",
+        "/admin/password-hash-report",
+        "/coin/quote",
+        "/transactions/",
+        "/transactions/bank-accounts/",
+    ):
+        assert path in paths, path
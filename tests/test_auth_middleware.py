@@ -0,0 +1,97 @@
+import pytest
+
+from app.core.request_scope import AUTH_SCOPE_KEY
+from app.middlewares import auth
+from app.middlewares.auth import (
+    DEFAULT_PUBLIC_PATHS,
+    AuthResult,
+    PublicPathMatcher,
+    extract_bearer_token,
+    resolve_auth,
+)
+
+
+@pytest.fixture
+def matcher():
+    return PublicPathMatcher(DEFAULT_PUBLIC_PATHS)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/", "/auth", "/auth/", "/auth/login", "/auth/login/", "/docs", "/docs/oauth2-redirect", "/openapi.json", "/health/db"],
+)
+def test_public_paths(matcher, path):
+    assert matcher.matches(path)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/authx", "/user", "/user/auth", "/openapi.json/extra", "/transactions/", "/admin/password-hash-report"],
+)
+def test_private_paths(matcher, path):
+    assert not matcher.matches(path)
+
+
+def test_root_only_matches_exactly():
+    matcher = PublicPathMatcher(["/"])
+    assert matcher.matches("/")
+    assert not matcher.matches("/coin")
+
+
+def test_prefix_is_by_segment():
+    matcher = PublicPathMatcher(["/coin/quote*", "/banks"])
+    assert matcher.matches("/coin/quote")
+    assert matcher.matches("/coin/quote/pen")
+    assert not matcher.matches("/coin/quotes")
+    assert not matcher.matches("/coin")
+    assert matcher.matches("/banks")
+    assert not matcher.matches("/banks/1")
+
+
+def test_extract_bearer_token():
+    assert extract_bearer_token([(b"authorization", b"Bearer abc")]) == "abc"
+    assert extract_bearer_token([(b"authorization", b"Basic abc")]) is None
+    assert extract_bearer_token([(b"authorization", b"Bearer ")]) is None
+    assert extract_bearer_token([(b"accept", b"*/*")]) is None
+
+
+def _scope(path, token=None):
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return {"type": "http", "path": path, "headers": headers}
+
+
+@pytest.fixture
+def fake_verify(monkeypatch):
+    users = {"good": {"user_id": "u1", "username": "ana"}}
+
+    async def verify_token(token):
+        return users.get(token)
+
+    monkeypatch.setattr(auth, "verify_token", verify_token)
+
+
+@pytest.mark.asyncio
+async def test_resolve_auth_public_path_accepts_valid_token(fake_verify):
+    scope = _scope("/auth/logout", "good")
+    result = await resolve_auth(scope)
+    assert result == AuthResult(token="good", user={"user_id": "u1", "username": "ana"})
+    assert scope[AUTH_SCOPE_KEY] is result
+
+
+@pytest.mark.asyncio
+async def test_resolve_auth_public_path_ignores_invalid_token(fake_verify):
+    assert await resolve_auth(_scope("/auth/login", "bad")) == AuthResult()
+
+
+@pytest.mark.asyncio
+async def test_resolve_auth_private_path_rejects_invalid_token(fake_verify):
+    assert (await resolve_auth(_scope("/user/me", "bad"))).invalid
+    assert await resolve_auth(_scope("/user/me")) == AuthResult()
+
+
+@pytest.mark.asyncio
+async def test_resolve_auth_reuses_scope_result(fake_verify):
+    cached = AuthResult(token="t", user={"user_id": "u2"})
+    scope = _scope("/user/me", "bad")
+    scope[AUTH_SCOPE_KEY] = cached
+    assert await resolve_auth(scope) is cached
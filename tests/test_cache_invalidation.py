@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from aiocache import caches
+
+from app.core.cache.backends import MemoryCacheBackend
+from app.core.cache.invalidation import FileInvalidationBus, subscribe, unsubscribe
+
+CHANNEL = "tests:catalog"
+NAMESPACE = "tests:catalog:"
+
+
+@pytest.fixture
+def backend():
+    caches.add("tests", {"cache": "aiocache.SimpleMemoryCache"})
+    return MemoryCacheBackend("tests")
+
+
+@pytest.fixture
+def received():
+    messages = []
+
+    def handler(payload):
+        messages.append(payload)
+
+    subscribe(CHANNEL, handler)
+    yield messages
+    unsubscribe(CHANNEL, handler)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "invalidation.log")
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "el mensaje no llegó a tiempo"
+        await asyncio.sleep(0.01)
+
+
+async def _poll(bus: FileInvalidationBus) -> None:
+    """Una vuelta del polling del bus, sin esperar poll_interval."""
+    for line in bus._read_new():
+        if line is not None:
+            await bus._receive(line)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_namespaces(backend):
+    await backend.set("k", 1, namespace=NAMESPACE)
+    await backend.set("k", 2, namespace="otro:")
+    assert await backend.get("k", namespace=NAMESPACE) == 1
+
+    await backend.clear(NAMESPACE)
+    assert await backend.get("k", namespace=NAMESPACE) is None
+    assert await backend.get("k", namespace="otro:") == 2
+
+    await backend.delete("k", namespace="otro:")
+    assert await backend.get("k", namespace="otro:") is None
+
+
+@pytest.mark.asyncio
+async def test_file_bus_delivers_to_other_workers(log_path, received):
+    publisher = FileInvalidationBus(log_path)
+    worker = FileInvalidationBus(log_path, poll_interval=0.01)
+    await worker.start()
+    try:
+        await publisher.publish(CHANNEL, "tax_rates")
+        assert received == ["tax_rates"]  # entrega local inmediata
+
+        await _wait_for(lambda: len(received) == 2)
+        assert received == ["tax_rates", "tax_rates"]
+
+        await _poll(publisher)  # el propio origen se ignora
+        assert received == ["tax_rates", "tax_rates"]
+    finally:
+        await worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_file_bus_skips_messages_before_start(log_path, received):
+    publisher = FileInvalidationBus(log_path)
+    worker = FileInvalidationBus(log_path, poll_interval=0.01)
+    await publisher.publish(CHANNEL, "viejo")
+    await worker.start()
+    try:
+        await publisher.publish(CHANNEL, "nuevo")
+        await _wait_for(lambda: len(received) == 3)
+        assert received == ["viejo", "nuevo", "nuevo"]
+    finally:
+        await worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_file_bus_rotation_is_reported(log_path):
+    publisher = FileInvalidationBus(log_path, max_bytes=10)
+    worker = FileInvalidationBus(log_path)
+    await publisher.publish(CHANNEL, "a")
+    worker._read_new()  # posición al final del log actual
+    await publisher.publish(CHANNEL, "b")  # supera max_bytes: reemplaza el log
+    lines = worker._read_new()
+    assert lines[0] is None  # log reemplazado: pudo perder mensajes
+    assert len(lines) == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_invalidated_through_file_bus(backend, log_path):
+    """Dos workers con su cache en memoria: la escritura en uno limpia el del otro."""
+    worker_bus = FileInvalidationBus(log_path)
+    publisher = FileInvalidationBus(log_path)
+
+    async def on_invalidate(payload):
+        await backend.clear(NAMESPACE)
+
+    subscribe(CHANNEL, on_invalidate)
+    try:
+        worker_bus._read_new()
+        await publisher.publish(CHANNEL, None)
+        await backend.set("tax_rates", ["cacheado"], namespace=NAMESPACE)
+
+        await _poll(worker_bus)
+        assert await backend.get("tax_rates", namespace=NAMESPACE) is None
+    finally:
+        unsubscribe(CHANNEL, on_invalidate)
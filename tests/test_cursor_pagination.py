@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.pagination.cursor import CursorParams, decode_cursor, encode_cursor
+from app.modules.transactions.infrastructure.repository import SQLAlchemyTransactionRepository
+from app.shared.query_filter import QueryFilterBuilder
+
+T0 = datetime(2001, 3, 1, 12, tzinfo=timezone.utc)
+
+
+def test_cursor_round_trip():
+    from uuid import uuid4
+
+    row_id = uuid4()
+    assert decode_cursor(encode_cursor(T0, row_id)) == (T0, row_id)
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_all_rows_once(db_session, catalog, make_transaction):
+    created = [await make_transaction(created_at=T0 + timedelta(minutes=i)) for i in range(5)]
+    # Dos filas con el mismo created_at: el desempate es por id
+    created += [await make_transaction(created_at=T0), await make_transaction(created_at=T0)]
+    expected = [t.id for t in sorted(created, key=lambda t: (t.created_at, t.id), reverse=True)]
+
+    repo = SQLAlchemyTransactionRepository(db_session)
+    seen, cursor, pages = [], None, 0
+    while True:
+        query_filter = QueryFilterBuilder().add_filter(True, "user_id", catalog.user.id).build()
+        page = await repo.list(
+            query_filter=query_filter, cursor=CursorParams(cursor=cursor, limit=2, include_total=True)
+        )
+        pages += 1
+        assert page.total == 7
+        seen += [t.id for t in page.items]
+        if not page.has_next:
+            assert page.next_cursor is None
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+    assert pages == 4
+
+
+@pytest.mark.asyncio
+async def test_limit_is_clamped(db_session, catalog, make_transaction):
+    await make_transaction()
+    query_filter = QueryFilterBuilder().add_filter(True, "user_id", catalog.user.id).build()
+    page = await SQLAlchemyTransactionRepository(db_session).list(
+        query_filter=query_filter, cursor=CursorParams(limit=0)
+    )
+    assert page.limit == 1
+    assert len(page.items) == 1 and not page.has_next
@@ -0,0 +1,75 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.infrastructure.repository import SQLAlchemyTaxRateRepository
+from app.modules.transactions.domain.enums import TransactionStatus
+from app.modules.transactions.domain.models import DailyVolume
+from app.modules.transactions.infrastructure.daily_volume_repository import SQLAlchemyDailyVolumeRepository
+
+DAY = date(2001, 6, 1)
+CREATED_AT = datetime(2001, 6, 1, 15, tzinfo=timezone.utc)
+
+
+async def _rollup(repo):
+    rows = await repo.query(date_from=DAY, date_to=DAY)
+    return {
+        (row["coin_a"], row["coin_b"], row["status"]): (row["tx_count"], float(row["origin_amount"]))
+        for row in rows
+    }
+
+
+@pytest.mark.asyncio
+async def test_apply_matches_rebuild(db_session, make_transaction):
+    repo = SQLAlchemyDailyVolumeRepository(db_session)
+    created = [
+        await make_transaction(origin_amount=100, created_at=CREATED_AT),
+        await make_transaction(origin_amount=50, created_at=CREATED_AT),
+        await make_transaction(origin_amount=10, status=TransactionStatus.completed, created_at=CREATED_AT),
+    ]
+    await repo.apply([t.id for t in created], 1)
+    expected = {
+        (Currency.pen, Currency.brl, TransactionStatus.pending): (2, 150.0),
+        (Currency.pen, Currency.brl, TransactionStatus.completed): (1, 10.0),
+    }
+    assert await _rollup(repo) == expected
+
+    await repo.rebuild(DAY, DAY)
+    assert await _rollup(repo) == expected
+
+
+@pytest.mark.asyncio
+async def test_update_moves_contribution(db_session, make_transaction):
+    repo = SQLAlchemyDailyVolumeRepository(db_session)
+    transaction = await make_transaction(origin_amount=100, created_at=CREATED_AT)
+    await repo.apply([transaction.id], 1)
+
+    await repo.apply([transaction.id], -1)
+    transaction.status = TransactionStatus.completed
+    await db_session.flush()
+    await repo.apply([transaction.id], 1)
+
+    assert await _rollup(repo) == {(Currency.pen, Currency.brl, TransactionStatus.completed): (1, 100.0)}
+
+
+@pytest.mark.asyncio
+async def test_pair_edit_keeps_transactions_on_their_original_pair(db_session, catalog, make_transaction):
+    repo = SQLAlchemyDailyVolumeRepository(db_session)
+    transaction = await make_transaction(origin_amount=100, created_at=CREATED_AT)
+    await repo.apply([transaction.id], 1)
+
+    # Se edita el par de la tasa después de crear la transacción
+    catalog.tax_rate.coin_a = Currency.usd
+    await db_session.flush()
+    await SQLAlchemyTaxRateRepository(db_session).record_history([catalog.tax_rate.id])
+
+    await repo.rebuild(DAY, DAY)
+    assert await _rollup(repo) == {(Currency.pen, Currency.brl, TransactionStatus.pending): (1, 100.0)}
+
+    # Un update posterior resta del mismo par al que se sumó: nada queda en negativo
+    await repo.apply([transaction.id], -1)
+    assert await _rollup(repo) == {}
+    counts = await db_session.execute(select(DailyVolume.tx_count).where(DailyVolume.day == DAY))
+    assert all(count >= 0 for count in counts.scalars())
@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+
+from app.db import instrumentation
+from app.db.instrumentation import (
+    current_query_stats,
+    instrument_engine,
+    reset_query_stats,
+    start_query_stats,
+    statement_shape,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def stats():
+    token = start_query_stats()
+    current_query_stats().track_shapes()
+    yield current_query_stats()
+    reset_query_stats(token)
+
+
+def test_statement_shape_ignores_literals_and_in_lists():
+    assert statement_shape("SELECT *  FROM t WHERE id IN ($1, $2, $3) LIMIT 10") == (
+        "SELECT * FROM t WHERE id IN (...) LIMIT ?"
+    )
+    assert statement_shape("SELECT 1 WHERE id IN ($1::UUID)") == statement_shape("SELECT 2 WHERE id IN ($1::UUID, $2::UUID)")
+
+
+def test_counts_and_times_each_statement(engine, stats, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(instrumentation.time, "perf_counter", clock)
+
+    def slow(conn, *args):
+        clock.now += 0.5  # corre después del listener que toma el inicio
+
+    event.listen(engine, "before_cursor_execute", slow)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 1"))
+    assert stats.count == 2
+    assert stats.total_seconds == pytest.approx(1.0)
+    assert stats.repeated_shapes(2) == [("SELECT ?", 2)]
+
+
+def test_failed_statement_does_not_leak_timing(engine, stats, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(instrumentation.time, "perf_counter", clock)
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        clock.now += 100  # el tiempo de la sentencia fallida no se atribuye a la siguiente
+        conn.execute(text("SELECT 1"))
+        assert "query_started_at" not in conn.info
+    assert stats.count == 1
+    assert stats.total_seconds == 0.0
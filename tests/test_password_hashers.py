@@ -0,0 +1,72 @@
+import pytest
+
+from app.core.password_hashers import (
+    Argon2Scheme,
+    PasswordHasherRegistry,
+    Pbkdf2Scheme,
+)
+
+# Parámetros bajos: los tests verifican el despacho, no el costo
+ITERATIONS = 1000
+
+
+@pytest.fixture
+def pbkdf2():
+    return Pbkdf2Scheme(iterations=ITERATIONS, legacy_iterations=[500])
+
+
+@pytest.fixture
+def argon2():
+    pytest.importorskip("argon2")
+    return Argon2Scheme(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+def test_pbkdf2_round_trip(pbkdf2):
+    hashed = pbkdf2.hash("secreto")
+    assert hashed.startswith(f"pbkdf2_sha256${ITERATIONS}$")
+    assert pbkdf2.verify("secreto", hashed)
+    assert not pbkdf2.verify("otro", hashed)
+    assert not pbkdf2.needs_rehash(hashed)
+
+
+def test_pbkdf2_iterations_change_needs_rehash(pbkdf2):
+    hashed = Pbkdf2Scheme(iterations=ITERATIONS * 2).hash("secreto")
+    assert pbkdf2.verify("secreto", hashed)  # las iteraciones se leen del hash
+    assert pbkdf2.needs_rehash(hashed)
+
+
+def test_pbkdf2_legacy_format(pbkdf2):
+    salt = bytes(range(32))
+    legacy = f"{salt.hex()}${Pbkdf2Scheme._derive('secreto', salt, 500).hex()}"
+    assert pbkdf2.identify(legacy)
+    assert pbkdf2.verify("secreto", legacy)
+    assert pbkdf2.needs_rehash(legacy)
+    assert not Pbkdf2Scheme(iterations=ITERATIONS).verify("secreto", legacy)
+
+
+def test_registry_dispatches_by_prefix(pbkdf2, argon2):
+    registry = PasswordHasherRegistry([argon2, pbkdf2], default=argon2)
+    argon_hash = registry.hash("secreto")
+    pbkdf2_hash = pbkdf2.hash("secreto")
+
+    assert registry.identify(argon_hash) is argon2
+    assert registry.identify(pbkdf2_hash) is pbkdf2
+    assert registry.verify("secreto", argon_hash)
+    assert registry.verify("secreto", pbkdf2_hash)
+    assert not registry.verify("otro", pbkdf2_hash)
+
+
+def test_registry_needs_rehash_when_not_default(pbkdf2, argon2):
+    registry = PasswordHasherRegistry([argon2, pbkdf2], default=argon2)
+    assert registry.needs_rehash(pbkdf2.hash("secreto"))
+    assert not registry.needs_rehash(registry.hash("secreto"))
+    stronger = Argon2Scheme(time_cost=2, memory_cost=1024, parallelism=1).hash("secreto")
+    assert registry.needs_rehash(stronger)
+
+
+def test_registry_unknown_format(pbkdf2):
+    registry = PasswordHasherRegistry([pbkdf2], default=pbkdf2)
+    assert registry.identify("") is None
+    assert registry.identify("$unknown$abc") is None
+    assert not registry.verify("secreto", "$unknown$abc")
+    assert registry.needs_rehash("$unknown$abc")
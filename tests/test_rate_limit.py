@@ -0,0 +1,110 @@
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import (
+    BucketPolicy,
+    LoginRateLimiter,
+    MemoryTokenBucketStore,
+    RateLimitExceededError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_rejects(clock):
+    store = MemoryTokenBucketStore()
+    policy = BucketPolicy(burst=3, per_minute=6)  # 1 token cada 10 s
+    for _ in range(3):
+        assert await store.take("k", policy) == (True, 0.0)
+    allowed, retry_after = await store.take("k", policy)
+    assert not allowed
+    assert retry_after == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_at_rate_up_to_burst(clock):
+    store = MemoryTokenBucketStore()
+    policy = BucketPolicy(burst=2, per_minute=6)
+    await store.take("k", policy)
+    await store.take("k", policy)
+
+    clock.now += 5  # medio token
+    allowed, retry_after = await store.take("k", policy)
+    assert not allowed
+    assert retry_after == pytest.approx(5.0)
+
+    clock.now += 5
+    assert (await store.take("k", policy))[0]
+
+    clock.now += 3600  # la recarga se corta en burst
+    assert (await store.take("k", policy))[0]
+    assert (await store.take("k", policy))[0]
+    assert not (await store.take("k", policy))[0]
+
+
+@pytest.mark.asyncio
+async def test_bucket_keys_are_independent_and_bounded(clock):
+    store = MemoryTokenBucketStore(max_keys=2)
+    policy = BucketPolicy(burst=1, per_minute=1)
+    assert (await store.take("a", policy))[0]
+    assert not (await store.take("a", policy))[0]
+    assert (await store.take("b", policy))[0]
+    assert (await store.take("c", policy))[0]
+    assert len(store._buckets) == 2
+    # "a" fue desalojada (LRU): vuelve con el bucket lleno
+    assert (await store.take("a", policy))[0]
+
+
+def test_retry_after_is_rounded_up_to_whole_seconds():
+    assert RateLimitExceededError(0.2, "ip").retry_after == 1
+    assert RateLimitExceededError(4.1, "ip").retry_after == 5
+
+
+@pytest.mark.asyncio
+async def test_login_limiter_scopes(clock):
+    limiter = LoginRateLimiter(
+        MemoryTokenBucketStore(),
+        ip_policy=BucketPolicy(burst=3, per_minute=60),
+        username_policy=BucketPolicy(burst=1, per_minute=60),
+    )
+    await limiter.check("1.1.1.1", "Ana")
+    with pytest.raises(RateLimitExceededError) as exc:
+        await limiter.check("1.1.1.1", " ana ")  # mismo username normalizado
+    assert exc.value.scope == "username"
+    await limiter.check("1.1.1.1", "luis")
+    with pytest.raises(RateLimitExceededError) as exc:
+        await limiter.check("1.1.1.1", "maria")
+    assert exc.value.scope == "ip"
+    assert limiter.stats()["rejected"] == {"ip": 1, "username": 1, "concurrency": 0}
+
+
+@pytest.mark.asyncio
+async def test_login_guard_limits_concurrency(clock):
+    limiter = LoginRateLimiter(
+        MemoryTokenBucketStore(),
+        ip_policy=BucketPolicy(burst=10, per_minute=60),
+        username_policy=BucketPolicy(burst=10, per_minute=60),
+        max_concurrent_per_username=1,
+    )
+    async with limiter.guard("1.1.1.1", "ana"):
+        with pytest.raises(RateLimitExceededError) as exc:
+            async with limiter.guard("2.2.2.2", "ana"):
+                pass
+        assert exc.value.scope == "concurrency"
+    async with limiter.guard("1.1.1.1", "ana"):
+        pass
+    assert limiter.stats()["in_flight_usernames"] == 0
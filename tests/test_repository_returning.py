@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+import pytest
+
+from app.modules.coin.domain.enums import Currency
+from app.modules.transactions.domain.enums import BankCountry
+from app.modules.transactions.infrastructure.bank_repository import SQLAlchemyBankRepository
+
+
+def _bank_values(**overrides):
+    values = dict(
+        bank=f"Test {uuid4().hex[:8]}", company="Test", currency=Currency.pen, image="t.png", country=BankCountry.pe
+    )
+    values.update(overrides)
+    return values
+
+
+@pytest.mark.asyncio
+async def test_insert_returning_fills_server_defaults(db_session):
+    repo = SQLAlchemyBankRepository(db_session)
+    bank = await repo.insert_returning(_bank_values())
+    assert bank.id is not None
+    assert bank.created_at is not None and bank.updated_at is not None
+    assert bank.deleted is False and bank.enable is True
+    assert await repo.get(bank.id) is bank
+
+
+@pytest.mark.asyncio
+async def test_update_returning_refreshes_loaded_entity(db_session):
+    repo = SQLAlchemyBankRepository(db_session)
+    bank = await repo.insert_returning(_bank_values(company="Antes"))
+
+    updated = await repo.update_returning(bank.id, {"company": "Después"})
+    assert updated is bank  # misma instancia del identity map, ya actualizada
+    assert bank.company == "Después"
+
+
+@pytest.mark.asyncio
+async def test_update_returning_skips_missing_and_deleted(db_session):
+    repo = SQLAlchemyBankRepository(db_session)
+    assert await repo.update_returning(uuid4(), {"company": "X"}) is None
+
+    bank = await repo.insert_returning(_bank_values(deleted=True))
+    assert await repo.update_returning(bank.id, {"company": "X"}) is None
+
+
+@pytest.mark.asyncio
+async def test_update_returning_without_values_reads(db_session):
+    repo = SQLAlchemyBankRepository(db_session)
+    bank = await repo.insert_returning(_bank_values())
+    assert await repo.update_returning(bank.id, {}) is bank
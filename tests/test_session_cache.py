@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.cache import InvalidationBus, MemoryCacheBackend, configure_cache_backend
+from app.modules.auth.infrastructure import session_cache
+from app.modules.auth.infrastructure.session_cache import (
+    TokenSessionCache,
+    discard_pending_revocations,
+    get_token_session_cache,
+    revoke_pending_sessions,
+    revoke_sessions_around_commit,
+)
+
+USER = {"user_id": "u1", "username": "ana"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(session_cache.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+def test_hit_and_ttl(clock):
+    cache = TokenSessionCache(ttl_seconds=60)
+    cache.set("tok", uuid4(), USER, expires_at=None)
+    assert cache.get("tok") == USER
+    clock.now += 61
+    assert cache.get("tok") is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_token_expiry_is_checked_in_memory(clock):
+    cache = TokenSessionCache()
+    cache.set("tok", uuid4(), USER, expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    assert cache.get("tok") is None
+
+
+def test_invalidate_auth_drops_all_its_tokens(clock):
+    cache = TokenSessionCache()
+    auth_id, other = uuid4(), uuid4()
+    cache.set("a", auth_id, USER, None)
+    cache.set("b", auth_id, USER, None)
+    cache.set("c", other, USER, None)
+    cache.invalidate_auth(auth_id)
+    assert cache.get("a") is None and cache.get("b") is None
+    assert cache.get("c") == USER
+
+
+def test_bounded_lru(clock):
+    cache = TokenSessionCache(max_entries=2)
+    for token in ("a", "b"):
+        cache.set(token, uuid4(), USER, None)
+    cache.get("a")
+    cache.set("c", uuid4(), USER, None)
+    assert cache.get("b") is None
+    assert cache.get("a") == USER and cache.get("c") == USER
+
+
+@pytest.mark.asyncio
+async def test_revocation_repeated_after_commit(clock):
+    configure_cache_backend(MemoryCacheBackend(), InvalidationBus())
+    cache = get_token_session_cache()
+    auth_id = uuid4()
+    session = SimpleNamespace(info={})
+
+    cache.set("old", auth_id, USER, None)
+    await revoke_sessions_around_commit(session, auth_id)
+    assert cache.get("old") is None
+
+    # Un verify_token concurrente vuelve a cachear el token viejo antes del commit
+    cache.set("old", auth_id, USER, None)
+    await revoke_pending_sessions(session)
+    assert cache.get("old") is None
+    assert session.info == {}
+
+
+@pytest.mark.asyncio
+async def test_rollback_discards_pending_revocations(clock):
+    configure_cache_backend(MemoryCacheBackend(), InvalidationBus())
+    session = SimpleNamespace(info={})
+    await revoke_sessions_around_commit(session, uuid4())
+    discard_pending_revocations(session)
+    assert session.info == {}
@@ -0,0 +1,33 @@
+from app.shared.statement_cache import StatementCache, statement_cache
+
+
+def test_builds_once_per_key():
+    cache = StatementCache("tests")
+    calls = []
+
+    def build():
+        calls.append(1)
+        return object()
+
+    first = cache.get_or_build("a", build)
+    assert cache.get_or_build("a", build) is first
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_ratio == 0.5
+
+
+def test_evicts_least_recently_used():
+    cache = StatementCache("tests", max_size=2)
+    cache.get_or_build("a", lambda: "A")
+    cache.get_or_build("b", lambda: "B")
+    cache.get_or_build("a", lambda: "A2")  # "a" pasa a ser la más reciente
+    cache.get_or_build("c", lambda: "C")
+    assert len(cache) == 2
+    assert cache.get_or_build("a", lambda: "A3") == "A"
+    assert cache.get_or_build("b", lambda: "B2") == "B2"
+
+
+def test_named_caches_are_shared():
+    assert statement_cache("tests:shared") is statement_cache("tests:shared")
+    assert statement_cache("tests:shared") is not statement_cache("tests:other")
+    assert StatementCache("vacío").hit_ratio == 0.0
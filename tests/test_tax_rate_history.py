@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.db.configuration_hour import local_now
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRateHistory
+from app.modules.coin.infrastructure.repository import SQLAlchemyTaxRateRepository
+
+T1 = datetime(2001, 5, 1, tzinfo=timezone.utc)
+T2 = datetime(2001, 5, 10, tzinfo=timezone.utc)
+T3 = datetime(2001, 5, 20, tzinfo=timezone.utc)
+
+
+async def _segment(session, tax_rate_id, coin_a, coin_b, tax, valid_from, valid_to=None):
+    session.add(TaxRateHistory(
+        tax_rate_id=tax_rate_id, coin_a=coin_a, coin_b=coin_b, tax=tax, valid_from=valid_from, valid_to=valid_to
+    ))
+    await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_rate_at_segment_boundaries(db_session, catalog):
+    repo = SQLAlchemyTaxRateRepository(db_session)
+    pair = (Currency.usd, Currency.brl)
+    await _segment(db_session, catalog.tax_rate.id, *pair, 5.0, T1, T2)
+    await _segment(db_session, catalog.tax_rate.id, *pair, 5.5, T2, T3)
+
+    async def tax_at(at):
+        rate = await repo.rate_at(*pair, at)
+        return None if rate is None else float(rate.tax)
+
+    assert await tax_at(T1 - timedelta(microseconds=1)) is None
+    assert await tax_at(T1) == 5.0  # valid_from incluido
+    assert await tax_at(T2 - timedelta(microseconds=1)) == 5.0
+    assert await tax_at(T2) == 5.5  # valid_to excluido
+    assert await tax_at(T3) is None  # tramo cerrado sin sucesor (tasa eliminada)
+    assert await repo.rate_at(Currency.brl, Currency.usd, T2) is None  # el par tiene sentido
+
+
+@pytest.mark.asyncio
+async def test_record_history_closes_and_opens_contiguous_segments(db_session, catalog):
+    repo = SQLAlchemyTaxRateRepository(db_session)
+    catalog.tax_rate.tax = 1.75
+    await db_session.flush()
+    await repo.record_history([catalog.tax_rate.id])
+
+    result = await db_session.execute(
+        select(TaxRateHistory)
+        .where(TaxRateHistory.tax_rate_id == catalog.tax_rate.id)
+        .order_by(TaxRateHistory.valid_to.nulls_last())
+    )
+    closed, current = result.scalars().all()
+    assert closed.valid_to == current.valid_from
+    assert current.valid_to is None and float(current.tax) == 1.75
+
+    now = (await db_session.execute(select(local_now()))).scalar_one()
+    assert float((await repo.rate_at(Currency.pen, Currency.brl, now)).tax) == 1.75
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.pagination.cursor import CursorParams
+from app.modules.coin.domain.enums import Currency
+from app.modules.coin.domain.models import TaxRate
+from app.modules.transactions.application.schemas import TransactionListFilter
+from app.modules.transactions.application.use_cases import ListTransactionsUseCase
+from app.modules.transactions.domain.enums import TransactionStatus
+from app.modules.transactions.infrastructure.repository import SQLAlchemyTransactionRepository
+
+T0 = datetime(2001, 4, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def list_transactions(db_session, catalog):
+    use_case = ListTransactionsUseCase(SQLAlchemyTransactionRepository(db_session))
+
+    async def run(**filters):
+        page = await use_case.execute(
+            TransactionListFilter(user_id=catalog.user.id, **filters), CursorParams(limit=50)
+        )
+        return {item.id for item in page.items}
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_status_and_date_range(list_transactions, make_transaction):
+    early = await make_transaction(created_at=T0)
+    completed = await make_transaction(status=TransactionStatus.completed, created_at=T0 + timedelta(days=1))
+    late = await make_transaction(created_at=T0 + timedelta(days=2))
+
+    assert await list_transactions() == {early.id, completed.id, late.id}
+    assert await list_transactions(status=TransactionStatus.completed) == {completed.id}
+    # [date_from, date_to): date_to excluye la fila que empieza justo ahí
+    assert await list_transactions(date_from=T0, date_to=T0 + timedelta(days=2)) == {early.id, completed.id}
+    assert await list_transactions(date_from=T0 + timedelta(days=1)) == {completed.id, late.id}
+
+
+@pytest.mark.asyncio
+async def test_currency_pair(db_session, list_transactions, make_transaction):
+    usd_pen = TaxRate(coin_a=Currency.usd, coin_b=Currency.pen, tax=3.7)
+    db_session.add(usd_pen)
+    await db_session.flush()
+    pen_brl = await make_transaction(created_at=T0)
+    usd = await make_transaction(created_at=T0, tax_rate_id=usd_pen.id)
+
+    assert await list_transactions(coin_a=Currency.pen, coin_b=Currency.brl) == {pen_brl.id}
+    assert await list_transactions(coin_a=Currency.usd) == {usd.id}
+    assert await list_transactions(coin_b=Currency.pen) == {usd.id}
+    assert await list_transactions(coin_a=Currency.brl, coin_b=Currency.usd) == set()
+
+
+@pytest.mark.asyncio
+async def test_rejects_inverted_range(list_transactions):
+    with pytest.raises(ValueError):
+        await list_transactions(date_from=T0 + timedelta(days=1), date_to=T0)